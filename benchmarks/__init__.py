@@ -0,0 +1,6 @@
+"""
+Benchmark suite for dataops: seeded data generators (generators), timed
+scenarios (scenarios) and a runner with baseline comparison (run).
+
+    python -m benchmarks.run --size small
+"""
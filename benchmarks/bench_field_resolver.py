@@ -0,0 +1,58 @@
+"""
+Compares per-row find_best_match scans with the compiled FieldResolver plan.
+
+Usage:
+    python -m benchmarks.bench_field_resolver --rows 1000000 --keys 50
+"""
+import argparse
+import time
+
+from dataops.converters.json_to_excel import FieldResolver, find_best_match
+
+from .generators import flattened_rows
+
+
+def run_find_best_match(rows, fields):
+    out = []
+    for flat_obj in rows:
+        row = {}
+        for json_field, excel_header in fields.items():
+            val = find_best_match(flat_obj, json_field)
+            if val is not None:
+                row[excel_header] = val
+        out.append(row)
+    return out
+
+
+def run_resolver(rows, fields):
+    resolver = FieldResolver(fields)
+    return [resolver.resolve(flat_obj) for flat_obj in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--keys", type=int, default=50)
+    parser.add_argument("--fields", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = flattened_rows(args.rows, args.keys)
+    fields = {f"field{i}": f"col{i}" for i in range(0, args.keys, max(1, args.keys // args.fields))}
+
+    start = time.perf_counter()
+    baseline = run_find_best_match(rows, fields)
+    baseline_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compiled = run_resolver(rows, fields)
+    compiled_s = time.perf_counter() - start
+
+    assert baseline == compiled, "FieldResolver output differs from find_best_match"
+    print(f"rows={args.rows} keys={args.keys} fields={len(fields)}")
+    print(f"find_best_match: {baseline_s:.2f}s ({args.rows / baseline_s:,.0f} rows/s)")
+    print(f"FieldResolver:   {compiled_s:.2f}s ({args.rows / compiled_s:,.0f} rows/s)")
+    print(f"speedup:         {baseline_s / compiled_s:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Measures CLI startup latency: importing dataops.cli and running `dataops --help`.
+
+Each scenario runs in a fresh interpreter; the median wall time is reported.
+Exits with status 1 if a median exceeds --max-ms, or if pandas, numpy or
+openpyxl were imported, so it can guard startup as commands are added.
+
+Usage:
+    python benchmarks/bench_import_time.py --runs 20 --max-ms 300
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow")
+
+SCENARIOS = {
+    "python": "pass",
+    "import dataops.cli": "import dataops.cli",
+    "dataops --help": (
+        "from dataops.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    ),
+}
+
+CHECK = "\nimport sys\nprint(','.join(m for m in {heavy!r} if m in sys.modules), file=sys.stderr)"
+
+
+def run_once(code: str):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code + CHECK.format(heavy=HEAVY_MODULES)],
+                            capture_output=True, text=True, check=True)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    lines = result.stderr.splitlines()
+    loaded = [m for m in lines[-1].split(",") if m] if lines else []
+    return elapsed_ms, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail if a dataops scenario's median exceeds this many milliseconds.")
+    args = parser.parse_args()
+
+    failed = False
+    for name, code in SCENARIOS.items():
+        timings, heavy = [], set()
+        for _ in range(args.runs):
+            elapsed_ms, loaded = run_once(code)
+            timings.append(elapsed_ms)
+            heavy.update(loaded)
+        median = statistics.median(timings)
+        print(f"{name:<20} median {median:7.1f} ms  min {min(timings):7.1f} ms"
+              + (f"  heavy imports: {', '.join(sorted(heavy))}" if heavy else ""))
+        if name != "python" and (heavy or (args.max_ms is not None and median > args.max_ms)):
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
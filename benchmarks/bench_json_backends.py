@@ -0,0 +1,48 @@
+"""
+Compares JSON backends on the csv-to-json path, indented and compact.
+
+A generated CSV (with missing values) is converted once per installed
+backend and indent; wall time, throughput and output size are reported.
+Documents are equal across backends up to float notation (orjson writes
+0.00006 where the standard library writes 6e-05).
+
+Usage:
+    python -m benchmarks.bench_json_backends --rows 1000000
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from dataops.converters import convert_csv_to_json
+from dataops.utils.json_backend import available_backends
+
+from .generators import numeric_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunksize", type=int, help="Also stream in chunks of N rows.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "input.csv")
+        numeric_csv(csv_path, args.rows)
+        print(f"rows={args.rows} chunksize={args.chunksize} backends={','.join(available_backends())}")
+
+        for indent in (4, None):
+            for backend in available_backends():
+                json_path = os.path.join(tmp, f"{backend}-{indent}.json")
+                start = time.perf_counter()
+                convert_csv_to_json(csv_path, json_path, chunksize=args.chunksize, indent=indent, backend=backend)
+                elapsed = time.perf_counter() - start
+                size = os.path.getsize(json_path)
+                label = "compact" if indent is None else f"indent={indent}"
+                print(f"{backend:7} {label:9} {elapsed:6.2f}s ({args.rows / elapsed:,.0f} rows/s) "
+                      f"{size / 1e6:,.1f}MB")
+                os.remove(json_path)
+
+
+if __name__ == "__main__":
+    main()
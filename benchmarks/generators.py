@@ -0,0 +1,143 @@
+"""
+Seeded synthetic data for the benchmark suite.
+
+Every generator is deterministic for a given seed, so runs on the same
+machine compare like with like.
+"""
+import random
+import string
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _word(rng: random.Random, length: int = 8) -> str:
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def nested_source(rng: random.Random, width: int = 20, depth: int = 3) -> Dict[str, Any]:
+    """An Elasticsearch-like '_source' document: 'width' fields, every fifth one a nested object."""
+    doc = {}
+    for i in range(width):
+        if depth > 1 and i % 5 == 4:
+            doc[f"group{i}"] = nested_source(rng, max(2, width // 2), depth - 1)
+        elif i % 3 == 0:
+            doc[f"field{i}"] = rng.randint(0, 1_000_000)
+        elif i % 3 == 1:
+            doc[f"field{i}"] = _word(rng)
+        else:
+            doc[f"field{i}"] = rng.random() * 1000
+    doc["pin"] = f"{rng.randint(0, 9999):04d}"
+    return doc
+
+
+def es_search_response(n_hits: int, width: int = 20, depth: int = 3, n_buckets: int = 100,
+                       seed: int = 0) -> Dict[str, Any]:
+    """An Elasticsearch search response: 'n_hits' nested hits plus a terms aggregation."""
+    rng = random.Random(seed)
+    hits = [{"_index": "events", "_id": str(i), "_score": 1.0, "_source": nested_source(rng, width, depth)}
+            for i in range(n_hits)]
+    buckets = [{"key": f"{i:04d}", "doc_count": rng.randint(1, 1000)} for i in range(n_buckets)]
+    return {
+        "took": 12,
+        "timed_out": False,
+        "hits": {"total": {"value": n_hits, "relation": "eq"}, "hits": hits},
+        "aggregations": {"by_pin": {"buckets": buckets}},
+    }
+
+
+def es_multi_shard_dump(n_shards: int, hits_per_shard: int = 20, seed: int = 0) -> Dict[str, Any]:
+    """
+    A wide dump of many shard responses with mixed lists (scalars, nested lists
+    and objects), which makes the search for lists of objects walk deep.
+    """
+    rng = random.Random(seed)
+    shards = {}
+    for shard in range(n_shards):
+        shards[f"shard{shard}"] = {
+            "hits": [{"id": f"{shard}-{i}", "value": rng.randint(0, 100)} for i in range(hits_per_shard)],
+            "tags": [_word(rng, 4), rng.randint(0, 9), [{"nested": rng.random()}]],
+            "meta": {"node": _word(rng), "timings": [rng.random() for _ in range(5)]},
+        }
+    return {"shards": shards}
+
+
+def es_nested_aggregations(n_hits: int, depth: int = 4, fanout: int = 4, seed: int = 0) -> Dict[str, Any]:
+    """
+    A search response with 'n_hits' hits and a 'depth'-level nested terms
+    aggregation: every bucket holds 'fanout' sub-buckets and, below the top
+    level, a mixed 'top' list of scores and nested hits.
+    """
+    rng = random.Random(seed)
+
+    def buckets(level: int) -> List[Dict[str, Any]]:
+        result = []
+        for i in range(fanout):
+            bucket = {"key": _word(rng, 4), "doc_count": rng.randint(1, 1000)}
+            if level < depth:
+                bucket[f"level{level + 1}"] = {"buckets": buckets(level + 1)}
+                bucket["top"] = [rng.random(), [{"_id": str(i), "score": rng.random()}]]
+            result.append(bucket)
+        return result
+
+    response = es_search_response(n_hits, seed=seed)
+    response["aggregations"] = {"level1": {"buckets": buckets(1)}}
+    return response
+
+
+def flattened_rows(n_rows: int, n_keys: int = 50, seed: int = 0) -> List[Dict[str, Any]]:
+    """Flattened rows with long prefixed keys, as produced from ES hits ('_source_group0_field0')."""
+    rng = random.Random(seed)
+    keys = [f"_source_group{i % 5}_field{i}" for i in range(n_keys)]
+    return [{key: rng.randint(0, 1000) for key in keys} for _ in range(n_rows)]
+
+
+def skewed_join_inputs(left_path: str, right_path: str, n_rows: int, n_keys: int, skew: float = 1.2,
+                       seed: int = 0) -> Tuple[str, str]:
+    """
+    Writes a fact CSV whose join keys follow a Zipf-like distribution (a few
+    hot keys, a long tail) and a dimension CSV with one row per key.
+    """
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, n_keys + 1) ** skew
+    keys = rng.choice(n_keys, size=n_rows, p=weights / weights.sum())
+    pd.DataFrame({
+        "id": keys,
+        "amount": rng.integers(1, 10_000, n_rows),
+        "ts": rng.integers(1_600_000_000, 1_700_000_000, n_rows),
+        "note": rng.choice(["ok", "late", "refund", "void"], n_rows),
+    }).to_csv(left_path, index=False)
+    pd.DataFrame({
+        "id": np.arange(n_keys),
+        "name": [f"customer{i}" for i in range(n_keys)],
+        "region": rng.choice(["eu", "us", "apac"], n_keys),
+    }).to_csv(right_path, index=False)
+    return left_path, right_path
+
+
+def duplicate_heavy_csv(path: str, n_rows: int, duplicate_ratio: float = 0.5, n_cols: int = 6,
+                        seed: int = 0) -> str:
+    """Writes a CSV where about 'duplicate_ratio' of the rows repeat earlier rows, with some missing values."""
+    rng = np.random.default_rng(seed)
+    n_unique = max(1, int(n_rows * (1 - duplicate_ratio)))
+    unique = pd.DataFrame({f"col{i}": rng.integers(0, 1_000_000, n_unique).astype(str) for i in range(n_cols)})
+    unique.iloc[rng.random(n_unique) < 0.02, 0] = None
+    rows = pd.concat([unique, unique.iloc[rng.integers(0, n_unique, n_rows - n_unique)]], ignore_index=True)
+    rows.iloc[rng.permutation(n_rows)].to_csv(path, index=False)
+    return path
+
+
+def numeric_csv(path: str, n_rows: int, seed: int = 0) -> str:
+    """Writes a mixed-type CSV (ints, strings, floats with missing values, booleans)."""
+    rng = np.random.default_rng(seed)
+    score = rng.random(n_rows) * 100
+    score[rng.random(n_rows) < 0.05] = np.nan
+    pd.DataFrame({
+        "id": np.arange(n_rows),
+        "name": [f"user{i}" for i in range(n_rows)],
+        "city": rng.choice(["Paris", "Dhaka", "Lima", "Oslo"], n_rows),
+        "score": score,
+        "active": rng.random(n_rows) < 0.5,
+    }).to_csv(path, index=False)
+    return path
@@ -0,0 +1,164 @@
+"""
+Runs the benchmark suite and compares it with a saved baseline.
+
+Each scenario runs in a fresh process (so peak RSS is its own), on data
+generated with a fixed seed; the best of --repeat runs is kept. With a
+baseline, the run fails when a scenario's throughput drops, or its peak RSS
+grows, by more than --threshold. Baselines are machine-specific: record
+them on the box that runs the comparison.
+
+Usage:
+    python -m benchmarks.run --size small --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run --size small --baseline benchmarks/baseline.json --threshold 0.2
+    python -m benchmarks.run --list
+"""
+import argparse
+import fnmatch
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from .scenarios import SCENARIOS, SIZES
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _peak_rss() -> int:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(name: str, size: str, repeat: int) -> Dict:
+    """Runs scenario 'name' 'repeat' times in this process and returns its best time and throughput."""
+    # Log records would go to the console and ./logs and skew the timings
+    previous_level = logging.root.manager.disable
+    logging.disable(logging.CRITICAL)
+    scenario = SCENARIOS[name]
+    try:
+        with tempfile.TemporaryDirectory(prefix="dataops-bench-") as workdir:
+            state = scenario.setup(workdir, scenario.base_rows * SIZES[size])
+            timings = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                rows = scenario.run(state)
+                timings.append(time.perf_counter() - start)
+    finally:
+        logging.disable(previous_level)
+    best = min(timings)
+    return {
+        "rows": rows,
+        "seconds": round(best, 6),
+        "rows_per_second": round(rows / best, 1),
+        "peak_rss_bytes": _peak_rss(),
+    }
+
+
+def run_isolated(name: str, size: str, repeat: int) -> Dict:
+    """Runs a scenario in a fresh interpreter."""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(measure, name, size, repeat).result()
+
+
+def compare(results: Dict, baseline: Dict, threshold: float, memory_threshold: float) -> List[str]:
+    """Returns a description of every regression of 'results' against 'baseline'."""
+    regressions = []
+    if baseline.get("size") != results["size"]:
+        return [f"baseline size {baseline.get('size')!r} does not match run size {results['size']!r}"]
+    for name, current in results["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        change = current["rows_per_second"] / previous["rows_per_second"] - 1
+        if change < -threshold:
+            regressions.append(f"{name}: throughput {change:+.1%} ({previous['rows_per_second']:,.0f} -> "
+                               f"{current['rows_per_second']:,.0f} rows/s)")
+        if current.get("peak_rss_bytes") and previous.get("peak_rss_bytes"):
+            growth = current["peak_rss_bytes"] / previous["peak_rss_bytes"] - 1
+            if growth > memory_threshold:
+                regressions.append(f"{name}: peak RSS {growth:+.1%} ({previous['peak_rss_bytes'] / 1e6:,.0f} -> "
+                                   f"{current['peak_rss_bytes'] / 1e6:,.0f} MB)")
+    return regressions
+
+
+def _format_row(name: str, current: Dict, previous: Dict = None) -> str:
+    line = (f"{name:<24} {current['seconds']:>8.3f}s {current['rows_per_second']:>14,.0f} rows/s "
+            f"{(current['peak_rss_bytes'] or 0) / 1e6:>8,.0f} MB")
+    if previous:
+        line += f"  ({current['rows_per_second'] / previous['rows_per_second'] - 1:+.1%} throughput)"
+    return line
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", choices=list(SIZES), default="small")
+    parser.add_argument("--scenario", action="append",
+                        help="Scenario name or glob pattern to run (repeatable; default: all).")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario; the best is kept.")
+    parser.add_argument("--output", help="Save this run's results as JSON.")
+    parser.add_argument("--baseline", help="Baseline JSON to compare with.")
+    parser.add_argument("--save-baseline", help="Save this run as the baseline JSON.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Largest tolerated relative throughput drop (default: 0.2).")
+    parser.add_argument("--memory-threshold", type=float, default=0.2,
+                        help="Largest tolerated relative peak RSS growth (default: 0.2).")
+    parser.add_argument("--list", action="store_true", help="List the scenarios and exit.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, scenario in SCENARIOS.items():
+            print(f"{name:<24} {scenario.base_rows:>9,} rows  {scenario.description}")
+        return 0
+
+    patterns = args.scenario or ["*"]
+    names = [name for name in SCENARIOS if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)]
+    if not names:
+        parser.error(f"No scenario matches {patterns}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = {
+        "version": 1,
+        "size": args.size,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": {"python": platform.python_version(), "machine": platform.machine(),
+                     "system": platform.system(), "cpus": os.cpu_count()},
+        "scenarios": {},
+    }
+    for name in names:
+        current = run_isolated(name, args.size, args.repeat)
+        results["scenarios"][name] = current
+        previous = baseline["scenarios"].get(name) if baseline else None
+        print(_format_row(name, current, previous), flush=True)
+
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+        print(f"Saved results to {path}")
+
+    if baseline:
+        regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} throughput / {args.memory_threshold:.0%} memory.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
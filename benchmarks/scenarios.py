@@ -0,0 +1,185 @@
+"""
+Benchmark scenarios: each prepares its data (untimed) and then runs one
+operation, returning the number of rows or objects it processed.
+
+Sizes scale every scenario's base row count: small x1, medium x10, large x100.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, NamedTuple
+
+from . import generators
+
+SIZES = {"small": 1, "medium": 10, "large": 100}
+
+
+class Scenario(NamedTuple):
+    description: str
+    base_rows: int
+    setup: Callable[[str, int], Any]
+    run: Callable[[Any], int]
+
+
+SCENARIOS: Dict[str, Scenario] = {}
+
+
+def scenario(name: str, description: str, base_rows: int, setup: Callable[[str, int], Any]):
+    """Registers the decorated function as the timed part of scenario 'name'."""
+    def register(run: Callable[[Any], int]):
+        SCENARIOS[name] = Scenario(description, base_rows, setup, run)
+        return run
+    return register
+
+
+# JSON: flattening, list discovery and field matching
+
+def _hits(workdir: str, rows: int):
+    return generators.es_search_response(rows)["hits"]["hits"]
+
+
+@scenario("flatten_dict", "Flatten wide, 3-level nested ES hits", 20_000, _hits)
+def _flatten(hits) -> int:
+    from dataops.converters.json_to_excel import flatten_dict
+    for hit in hits:
+        flatten_dict(hit)
+    return len(hits)
+
+
+def _shard_dump(workdir: str, rows: int):
+    return generators.es_multi_shard_dump(rows // 20)
+
+
+@scenario("find_lists_of_objects", "Find object lists in a wide dump with mixed lists", 100_000, _shard_dump)
+def _find_lists(dump) -> int:
+    from dataops.converters.json_to_excel import find_lists_of_objects
+    return sum(len(objects) for _, objects in find_lists_of_objects(dump))
+
+
+def _nested_aggregations(workdir: str, rows: int):
+    return generators.es_nested_aggregations(rows, depth=6)
+
+
+@scenario("find_bucket_lists", "Find only the bucket lists of a 6-level aggregation next to many hits", 20_000,
+          _nested_aggregations)
+def _find_bucket_lists(response) -> int:
+    from dataops.converters.json_to_excel import find_lists_of_objects
+    assert find_lists_of_objects(response, paths="aggregations_*_buckets")
+    # Counted in hits, the part of the document the filter lets the search skip
+    return len(response["hits"]["hits"])
+
+
+_FIELDS = {f"field{i}": f"col{i}" for i in range(0, 50, 10)}
+
+
+def _flat_rows(workdir: str, rows: int):
+    return generators.flattened_rows(rows)
+
+
+@scenario("find_best_match", "Match 5 suffix fields per row with find_best_match", 50_000, _flat_rows)
+def _find_best_match(rows) -> int:
+    from dataops.converters.json_to_excel import find_best_match
+    for flat_obj in rows:
+        for json_field in _FIELDS:
+            find_best_match(flat_obj, json_field)
+    return len(rows)
+
+
+@scenario("flatten_columns", "Flatten 50-key rows sharing one layout column by column", 50_000, _flat_rows)
+def _flatten_columns(rows) -> int:
+    from dataops.converters.json_to_excel import ColumnarBuilder, Flattener
+    builder = ColumnarBuilder()
+    builder.extend(Flattener().flatten_columns(rows), len(rows))
+    return len(rows)
+
+
+@scenario("field_resolver", "Match 5 suffix fields per row with a compiled FieldResolver", 50_000, _flat_rows)
+def _field_resolver(rows) -> int:
+    from dataops.converters.json_to_excel import FieldResolver
+    resolver = FieldResolver(_FIELDS)
+    for flat_obj in rows:
+        resolver.resolve(flat_obj)
+    return len(rows)
+
+
+def _es_file(workdir: str, rows: int):
+    path = os.path.join(workdir, "search.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(generators.es_search_response(rows), f)
+    return path, os.path.join(workdir, "search.xlsx"), rows
+
+
+@scenario("json_to_excel", "Convert an ES search response to Excel, mapping 4 fields", 5_000, _es_file)
+def _json_to_excel(paths) -> int:
+    from dataops.converters import convert_json_to_excel
+    input_path, output_path, rows = paths
+    convert_json_to_excel(input_path, output_path, fields={"_id": "id", "pin": "pin", "field0": "f0", "field1": "f1"})
+    return rows
+
+
+# CSV: conversion, joins, concatenation and validation
+
+def _numeric_csv(workdir: str, rows: int):
+    return generators.numeric_csv(os.path.join(workdir, "numeric.csv"), rows), rows
+
+
+@scenario("csv_to_json", "Convert a mixed-type CSV to an indented JSON array", 100_000, _numeric_csv)
+def _csv_to_json(state) -> int:
+    from dataops.converters import convert_csv_to_json
+    path, rows = state
+    convert_csv_to_json(path, path + ".json")
+    return rows
+
+
+def _join_inputs(workdir: str, rows: int):
+    left, right = generators.skewed_join_inputs(os.path.join(workdir, "facts.csv"),
+                                                os.path.join(workdir, "customers.csv"), rows, max(100, rows // 20))
+    return left, right, os.path.join(workdir, "joined.csv"), rows
+
+
+@scenario("merge_join", "Inner join of Zipf-skewed facts with a dimension table", 200_000, _join_inputs)
+def _merge_join(state) -> int:
+    from dataops.merger import merge_csv_files
+    left, right, output, rows = state
+    merge_csv_files([left, right], output, join_on=["id"])
+    return rows
+
+
+@scenario("merge_join_out_of_core", "The same join, hash-partitioned within 16MB", 200_000, _join_inputs)
+def _merge_join_out_of_core(state) -> int:
+    from dataops.merger import merge_csv_files
+    left, right, output, rows = state
+    merge_csv_files([left, right], output, join_on=["id"], memory_limit="16MB")
+    return rows
+
+
+def _shards(workdir: str, rows: int):
+    paths = [generators.numeric_csv(os.path.join(workdir, f"part{i}.csv"), rows // 4, seed=i) for i in range(4)]
+    return paths, os.path.join(workdir, "all.csv"), rows // 4 * 4
+
+
+@scenario("merge_concat", "Stream-concatenate 4 CSV shards", 200_000, _shards)
+def _merge_concat(state) -> int:
+    from dataops.merger import merge_csv_files
+    paths, output, rows = state
+    merge_csv_files(paths, output, chunksize=50_000)
+    return rows
+
+
+def _duplicates_csv(workdir: str, rows: int):
+    return generators.duplicate_heavy_csv(os.path.join(workdir, "duplicates.csv"), rows), rows
+
+
+@scenario("validate_exact", "Stream-validate a duplicate-heavy CSV with exact row hashes", 200_000, _duplicates_csv)
+def _validate_exact(state) -> int:
+    from dataops.validator import validate_csv_data
+    path, rows = state
+    validate_csv_data(path, chunksize=50_000)
+    return rows
+
+
+@scenario("validate_approx", "The same validation with HyperLogLog duplicate estimates", 200_000, _duplicates_csv)
+def _validate_approx(state) -> int:
+    from dataops.validator import validate_csv_data
+    path, rows = state
+    validate_csv_data(path, chunksize=50_000, duplicates="approx")
+    return rows
@@ -13,6 +13,10 @@ setup(
         "click",
     ],
     extras_require={
+        "parquet": ["pyarrow>=10.0.0"],
+        "yaml": ["pyyaml"],
+        "zstd": ["zstandard"],
+        "json": ["orjson"],
         "dev": [
             "pytest",
             "black",
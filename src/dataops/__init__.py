@@ -1 +1,27 @@
 # DataOps Toolkit Package
+import importlib
+
+# Public functions are imported on first access (PEP 562) so that importing
+# the package, e.g. for the CLI, does not pull in pandas.
+_EXPORTS = {
+    "convert_csv_to_json": ".converters",
+    "convert_json_to_excel": ".converters",
+    "merge_csv_files": ".merger",
+    "validate_csv_data": ".validator",
+    "Pipeline": ".pipeline",
+    "run_pipeline": ".pipeline",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,216 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from .utils.compression import expand_inputs
+from .utils.helpers import strip_compression_suffix
+from .utils.logger import configure_logging, logging_overrides, setup_logger
+from .utils.manifest import Manifest, fingerprint, is_unchanged, options_key
+
+logger = setup_logger(__name__)
+
+# Seconds between manifest saves while a batch runs
+MANIFEST_SAVE_INTERVAL = 5.0
+
+# Output file suffix per batch command (validate reports are only written with an output directory)
+BATCH_COMMANDS = {
+    "csv_to_json": ".json",
+    "json_to_excel": ".xlsx",
+    "validate": ".report.json",
+}
+
+
+def batch_outputs(input_files: List[str], out_dir: str, suffix: str) -> List[str]:
+    """
+    Maps each input file to '<out_dir>/<relative dir>/<name><suffix>', keeping
+    the inputs' layout below their common directory so names cannot clash.
+    """
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(f)) for f in input_files])
+    outputs = []
+    for file in input_files:
+        relative = os.path.relpath(os.path.abspath(strip_compression_suffix(file)), base)
+        outputs.append(os.path.join(out_dir, str(Path(relative).with_suffix(suffix))))
+    return outputs
+
+
+def _init_worker(command: str, log_settings: Dict):
+    """Applies the parent's logging settings and imports the command's implementation (and pandas)."""
+    if log_settings:
+        configure_logging(**log_settings)
+    if command == "validate":
+        from .validator import validate_csv_data  # noqa: F401
+    else:
+        from . import converters  # noqa: F401
+
+
+def _run_file(command: str, input_path: str, output_path: str, options: Dict) -> Dict:
+    """Runs one command on one file, returning its outcome instead of raising."""
+    start = time.perf_counter()
+    result = {"input": input_path, "output": output_path, "ok": True}
+    try:
+        if output_path:
+            Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        if command == "csv_to_json":
+            from .converters import convert_csv_to_json
+            convert_csv_to_json(input_path, output_path, **options)
+        elif command == "json_to_excel":
+            from .converters import convert_json_to_excel
+            convert_json_to_excel(input_path, output_path, **options)
+        else:
+            from .utils.file_io import save_json
+            from .validator import validate_csv_data
+            result["report"] = validate_csv_data(input_path, **options)
+            if output_path:
+                save_json(result["report"], output_path)
+    except Exception as e:
+        result.update(ok=False, error=f"{type(e).__name__}: {e}")
+    result["seconds"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def _run_files(command: str, files: List[str], outputs: List[str], options: Dict) -> List[Dict]:
+    """Runs one command on several files in a worker, so small files are handed out in batches."""
+    return [_run_file(command, file, output, options) for file, output in zip(files, outputs)]
+
+
+def _is_done(manifest: Manifest, key: str, input_path: str, output_path: str, options: str) -> bool:
+    entry = manifest.get(key)
+    return bool(entry and entry["options"] == options and entry["output"] == output_path
+                and (output_path is None or os.path.exists(output_path)) and is_unchanged(input_path, entry["input"]))
+
+
+def _manifest_key(command: str, input_path: str) -> str:
+    return f"batch:{command}:{os.path.abspath(input_path)}"
+
+
+def _skip_unchanged(manifest: Manifest, command: str, input_files: List[str], outputs: List[str],
+                    settings: str) -> Dict[str, Dict]:
+    """Returns the results recorded in the manifest for files that need not run again, by input."""
+    skipped = {}
+    for file, output in zip(input_files, outputs):
+        key = _manifest_key(command, file)
+        if _is_done(manifest, key, file, output, settings):
+            entry = manifest.get(key)
+            skipped[file] = {"input": file, "output": output, "ok": True, "skipped": True, "seconds": 0.0,
+                             **({"report": entry["report"]} if "report" in entry else {})}
+    logger.info("Skipping %s files unchanged since the last run", len(skipped))
+    return skipped
+
+
+def _collect(completed: Iterable[Dict], results: Dict[str, Dict], command: str, manifest: Manifest,
+             fingerprints: Dict[str, Dict], settings: str):
+    """
+    Stores each result by input as it completes and records successful files
+    in the manifest, saving it every MANIFEST_SAVE_INTERVAL seconds.
+    """
+    last_save = time.monotonic()
+    for result in completed:
+        results[result["input"]] = result
+        if manifest is None or not result["ok"]:
+            continue
+        entry = {"input": fingerprints[result["input"]], "output": result["output"], "options": settings}
+        if "report" in result:
+            entry["report"] = result["report"]
+        manifest.set(_manifest_key(command, result["input"]), entry)
+        if time.monotonic() - last_save > MANIFEST_SAVE_INTERVAL:
+            manifest.save()
+            last_save = time.monotonic()
+
+
+def run_batch(command: str, inputs: str, out_dir: str = None, workers: int = None, manifest: str = None,
+              **options) -> List[Dict]:
+    """
+    Runs a command on every file of a directory or glob pattern in a pool
+    of worker processes, so the interpreter and pandas are loaded once per
+    worker rather than once per file. A failing file does not stop the others.
+
+    Args:
+        command (str): "csv_to_json", "json_to_excel" or "validate".
+        inputs (str): Directory or glob pattern of input files ('**' recurses).
+        out_dir (str): Output directory (required except for validate, whose
+                       reports are then only returned).
+        workers (int): Number of worker processes (default: the CPU count);
+                       1 runs the files in this process.
+        manifest (str): Optional manifest file (see utils.manifest) recording
+                        each completed file, so reruns skip files that are
+                        unchanged and whose output still exists.
+        **options: Keyword arguments of the command's function.
+
+    Returns:
+        List[Dict]: One result per input, in input order: 'input', 'output',
+                    'ok', 'seconds', and 'error' or the validation 'report';
+                    files skipped through the manifest have 'skipped'.
+    """
+    if command not in BATCH_COMMANDS:
+        raise ValueError(f"Unsupported batch command: {command} (choose from {', '.join(BATCH_COMMANDS)})")
+    if out_dir is None and command != "validate":
+        raise ValueError("Batch mode needs an output directory.")
+
+    input_files = expand_inputs(inputs)
+    outputs = batch_outputs(input_files, out_dir, BATCH_COMMANDS[command]) if out_dir else [None] * len(input_files)
+    settings = options_key(options)
+    manifest = Manifest(manifest) if manifest else None
+    results = _skip_unchanged(manifest, command, input_files, outputs, settings) if manifest else {}
+    todo = [(file, output) for file, output in zip(input_files, outputs) if file not in results]
+    todo_files = [file for file, _ in todo]
+    todo_outputs = [output for _, output in todo]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo)))
+    logger.info("Running %s on %s files with %s workers", command, len(todo), workers)
+
+    # Taken before the files are read, so a file changing meanwhile is redone next time
+    fingerprints = {file: fingerprint(file) for file in todo_files} if manifest else {}
+    pool = None
+    futures = []
+    try:
+        if workers <= 1:
+            completed = map(partial(_run_file, command, options=options), todo_files, todo_outputs)
+        else:
+            # Small files: hand them out in batches to keep inter-process overhead low
+            chunksize = max(1, len(todo) // (workers * 4))
+            # Spawned workers start without the parent's logging threads and import
+            # pandas up front, so per-file timings only cover the file
+            pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_init_worker, initargs=(command, logging_overrides()))
+            futures = [pool.submit(_run_files, command, todo_files[i:i + chunksize], todo_outputs[i:i + chunksize],
+                                   options) for i in range(0, len(todo), chunksize)]
+            completed = chain.from_iterable(future.result() for future in futures)
+        _collect(completed, results, command, manifest, fingerprints, settings)
+    finally:
+        if pool is not None:
+            # Files not started yet are dropped on error or interrupt
+            for future in futures:
+                future.cancel()
+            pool.shutdown()
+        if manifest:
+            manifest.save()
+    results = [results[file] for file in input_files]
+
+    failed = [result for result in results if not result["ok"]]
+    for result in failed:
+        logger.error("Batch %s failed for %s: %s", command, result["input"], result["error"])
+    logger.info("Batch %s completed: %s succeeded, %s failed.", command, len(results) - len(failed), len(failed))
+    return results
+
+
+def format_summary(results: List[Dict], elapsed: float) -> str:
+    """Formats batch results as one line per file followed by the totals."""
+    lines = []
+    for result in results:
+        status = "SKIP" if result.get("skipped") else "OK" if result["ok"] else "FAILED"
+        target = f" -> {result['output']}" if result["output"] else ""
+        line = f"  {status:<6} {result['seconds']:>8.3f}s  {result['input']}{target}"
+        if not result["ok"]:
+            line += f"  ({result['error']})"
+        elif "report" in result:
+            line += f"  rows={result['report']['total_rows']} duplicates={result['report']['duplicates']}"
+        lines.append(line)
+    failed = sum(not result["ok"] for result in results)
+    skipped = sum(bool(result.get("skipped")) for result in results)
+    lines.append(f"Batch Summary: {len(results) - failed} succeeded, {failed} failed in {elapsed:.2f}s"
+                 + (f" ({skipped} unchanged, skipped)" if skipped else ""))
+    return "\n".join(lines)
@@ -1,36 +1,131 @@
 import click
 import sys
-from .converters import convert_csv_to_json, convert_json_to_excel
-from .merger import merge_csv_files
-from .validator import validate_csv_data
+from .utils.helpers import parse_filter
 from .utils.logger import setup_logger
 
 logger = setup_logger("dataops-cli")
 
+# Commands import their implementation (and pandas/openpyxl) when they run,
+# so `dataops --help` and argument errors stay fast.
+
 @click.group()
-def main():
+@click.option("--cache/--no-cache", default=None,
+              help="Cache parsed CSV inputs on disk (default: the DATAOPS_CACHE environment variable).")
+@click.option("--log-dir", help="Directory for dataops.log (default: $DATAOPS_LOG_DIR, else ./logs).")
+@click.option("--async-logging/--sync-logging", default=None,
+              help="Write logs from a background thread (default: the DATAOPS_LOG_ASYNC environment variable).")
+@click.option("--profile", is_flag=True, help="Print time, rows/s and bytes per stage (read, transform, write...).")
+@click.option("--metrics-json", type=click.Path(dir_okay=False), help="Save the stage metrics as JSON to this file.")
+@click.option("--cprofile", type=click.Path(dir_okay=False), help="Dump cProfile statistics to this file.")
+@click.option("--trace-memory", is_flag=True, help="Add tracemalloc's top allocation sites to the metrics (slow).")
+@click.pass_context
+def main(ctx, cache, log_dir, async_logging, profile, metrics_json, cprofile, trace_memory):
     """DataOps Toolkit: A modular automation framework."""
-    pass
+    if log_dir is not None or async_logging is not None:
+        from .utils.logger import configure_logging
+        configure_logging(log_dir=log_dir, async_mode=async_logging)
+    if profile or metrics_json or cprofile or trace_memory:
+        from .utils.metrics import collect_metrics
+        # Callbacks run in reverse: collection stops before the report is written
+        ctx.call_on_close(lambda: _report_metrics(collector, ctx.invoked_subcommand, profile, metrics_json))
+        collector = ctx.with_resource(collect_metrics(cpu_profile=cprofile, trace_memory=trace_memory))
+    if cache is not None:
+        from .utils.cache import configure_cache
+        configure_cache(enabled=cache)
+
+def _report_metrics(collector, command, profile, metrics_json):
+    metrics = dict(collector.as_dict(), command=command)
+    if metrics_json:
+        import json
+        with open(metrics_json, "w", encoding="utf-8") as f:
+            json.dump(metrics, f, indent=4)
+    if profile:
+        click.echo(collector.summary(), err=True)
+
+def _parse_columns(columns):
+    return [c.strip() for c in columns.split(",")] if columns else None
+
+def _parse_filters(filters):
+    return [parse_filter(f) for f in filters] or None
+
+def _run_batch(command, batch, out_dir, workers, manifest=None, **options):
+    """Runs a command over every file matched by --batch, prints the summary and exits 1 if any file failed."""
+    import time
+    from .batch import format_summary, run_batch
+    start = time.perf_counter()
+    results = run_batch(command, batch, out_dir=out_dir, workers=workers, manifest=manifest, **options)
+    click.echo(format_summary(results, time.perf_counter() - start))
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+def _check_batch_arguments(batch, out_dir, paths, needs_out_dir=True, manifest=None):
+    if manifest and not batch and needs_out_dir:
+        raise click.UsageError("--manifest requires --batch.")
+    if batch:
+        if any(paths):
+            raise click.UsageError("Input/output paths cannot be combined with --batch.")
+        if needs_out_dir and not out_dir:
+            raise click.UsageError("--batch requires --out-dir.")
+    elif not all(paths):
+        raise click.UsageError("Missing input/output paths (or use --batch).")
+
+BATCH_HELP = "Run on every file of a directory or glob pattern (e.g. 'in/*.csv') in a process pool."
+OUT_DIR_HELP = "Output directory for --batch."
+MANIFEST_HELP = "Checkpoint file: skip files unchanged since the last --batch run recorded in it."
+
+SCHEMA_HELP = "Column types: a schema JSON file, or 'auto' to infer them (saved as <input>.schema.json)."
 
 @main.command()
-@click.argument("input_path")
-@click.argument("output_path")
-def csv_to_json(input_path, output_path):
-    """Convert CSV file to JSON."""
+@click.argument("input_path", required=False)
+@click.argument("output_path", required=False)
+@click.option("--batch", help=BATCH_HELP)
+@click.option("--out-dir", help=OUT_DIR_HELP)
+@click.option("--workers", type=int, help="Files converted in parallel with --batch (default: CPU count).")
+@click.option("--manifest", help=MANIFEST_HELP)
+@click.option("--chunksize", type=int, help="Stream the CSV in chunks of N rows to bound memory usage.")
+@click.option("--format", "output_format", type=click.Choice(["array", "ndjson"]), default="array",
+              help="Write a JSON array (default) or newline-delimited JSON.")
+@click.option("--columns", help="Comma-separated list of columns to read (others are never parsed).")
+@click.option("--filter", "filters", multiple=True, help="Row filter such as 'age>=30'; repeat to AND filters.")
+@click.option("--schema", help=SCHEMA_HELP)
+@click.option("--indent", type=int, default=4, show_default=True, help="Spaces per indentation level of the JSON array.")
+@click.option("--compact", is_flag=True, help="Write compact JSON without indentation or spaces.")
+@click.option("--json-backend", type=click.Choice(["auto", "orjson", "ujson", "json"]),
+              help="JSON serializer (default: $DATAOPS_JSON_BACKEND, else the fastest installed).")
+def csv_to_json(input_path, output_path, batch, out_dir, workers, manifest, chunksize, output_format, columns, filters,
+                schema, indent, compact, json_backend):
+    """Convert CSV (or Parquet/Feather) file to JSON."""
+    _check_batch_arguments(batch, out_dir, (input_path, output_path), manifest=manifest)
     try:
-        convert_csv_to_json(input_path, output_path)
+        options = dict(chunksize=chunksize, output_format=output_format, columns=_parse_columns(columns),
+                       filters=_parse_filters(filters), schema=schema, indent=None if compact else indent,
+                       backend=json_backend)
+        if batch:
+            _run_batch("csv_to_json", batch, out_dir, workers, manifest=manifest, **options)
+            return
+        from .converters import convert_csv_to_json
+        convert_csv_to_json(input_path, output_path, **options)
         click.echo(f"Successfully converted {input_path} to {output_path}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 @main.command()
-@click.argument("input_path")
-@click.argument("output_path")
+@click.argument("input_path", required=False)
+@click.argument("output_path", required=False)
+@click.option("--batch", help=BATCH_HELP)
+@click.option("--out-dir", help=OUT_DIR_HELP)
+@click.option("--workers", type=int, help="Files converted in parallel with --batch (default: CPU count).")
+@click.option("--manifest", help=MANIFEST_HELP)
 @click.option("--json-fields", help="Comma-separated list of JSON fields to keep (e.g. 'key,doc_count')")
 @click.option("--output-headers", help="Comma-separated list of Excel headers (e.g. 'id,count')")
-def json_to_excel(input_path, output_path, json_fields, output_headers):
+@click.option("--streaming", is_flag=True, help="Parse the JSON and write the workbook incrementally in bounded memory.")
+@click.option("--schema", help="Output column types: a schema JSON file, or 'auto' to infer compact types.")
+@click.option("--paths", help="Comma-separated patterns of the lists to extract (e.g. 'aggregations_*_buckets').")
+def json_to_excel(input_path, output_path, batch, out_dir, workers, manifest, json_fields, output_headers, streaming,
+                  schema, paths):
     """Convert JSON file to Excel. Optionally filter and rename fields."""
+    _check_batch_arguments(batch, out_dir, (input_path, output_path), manifest=manifest)
     try:
         field_map = None
         
@@ -45,12 +140,21 @@ def json_to_excel(input_path, output_path, json_fields, output_headers):
                 o_headers = j_fields
             
             field_map = dict(zip(j_fields, o_headers))
-            logger.info(f"Field mapping configured: {field_map}")
+            logger.info("Field mapping configured: %s", field_map)
         
         elif output_headers:
             raise ValueError("--output-headers cannot be used without --json-fields.")
+
+        if paths:
+            paths = [p.strip() for p in paths.split(",")]
                 
-        convert_json_to_excel(input_path, output_path, fields=field_map)
+        if batch:
+            _run_batch("json_to_excel", batch, out_dir, workers, manifest=manifest, fields=field_map,
+                       streaming=streaming, schema=schema, paths=paths)
+            return
+        from .converters import convert_json_to_excel
+        convert_json_to_excel(input_path, output_path, fields=field_map, streaming=streaming, schema=schema,
+                              paths=paths)
         click.echo(f"Successfully converted {input_path} to {output_path}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -59,27 +163,56 @@ def json_to_excel(input_path, output_path, json_fields, output_headers):
 @main.command()
 @click.argument("input_files", nargs=-1)
 @click.argument("output_path")
-@click.option("--on", help="Columns to join on. Format: 'col' or 'col1,col2' for left/right.")
+@click.option("--on", help="Columns to join on. Format: 'col', 'col1,col2' for left/right, or one per file for N-way joins.")
 @click.option("--how", default="inner", help="Join type: inner, left, right, outer.")
-def merge(input_files, output_path, on, how):
-    """Merge multiple CSV files. Use --on for joins."""
+@click.option("--chunksize", type=int, help="Stream concatenation in chunks of N rows to bound memory usage.")
+@click.option("--memory-limit", help="Run joins out-of-core within this memory budget (e.g. '2GB').")
+@click.option("--workers", type=int, help="Parse concatenation inputs in parallel with N threads.")
+@click.option("--schema", help=SCHEMA_HELP)
+@click.option("--manifest", help="Checkpoint file: reruns of a CSV concatenation only append new or changed inputs.")
+def merge(input_files, output_path, on, how, chunksize, memory_limit, workers, schema, manifest):
+    """Merge multiple CSV/Parquet/Feather files. Use --on for joins."""
     try:
         join_on = None
         if on:
             join_on = [x.strip() for x in on.split(",")]
-            
-        merge_csv_files(list(input_files), output_path, join_on=join_on, how=how)
+        
+        from .merger import merge_csv_files
+        merge_csv_files(list(input_files), output_path, join_on=join_on, how=how, chunksize=chunksize,
+                        memory_limit=memory_limit, workers=workers, schema=schema, manifest=manifest)
         click.echo(f"Successfully merged files into {output_path}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
 @main.command()
-@click.argument("input_path")
-def validate(input_path):
-    """Validate CSV data."""
+@click.argument("input_path", required=False)
+@click.option("--batch", help=BATCH_HELP)
+@click.option("--out-dir", help="Save a <name>.report.json per file here with --batch.")
+@click.option("--chunksize", type=int, help="Validate in a single streaming pass, N rows at a time.")
+@click.option("--duplicates", type=click.Choice(["exact", "approx"]), default="exact",
+              help="Exact duplicate counting (spills to disk) or an approximate sketch.")
+@click.option("--error-rate", type=float, default=0.01, help="Target relative error for --duplicates approx.")
+@click.option("--workers", type=int,
+              help="Validate byte ranges of the file in N parallel processes (with --batch: N files in parallel).")
+@click.option("--rules", "rules_path", help="YAML/JSON rule schema to check (dtype, min/max, allowed, regex, unique, expr).")
+@click.option("--columns", help="Comma-separated list of columns to read and validate.")
+@click.option("--filter", "filters", multiple=True, help="Row filter such as 'age>=30'; repeat to AND filters.")
+@click.option("--schema", help=SCHEMA_HELP)
+@click.option("--manifest", help="Checkpoint file: reuse the last report, or only read rows appended since "
+                                 "(with --batch: skip unchanged files).")
+def validate(input_path, batch, out_dir, chunksize, duplicates, error_rate, workers, rules_path, columns, filters,
+             schema, manifest):
+    """Validate CSV (or Parquet/Feather) data."""
+    _check_batch_arguments(batch, out_dir, (input_path,), needs_out_dir=False)
     try:
-        report = validate_csv_data(input_path)
+        options = dict(chunksize=chunksize, duplicates=duplicates, error_rate=error_rate, rules=rules_path,
+                       columns=_parse_columns(columns), filters=_parse_filters(filters), schema=schema)
+        if batch:
+            _run_batch("validate", batch, out_dir, workers, manifest=manifest, **options)
+            return
+        from .validator import validate_csv_data
+        report = validate_csv_data(input_path, workers=workers, manifest=manifest, **options)
         click.echo("Validation Report:")
         for key, value in report.items():
             click.echo(f"  {key}: {value}")
@@ -87,5 +220,58 @@ def validate(input_path):
         click.echo(f"Error: {e}", err=True)
         sys.exit(1)
 
+@main.command()
+@click.argument("config_path")
+@click.option("--chunksize", type=int, help="Rows per chunk passed between stages (overrides the pipeline file).")
+def pipeline(config_path, chunksize):
+    """Run a YAML/JSON pipeline of read, merge, validate and write stages in memory."""
+    try:
+        from .pipeline import run_pipeline
+        results = run_pipeline(config_path, chunksize=chunksize)
+        click.echo("Pipeline Results:")
+        for name, result in results.items():
+            click.echo(f"  {name} ({result['step']}): {result.get('rows', 0)} rows")
+            for key, value in result.get("report", {}).items():
+                click.echo(f"    {key}: {value}")
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+@main.command()
+@click.argument("input_path")
+@click.option("--output", help="Where to save the schema (default: <input>.schema.json).")
+@click.option("--sample-rows", type=int, default=100_000, help="Number of leading rows to sample.")
+def infer_schema(input_path, output, sample_rows):
+    """Infer compact column types for a CSV file and save them."""
+    try:
+        from .utils.schema import infer_schema as infer, save_schema, schema_path_for
+        schema = infer(input_path, sample_rows=sample_rows)
+        save_schema(schema, output or schema_path_for(input_path))
+        for column, column_type in schema["columns"].items():
+            click.echo(f"  {column}: {column_type}")
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+@main.group()
+def cache():
+    """Inspect or clear the parse cache."""
+    pass
+
+@cache.command("stat")
+def cache_stat():
+    """Show the cache location, entry count and size."""
+    from .utils.cache import get_cache
+    stats = get_cache(only_enabled=False).stat()
+    for key, value in stats.items():
+        click.echo(f"  {key}: {value}")
+
+@cache.command("clear")
+def cache_clear():
+    """Remove every cached entry."""
+    from .utils.cache import get_cache
+    removed = get_cache(only_enabled=False).clear()
+    click.echo(f"Removed {removed} cache entries")
+
 if __name__ == "__main__":
     main()
@@ -1,23 +1,63 @@
 from pathlib import Path
-from ..utils.file_io import read_csv, save_json
+from typing import Dict, List, Union
+import pandas as pd
+from ..utils.file_io import read_table, read_table_chunks, save_json, save_json_stream
 from ..utils.logger import setup_logger
+from ..utils.metrics import stage
 
 logger = setup_logger(__name__)
 
-def convert_csv_to_json(input_path: str, output_path: str):
+DEFAULT_CHUNKSIZE = 100_000
+
+def _to_records(df: pd.DataFrame) -> List[Dict]:
+    # Column lists zipped into dicts: several times faster than to_dict(orient="records").
+    # Missing values (NaN, NaT, and pd.NA in schema dtypes) are written as null.
+    with stage("transform") as timer:
+        columns = df.columns.tolist()
+        values = []
+        for col in range(len(columns)):
+            series = df.iloc[:, col]
+            if series.hasnans:
+                series = series.astype(object).where(series.notna(), None)
+            values.append(series.tolist())
+        timer.rows = len(df)
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+def convert_csv_to_json(input_path: str, output_path: str, chunksize: int = None, output_format: str = "array",
+                        columns: List[str] = None, filters=None, schema: Union[str, Dict] = None,
+                        indent: int = 4, backend: str = None):
     """
-    Converts a CSV file to a JSON file.
-    
+    Converts a CSV (or Parquet/Feather) file to a JSON file.
+
+    When 'chunksize' is given, or the output format is "ndjson", the CSV is
+    streamed in chunks and written incrementally so memory stays bounded.
+    Column types are then inferred per chunk rather than for the whole file.
+    Missing values are written as null.
+
     Args:
-        input_path (str): Path to the input CSV file.
+        input_path (str): Path to the input CSV, Parquet or Feather file.
         output_path (str): Path to the output JSON file.
+        chunksize (int): Optional number of rows to read per chunk.
+        output_format (str): "array" for a JSON array, "ndjson" for JSON Lines.
+        columns (List[str]): Optional subset of columns to read and write.
+        filters: Optional DNF row filters, e.g. [("age", ">", 30)].
+        schema (str | Dict): Optional CSV column types: a dict, a schema file,
+                             or "auto" (see utils.schema).
+        indent (int): Spaces per indentation level; None writes compact JSON.
+        backend (str): JSON serializer: "orjson", "ujson", "json" or "auto"
+                       (see utils.json_backend).
     """
     try:
-        logger.info(f"Starting conversion: {input_path} -> {output_path}")
-        df = read_csv(input_path)
-        data = df.to_dict(orient="records")
-        save_json(data, output_path)
+        logger.info("Starting conversion: %s -> %s", input_path, output_path)
+        if chunksize is None and output_format == "array":
+            df = read_table(input_path, columns=columns, filters=filters, schema=schema)
+            save_json(_to_records(df), output_path, indent=indent, backend=backend)
+        else:
+            chunks = read_table_chunks(input_path, chunksize or DEFAULT_CHUNKSIZE, columns=columns, filters=filters,
+                                       schema=schema)
+            records = (_to_records(chunk) for chunk in chunks)
+            save_json_stream(records, output_path, output_format=output_format, indent=indent, backend=backend)
         logger.info("Conversion completed successfully.")
     except Exception as e:
-        logger.error(f"Conversion failed: {e}")
+        logger.error("Conversion failed: %s", e)
         raise
@@ -1,48 +1,267 @@
+import re
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from functools import partial
+from itertools import chain, groupby, islice, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
-from ..utils.file_io import read_json, save_excel
+from ..utils.file_io import read_json, read_ndjson, save_table, save_table_stream
+from ..utils.helpers import get_file_extension
+from ..utils.json_stream import MixedListError, iter_json_objects, iter_ndjson_objects
 from ..utils.logger import setup_logger
+from ..utils.metrics import current_metrics, stage
+from ..utils.schema import apply_schema, infer_frame_schema, load_schema
 
 logger = setup_logger(__name__)
 
+DEFAULT_CHUNKSIZE = 10_000
+
+# Lists shorter than this are flattened row by row rather than column by column
+BATCH_MIN_OBJECTS = 16
+
+
+class Flattener:
+    """
+    Iterative dictionary flattener.
+
+    Walks nested dicts with an explicit stack instead of recursion and caches
+    the joined key for every (prefix, key) pair it has seen, so documents that
+    share a layout do not rebuild the same key strings row after row.
+    """
+
+    def __init__(self, sep: str = "_", max_cached_keys: int = 100_000):
+        self.sep = sep
+        self.max_cached_keys = max_cached_keys
+        self._key_cache = {}
+        self._cached_keys = 0
+
+    def _names_for(self, prefix) -> Dict:
+        names = self._key_cache.get(prefix)
+        if names is None:
+            if self._cached_keys >= self.max_cached_keys:
+                self._key_cache.clear()
+                self._cached_keys = 0
+            names = self._key_cache[prefix] = {}
+        return names
+
+    def flatten(self, d: Dict, parent_key: str = "") -> Dict:
+        """Flattens a nested dictionary, joining nested keys with 'sep'."""
+        items = {}
+        sep = self.sep
+        stack = [(iter(d.items()), parent_key, self._names_for(parent_key))]
+        while stack:
+            entries, prefix, names = stack[-1]
+            for k, v in entries:
+                new_key = names.get(k)
+                if new_key is None:
+                    new_key = names[k] = f"{prefix}{sep}{k}" if prefix else k
+                    self._cached_keys += 1
+                if isinstance(v, dict):
+                    stack.append((iter(v.items()), new_key, self._names_for(new_key)))
+                    break
+                items[new_key] = v
+            else:
+                stack.pop()
+        return items
+
+    def flatten_columns(self, objects: List[Dict], parent_key: str = "") -> Optional[Dict[str, List]]:
+        """
+        Flattens a list of dicts that share one layout (same keys in the same
+        order, nested dicts in the same places) straight into columns, with
+        the same keys and values as flattening each object.
+
+        Returns None if the objects' layouts differ; flatten them one by one then.
+        """
+        level = _level_columns(objects)
+        if level is None:
+            return None
+        columns = {}
+        sep = self.sep
+        stack = [(iter(level), parent_key)]
+        while stack:
+            entries, prefix = stack[-1]
+            for k, values in entries:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(values[0], dict):
+                    level = _level_columns(values) if all(map(isinstance, values, repeat(dict))) else None
+                    if level is None:
+                        return None
+                    stack.append((iter(level), new_key))
+                    break
+                if any(map(isinstance, values, repeat(dict))):
+                    return None
+                columns[new_key] = values
+            else:
+                stack.pop()
+        return columns
+
+def _level_columns(objects: List[Dict]) -> Optional[List[Tuple[str, List]]]:
+    """
+    Splits dicts with the same keys in the same order into (key, values)
+    columns, or returns None if their keys differ. Keys and values are read
+    row by row into 2-D object arrays rather than looked up per row and column.
+    """
+    first = objects[0]
+    n_keys = len(first)
+    if not all(map(n_keys.__eq__, map(len, objects))):
+        return None
+    if not n_keys:
+        return []
+    count = len(objects) * n_keys
+    keys = np.fromiter(chain.from_iterable(objects), dtype=object, count=count).reshape(-1, n_keys)
+    if not (keys == keys[0]).all():
+        return None
+    values = np.fromiter(chain.from_iterable(map(dict.values, objects)), dtype=object, count=count)
+    return list(zip(first, values.reshape(-1, n_keys).T.tolist()))
+
+class ColumnarBuilder:
+    """
+    Accumulates rows directly into per-column lists.
+
+    Produces the same DataFrame as pd.DataFrame(list_of_rows) (columns in
+    first-appearance order, missing values as NaN) without keeping a dict
+    per row alive until the end.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, List] = {}
+        self._n_rows = 0
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def append(self, row: Dict[str, Any]):
+        n_rows = self._n_rows
+        columns = self._columns
+        for key, value in row.items():
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [np.nan] * n_rows
+            column.append(value)
+        if len(row) != len(columns):
+            for column in columns.values():
+                if len(column) == n_rows:
+                    column.append(np.nan)
+        self._n_rows = n_rows + 1
+
+    def extend(self, columns: Dict[str, List], n_rows: int):
+        """
+        Appends 'n_rows' rows given as columns, in first-appearance order and
+        with np.nan for missing values (as appending the rows one by one would).
+        """
+        old_rows = self._n_rows
+        existing = self._columns
+        for key, values in columns.items():
+            column = existing.get(key)
+            if column is None:
+                existing[key] = [np.nan] * old_rows + values
+            else:
+                column.extend(values)
+        if len(columns) != len(existing):
+            for column in existing.values():
+                if len(column) == old_rows:
+                    column.extend([np.nan] * n_rows)
+        self._n_rows = old_rows + n_rows
+
+    def to_frame(self) -> pd.DataFrame:
+        if not self._columns:
+            return pd.DataFrame(index=pd.RangeIndex(self._n_rows))
+        return pd.DataFrame(self._columns)
 
 def flatten_dict(d: Dict, parent_key: str = "", sep: str = "_") -> Dict:
     """
-    Recursively flattens a nested dictionary.
+    Flattens a nested dictionary.
     Nested keys are joined by 'sep'.
     """
-    items = {}
-    for k, v in d.items():
-        new_key = f"{parent_key}{sep}{k}" if parent_key else k
-        if isinstance(v, dict):
-            items.update(flatten_dict(v, new_key, sep=sep))
-        else:
-            items[new_key] = v
-    return items
+    return Flattener(sep).flatten(d, parent_key)
 
-def find_lists_of_objects(data, parent_path=""):
+class PathFilter:
     """
-    Recursively find lists of dicts (lowest-level objects).
-    Returns a list of tuples: (path, list_of_objects)
+    Selects lists of objects by path with fnmatch patterns such as
+    'aggregations_*_buckets' (paths join keys and list indexes with '_').
+
+    Besides matching a path, it tells whether anything below a path could
+    still match, from the literal part of each pattern before its first
+    wildcard, so traversals can skip whole subtrees. Match results are cached
+    per path, since a streamed list yields its path once per object.
+    """
+
+    def __init__(self, patterns: Union[str, Iterable[str]], max_cached_paths: int = 100_000):
+        self.patterns = [patterns] if isinstance(patterns, str) else list(patterns)
+        self.max_cached_paths = max_cached_paths
+        self._literals = [re.split(r"[*?\[]", pattern, maxsplit=1)[0] for pattern in self.patterns]
+        self._matches = {}
+
+    def matches(self, path: str) -> bool:
+        matched = self._matches.get(path)
+        if matched is None:
+            if len(self._matches) >= self.max_cached_paths:
+                self._matches.clear()
+            matched = self._matches[path] = any(fnmatchcase(path, pattern) for pattern in self.patterns)
+        return matched
+
+    def may_contain(self, path: str) -> bool:
+        """Tells whether a path below 'path' could match one of the patterns."""
+        if not path:
+            return True
+        prefix = f"{path}_"
+        return any(prefix.startswith(literal) or literal.startswith(prefix) for literal in self._literals)
+
+def _children(path: str, items: Iterable[Tuple[Any, Any]]) -> Iterator[Tuple[str, Any]]:
+    prefix = f"{path}_" if path else ""
+    for key, value in items:
+        yield f"{prefix}{key}", value
+
+def iter_lists_of_objects(data, parent_path: str = "",
+                          paths: Union[str, Iterable[str], PathFilter] = None) -> Iterator[Tuple[str, List[Dict]]]:
     """
-    results = []
+    Lazily finds lists of dicts (lowest-level objects), in document order.
 
-    if isinstance(data, dict):
-        for k, v in data.items():
-            path = f"{parent_path}_{k}" if parent_path else k
-            results.extend(find_lists_of_objects(v, path))
+    Walks the document with an explicit stack, so deeply nested documents
+    cannot hit the recursion limit. Lists holding anything but dicts are
+    searched element by element, with the index as path component.
 
-    elif isinstance(data, list):
-        if all(isinstance(i, dict) for i in data):
-            results.append((parent_path, data))
+    Args:
+        data: Parsed JSON document.
+        parent_path (str): Path of 'data' itself.
+        paths (str | List[str]): Optional fnmatch patterns (or a PathFilter);
+                                 only matching lists are returned and
+                                 subtrees that cannot match are not visited.
+
+    Yields:
+        Tuple[str, List[Dict]]: (path, list_of_objects)
+    """
+    if paths is not None and not isinstance(paths, PathFilter):
+        paths = PathFilter(paths)
+    stack = [iter(((parent_path, data),))]
+    while stack:
+        for path, value in stack[-1]:
+            if isinstance(value, dict):
+                if paths is None or paths.may_contain(path):
+                    stack.append(_children(path, value.items()))
+                    break
+            elif isinstance(value, list):
+                if all(map(isinstance, value, repeat(dict))):
+                    if paths is None or paths.matches(path):
+                        yield path, value
+                elif paths is None or paths.may_contain(path):
+                    # Handle nested lists or mixed lists
+                    stack.append(_children(path, enumerate(value)))
+                    break
         else:
-            # Handle nested lists or mixed lists
-            for idx, item in enumerate(data):
-                path = f"{parent_path}_{idx}" if parent_path else str(idx)
-                results.extend(find_lists_of_objects(item, path))
+            stack.pop()
 
-    return results
+def find_lists_of_objects(data, parent_path="", paths=None):
+    """
+    Find lists of dicts (lowest-level objects).
+    Returns a list of tuples: (path, list_of_objects)
+    See iter_lists_of_objects.
+    """
+    return list(iter_lists_of_objects(data, parent_path, paths))
 
 def find_best_match(flat_obj: Dict[str, Any], field: str) -> Any:
     """
@@ -70,57 +289,295 @@ def find_best_match(flat_obj: Dict[str, Any], field: str) -> Any:
     best_key = sorted(candidates, key=lambda x: (len(x), x))[0]
     return flat_obj[best_key]
 
-def convert_json_to_excel(input_path: str, output_path: str, fields: dict = None):
+class FieldResolver:
+    """
+    Applies a field mapping to flattened objects with the same result as
+    calling find_best_match for every field.
+
+    The exact/suffix match decision only depends on the set of keys, so it is
+    compiled once per key layout (schema fingerprint) into a list of
+    (flat_key, header) pairs and kept in a bounded LRU cache.
+    """
+
+    def __init__(self, fields: Dict[str, str], maxsize: int = 256):
+        self.fields = fields
+        self.maxsize = maxsize
+        self._plans = OrderedDict()
+
+    def compile(self, keys: Iterable[str]) -> List[Tuple[str, str]]:
+        """Builds the (flat_key, header) lookup plan for a set of flattened keys."""
+        keys = list(keys)
+        key_set = set(keys)
+        plan = []
+        for json_field, excel_header in self.fields.items():
+            if json_field in key_set:
+                plan.append((json_field, excel_header))
+                continue
+            candidates = [k for k in keys if k.endswith(json_field)]
+            if candidates:
+                plan.append((min(candidates, key=lambda x: (len(x), x)), excel_header))
+        return plan
+
+    def resolve(self, flat_obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Returns the mapped row for a flattened object, skipping None values."""
+        fingerprint = tuple(flat_obj)
+        plan = self._plans.get(fingerprint)
+        if plan is None:
+            plan = self.compile(fingerprint)
+            self._plans[fingerprint] = plan
+            if len(self._plans) > self.maxsize:
+                self._plans.popitem(last=False)
+        else:
+            self._plans.move_to_end(fingerprint)
+
+        row = {}
+        for flat_key, excel_header in plan:
+            val = flat_obj[flat_key]
+            if val is not None:
+                row[excel_header] = val
+        return row
+
+    def resolve_columns(self, columns: Dict[str, List], n_rows: int) -> Optional[Tuple[Dict[str, List], int]]:
+        """
+        Applies the mapping to flattened columns as a column select/rename,
+        with the same result as resolving each row and appending the non-empty
+        ones: None values become missing, rows without any mapped value are
+        dropped and headers are ordered by their first non-missing row.
+
+        Returns the (columns, n_rows) to append, or None if several fields map
+        to the same header (then resolve the rows one by one).
+        """
+        plan = self.compile(columns)
+        if len({excel_header for _, excel_header in plan}) != len(plan):
+            return None
+        values = [np.fromiter(columns[flat_key], dtype=object, count=n_rows) for flat_key, _ in plan]
+        missing = [column == None for column in values]  # noqa: E711 (elementwise)
+        kept = ~np.logical_and.reduce(missing) if plan else np.zeros(n_rows, dtype=bool)
+        if not kept.all():
+            values = [column[kept] for column in values]
+            missing = [mask[kept] for mask in missing]
+        first_rows = []
+        for position, mask in enumerate(missing):
+            if not mask.all():
+                first_rows.append((int(np.argmin(mask)), position))
+        mapped = {}
+        for _, position in sorted(first_rows):
+            column = values[position]
+            column[missing[position]] = np.nan
+            mapped[plan[position][1]] = column.tolist()
+        return mapped, int(kept.sum())
+
+def _iter_rows(objects: Iterable[Tuple[str, Dict]], fields: dict = None, flattener: Flattener = None,
+               resolver: FieldResolver = None) -> Iterator[Dict]:
+    """
+    Flattens each object and applies the optional field mapping. With an
+    active metrics collector, the time spent parsing, flattening and matching
+    the objects is recorded once the rows are consumed, so it counts against
+    the consuming stage.
+    """
+    flattener = flattener or Flattener()
+    if fields and resolver is None:
+        resolver = FieldResolver(fields)
+    collector = current_metrics()
+    # float() returns 0.0: a no-op clock that is as cheap to call as perf_counter
+    clock = time.perf_counter if collector is not None else float
+    parse = flatten = match = 0.0
+    n_objects = 0
+    objects = iter(objects)
+    try:
+        while True:
+            start = clock()
+            item = next(objects, None)
+            parsed = clock()
+            parse += parsed - start
+            if item is None:
+                break
+            # Flatten the object to handle nested structures
+            flat_obj = flattener.flatten(item[1])
+            flattened = clock()
+            flatten += flattened - parsed
+            n_objects += 1
+            if resolver:
+                # Map and filter fields using smart matching
+                row = resolver.resolve(flat_obj)
+                match += clock() - flattened
+                if not row:
+                    # Log a debug warning but don't crash, maybe this object just doesn't have the info
+                    # raise ValueError(f"Object matches none of the requested fields: {list(fields.keys())}")
+                    continue
+            else:
+                row = flat_obj
+            yield row
+    finally:
+        if collector is not None:
+            collector.add_time("parse", parse, rows=n_objects)
+            collector.add_time("flatten", flatten, rows=n_objects)
+            if resolver:
+                collector.add_time("match", match, rows=n_objects)
+
+def _iter_batches(objects: Iterable[Tuple[str, Dict]], size: int) -> Iterator[Tuple[str, List[Dict]]]:
+    """Groups consecutive objects of the same list into (path, objects) batches of at most 'size' objects."""
+    for path, group in groupby(objects, key=itemgetter(0)):
+        group = map(itemgetter(1), group)
+        while batch := list(islice(group, size)):
+            yield path, batch
+
+def _build_columns(lists: Iterable[Tuple[str, List[Dict]]], fields: dict = None,
+                   batch_size: int = DEFAULT_CHUNKSIZE) -> ColumnarBuilder:
+    """
+    Builds the table from lists of objects, 'batch_size' objects at a time.
+    A batch whose objects share one layout is flattened column by column and
+    mapped by column select/rename; other batches (and short ones) go through
+    the per-row path. Both produce the same table.
+    """
+    builder = ColumnarBuilder()
+    flattener = Flattener()
+    resolver = FieldResolver(fields) if fields else None
+    collector = current_metrics()
+    clock = time.perf_counter
+    # Bounds the temporary arrays of the column path on long lists
+    lists = ((path, objects[start:start + batch_size]) for path, objects in lists
+             for start in range(0, len(objects), batch_size))
+    while True:
+        start = clock()
+        item = next(lists, None)
+        if collector is not None:
+            collector.add_time("parse", clock() - start)
+        if item is None:
+            break
+        path, objects = item
+        batch = None
+        if len(objects) >= BATCH_MIN_OBJECTS:
+            start = clock()
+            columns = flattener.flatten_columns(objects)
+            flattened = clock()
+            if columns is not None:
+                batch = resolver.resolve_columns(columns, len(objects)) if resolver else (columns, len(objects))
+            if collector is not None:
+                collector.add_time("flatten", flattened - start, rows=len(objects))
+                if resolver:
+                    collector.add_time("match", clock() - flattened, rows=len(objects))
+        if batch is None:
+            for row in _iter_rows(((path, obj) for obj in objects), fields, flattener, resolver):
+                builder.append(row)
+        else:
+            builder.extend(*batch)
+    return builder
+
+def _iter_frames(rows: Iterable[Dict], chunksize: int) -> Iterator[pd.DataFrame]:
+    """Groups rows into DataFrames of at most 'chunksize' rows."""
+    builder = ColumnarBuilder()
+    for row in rows:
+        builder.append(row)
+        if len(builder) >= chunksize:
+            with stage("transform"):
+                frame = builder.to_frame()
+            yield frame
+            builder = ColumnarBuilder()
+    if len(builder):
+        with stage("transform"):
+            frame = builder.to_frame()
+        yield frame
+
+def _filter_paths(iter_objects, path_filter: PathFilter) -> Iterator[Tuple[str, Dict]]:
+    return ((path, obj) for path, obj in iter_objects() if path_filter.matches(path))
+
+def _stream_to_excel(iter_objects, output_path: str, fields: dict, chunksize: int, schema: dict = None) -> int:
+    """
+    Writes rows to Excel in two passes over the input: the first collects the
+    column order, the second streams the rows. Returns the number of rows.
+    """
+    columns = {}
+    n_rows = 0
+    for row in _iter_rows(iter_objects(), fields):
+        columns.update(dict.fromkeys(row))
+        n_rows += 1
+    if n_rows:
+        frames = _iter_frames(_iter_rows(iter_objects(), fields), chunksize)
+        if schema:
+            frames = (apply_schema(frame, schema) for frame in frames)
+        save_table_stream(frames, output_path, columns=list(columns))
+    return n_rows
+
+def convert_json_to_excel(input_path: str, output_path: str, fields: dict = None, streaming: bool = False,
+                          chunksize: int = DEFAULT_CHUNKSIZE, schema=None, paths=None):
     """
     Converts a JSON file to an Excel file with optional field selection and renaming.
     
     Args:
-        input_path (str): Path to the input JSON file.
-        output_path (str): Path to the output Excel file.
+        input_path (str): Path to the input JSON or NDJSON (.ndjson/.jsonl) file.
+        output_path (str): Path to the output Excel file (or Parquet/Feather,
+                           chosen by extension).
         fields (dict): Optional mapping of {json_field: excel_header}. 
                        Only fields in keys will be kept.
+        streaming (bool): Parse the input incrementally and write the workbook
+                          in write-only mode, 'chunksize' rows at a time,
+                          instead of building the whole table in memory.
+                          NDJSON input is always parsed incrementally.
+        chunksize (int): Rows per chunk handed to the Excel writer when streaming,
+                         and objects flattened at a time otherwise.
+        schema (str | Dict): Optional output column types (a dict or schema
+                             file), or "auto" to infer compact types from the
+                             extracted table (not available when streaming).
+        paths (str | List[str]): Optional fnmatch patterns of the lists to
+                                 extract (e.g. 'aggregations_*_buckets'),
+                                 matched against their '_'-joined path.
     """
     try:
-        logger.info(f"Starting conversion: {input_path} -> {output_path}")
-        data = read_json(input_path)
+        logger.info("Starting conversion: %s -> %s", input_path, output_path)
+        is_ndjson = get_file_extension(input_path) in (".ndjson", ".jsonl")
+        iter_objects = partial(iter_ndjson_objects if is_ndjson else iter_json_objects, input_path)
+        path_filter = PathFilter(paths) if paths else None
+        if path_filter:
+            iter_objects = partial(_filter_paths, iter_objects, path_filter)
+        builder = None
+        if schema is not None and not isinstance(schema, dict) and schema != "auto":
+            schema = load_schema(schema)
+        if streaming and schema == "auto":
+            logger.warning("schema='auto' needs the whole table; ignoring it when streaming.")
+            schema = None
 
-        # Find all lowest-level lists of objects
-        lists_found = find_lists_of_objects(data)
-        if not lists_found:
-            logger.warning("No lists of objects found in JSON.")
-            return
+        if streaming or is_ndjson:
+            try:
+                if streaming:
+                    n_rows = _stream_to_excel(iter_objects, output_path, fields, chunksize, schema=schema)
+                    if not n_rows:
+                        logger.warning("No rows extracted from JSON after applying fields.")
+                        return
+                    logger.info("Conversion completed successfully.")
+                    return
+                with stage("transform") as timer:
+                    builder = _build_columns(_iter_batches(iter_objects(), chunksize), fields, chunksize)
+                    timer.rows = len(builder)
+            except MixedListError as e:
+                logger.info("%s; falling back to in-memory traversal.", e)
+
+        if builder is None:
+            with stage("parse"):
+                data = read_ndjson(input_path) if is_ndjson else read_json(input_path)
+
+                # Find all lowest-level lists of objects
+                lists_found = iter_lists_of_objects(data, paths=path_filter)
+                first = next(lists_found, None)
+            if first is None:
+                logger.warning("No lists of objects found in JSON.")
+                return
+
+            with stage("transform") as timer:
+                builder = _build_columns(chain((first,), lists_found), fields, chunksize)
+                timer.rows = len(builder)
 
-        all_rows = []
-        for path, lst in lists_found:
-            for obj in lst:
-                # Flatten the object to handle nested structures
-                flat_obj = flatten_dict(obj)
-                
-                if fields:
-                    # Map and filter fields using smart matching
-                    row = {}
-                    for json_field, excel_header in fields.items():
-                        val = find_best_match(flat_obj, json_field)
-                        if val is not None:
-                            row[excel_header] = val
-                            
-                    if not row:
-                        # Log a debug warning but don't crash, maybe this object just doesn't have the info
-                        # raise ValueError(f"Object matches none of the requested fields: {list(fields.keys())}")
-                        continue
-                else:
-                    row = flat_obj
-                
-                all_rows.append(row)
-
-        if not all_rows:
+        if not len(builder):
             logger.warning("No rows extracted from JSON after applying fields.")
             return
 
-        df = pd.DataFrame(all_rows)
-        save_excel(df, output_path)
+        with stage("transform"):
+            df = builder.to_frame()
+            if schema is not None:
+                df = apply_schema(df, infer_frame_schema(df) if schema == "auto" else schema)
+        save_table(df, output_path)
         logger.info("Conversion completed successfully.")
 
     except Exception as e:
-        logger.error(f"Conversion failed: {e}")
+        logger.error("Conversion failed: %s", e)
         raise
@@ -0,0 +1,186 @@
+import os
+import tempfile
+from collections import namedtuple
+from typing import Iterator, List, Union
+
+import pandas as pd
+
+from ..utils.compression import estimate_data_size
+from ..utils.file_io import count_table_rows, read_table, read_table_chunks, read_table_columns, save_table_stream
+from ..utils.helpers import parse_size
+from ..utils.logger import setup_logger
+from ..utils.metrics import stage
+from .partitioned_join import _MEMORY_EXPANSION, _estimate_row_bytes, partitioned_join
+
+logger = setup_logger(__name__)
+
+DEFAULT_CHUNKSIZE = 100_000
+
+JoinPlan = namedtuple("JoinPlan", ["strategy", "order", "key", "renames", "columns"])
+JoinPlan.__doc__ = """
+An execution plan for joining N files on a shared key.
+
+strategy: "broadcast" streams order[0] past the other inputs held in memory,
+          "chain" joins the inputs pairwise in memory, "partitioned" joins
+          them pairwise out-of-core.
+order:    Input indices in the order they are joined.
+key:      Join column name used in the output.
+renames:  Per-input column renames (join keys and clashing columns).
+columns:  Output columns, in the order a left-to-right chain would produce.
+"""
+
+
+def estimate_rows(file_path: str) -> int:
+    """
+    Estimates the number of rows in a CSV file from its size and a sample of
+    lines; columnar files report their exact count.
+    """
+    rows = count_table_rows(file_path)
+    if rows is not None:
+        return rows
+    return int(estimate_data_size(file_path) / _estimate_row_bytes(file_path))
+
+
+def _column_renames(input_files: List[str], keys: List[str]):
+    """
+    Renames every input's join key to the first key, and suffixes non-key
+    columns that appear in more than one input with the input's 1-based position.
+    """
+    key = keys[0]
+    headers = [read_table_columns(path) for path in input_files]
+    for path, cols, file_key in zip(input_files, headers, keys):
+        if file_key not in cols:
+            raise KeyError(f"Join column '{file_key}' not found in {path}")
+
+    seen = {}
+    for cols, file_key in zip(headers, keys):
+        for col in cols:
+            if col != file_key:
+                seen[col] = seen.get(col, 0) + 1
+
+    renames, columns = [], []
+    for idx, (cols, file_key) in enumerate(zip(headers, keys)):
+        rename = {file_key: key} if file_key != key else {}
+        for col in cols:
+            if col != file_key and (seen[col] > 1 or col == key):
+                rename[col] = f"{col}_{idx + 1}"
+        renames.append(rename)
+        renamed = [rename.get(col, col) for col in cols]
+        columns.extend(renamed if idx == 0 else [col for col in renamed if col != key])
+    return renames, columns
+
+
+def plan_join(input_files: List[str], keys: List[str], how: str = "inner",
+              memory_limit: Union[int, str] = None) -> JoinPlan:
+    """
+    Chooses how to execute an N-way join on a shared key.
+
+    Inner joins stream the largest input past the others, which are held in
+    memory and applied smallest first. Left joins stream the first input.
+    Right and outer joins are not order-independent, so they are chained in
+    input order. When a memory limit is given and the in-memory inputs would
+    exceed it, inputs are joined pairwise out-of-core instead.
+
+    Args:
+        input_files (List[str]): Paths to the input CSV files.
+        keys (List[str]): Join column for each input.
+        how (str): Type of join (inner, left, right, outer).
+        memory_limit (int | str): Optional memory budget, e.g. "2GB".
+    """
+    if how not in ("inner", "left", "right", "outer"):
+        raise ValueError(f"Unsupported join type: {how}")
+    renames, columns = _column_renames(input_files, keys)
+    rows = [estimate_rows(path) for path in input_files]
+    by_size = sorted(range(len(input_files)), key=lambda idx: rows[idx])
+
+    if how == "inner":
+        streamed = by_size[-1]
+        order = [streamed] + [idx for idx in by_size if idx != streamed]
+    elif how == "left":
+        order = [0] + [idx for idx in by_size if idx != 0]
+    else:
+        order = list(range(len(input_files)))
+    strategy = "broadcast" if how in ("inner", "left") else "chain"
+
+    if memory_limit:
+        in_memory = order[1:] if strategy == "broadcast" else order
+        in_memory_bytes = sum(estimate_data_size(input_files[idx]) for idx in in_memory) * _MEMORY_EXPANSION
+        if in_memory_bytes > parse_size(memory_limit):
+            strategy = "partitioned"
+            if how == "inner":
+                order = by_size
+
+    return JoinPlan(strategy, order, keys[0], renames, columns)
+
+
+def _iter_broadcast(input_files: List[str], plan: JoinPlan, how: str, chunksize: int,
+                    schema=None) -> Iterator[pd.DataFrame]:
+    streamed, broadcast = plan.order[0], plan.order[1:]
+    tables = [read_table(input_files[idx], schema=schema).rename(columns=plan.renames[idx]) for idx in broadcast]
+    for chunk in read_table_chunks(input_files[streamed], chunksize, schema=schema):
+        with stage("join") as timer:
+            joined = chunk.rename(columns=plan.renames[streamed])
+            for table in tables:
+                joined = pd.merge(joined, table, on=plan.key, how=how)
+            timer.rows = len(joined)
+        yield joined[plan.columns]
+
+
+def _chain(input_files: List[str], plan: JoinPlan, how: str, schema=None) -> pd.DataFrame:
+    joined = None
+    for idx in plan.order:
+        df = read_table(input_files[idx], schema=schema).rename(columns=plan.renames[idx])
+        with stage("join") as timer:
+            joined = df if joined is None else pd.merge(joined, df, on=plan.key, how=how)
+            timer.rows = len(joined)
+    return joined[plan.columns]
+
+
+def _chain_partitioned(input_files: List[str], output_path: str, plan: JoinPlan, how: str,
+                       memory_limit: Union[int, str]):
+    with tempfile.TemporaryDirectory(prefix="dataops-join-") as tmp_dir:
+        left_path = input_files[plan.order[0]]
+        left_rename = plan.renames[plan.order[0]]
+        for step, idx in enumerate(plan.order[1:], start=1):
+            last = step == len(plan.order) - 1
+            target = os.path.join(tmp_dir, f"step_{step}.csv") if not last else output_path
+            partitioned_join(left_path, input_files[idx], target, plan.key, plan.key, how=how,
+                             memory_limit=memory_limit, spill_dir=tmp_dir,
+                             left_rename=left_rename, right_rename=plan.renames[idx],
+                             columns=plan.columns if last else None)
+            left_path, left_rename = target, None
+
+
+def multiway_join(input_files: List[str], output_path: str, keys: List[str], how: str = "inner",
+                  memory_limit: Union[int, str] = None, chunksize: int = DEFAULT_CHUNKSIZE, schema=None):
+    """
+    Joins N CSV, Parquet or Feather files on a shared key in a single pass where possible.
+
+    Every input's key column is renamed to the first input's key, and non-key
+    columns that occur in several inputs get a '_<position>' suffix. Output
+    columns follow input order regardless of the execution order chosen by
+    plan_join.
+
+    Args:
+        input_files (List[str]): Paths to the input files.
+        output_path (str): Path to the output file (CSV, Excel, Parquet or Feather).
+        keys (List[str]): Join column for each input.
+        how (str): Type of join (inner, left, right, outer).
+        memory_limit (int | str): Optional memory budget, e.g. "2GB".
+        chunksize (int): Rows per chunk when streaming the largest input.
+        schema (str | Dict): Optional column types for CSV inputs read in
+                             memory (see read_table).
+    """
+    plan = plan_join(input_files, keys, how=how, memory_limit=memory_limit)
+    logger.info("Join plan: %s over inputs %s on '%s'", plan.strategy, plan.order, plan.key)
+
+    if plan.strategy == "partitioned":
+        _chain_partitioned(input_files, output_path, plan, how, memory_limit)
+        return
+
+    if plan.strategy == "broadcast":
+        chunks = _iter_broadcast(input_files, plan, how, chunksize, schema=schema)
+    else:
+        chunks = [_chain(input_files, plan, how, schema=schema)]
+
+    save_table_stream(chunks, output_path, columns=plan.columns)
@@ -1,58 +1,232 @@
+import io
+import os
 import pandas as pd
-from typing import List
-from ..utils.file_io import read_csv, save_excel
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterator, List, Union
+from ..utils.compression import expand_inputs, get_compression
+from ..utils.file_io import is_columnar, read_table, read_table_chunks, read_table_columns, save_table, save_table_stream
 from ..utils.logger import setup_logger
+from ..utils.manifest import Manifest, fingerprint, is_unchanged
+from ..utils.metrics import count, stage
+from .join_planner import multiway_join
+from .partitioned_join import partitioned_join
 
 logger = setup_logger(__name__)
 
-def merge_csv_files(input_files: List[str], output_path: str, join_on: List[str] = None, how: str = "inner"):
+DEFAULT_CHUNKSIZE = 100_000
+
+def _iter_parallel(input_files: List[str], workers: int, read) -> Iterator[pd.DataFrame]:
+    """
+    Reads files in a thread pool and yields them in input order.
+    At most 2 x 'workers' files are in flight at any time.
+    """
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        files = iter(input_files)
+        pending = deque(pool.submit(read, file) for file in islice(files, 2 * workers))
+        while pending:
+            df = pending.popleft().result()
+            for file in islice(files, 1):
+                pending.append(pool.submit(read, file))
+            yield df
+
+def _concat_stream(input_files: List[str], output_path: str, chunksize: int = None, workers: int = None,
+                   schema=None):
+    """
+    Concatenates the inputs without holding them all in memory, aligned to
+    the union of their columns.
+    
+    CSV outputs read every value as text so it is written back unchanged and
+    consistently across files; Excel outputs keep inferred types so numbers
+    stay numeric, as do Parquet/Feather outputs when every input is columnar
+    (otherwise they are written as text); typed outputs apply 'schema' to
+    CSV inputs. With 'workers', whole files are parsed in a thread pool
+    (the pandas C parser releases the GIL) and written in input order as
+    they complete; otherwise files are read sequentially in chunks.
+    """
+    typed = output_path.endswith('.xlsx') or (is_columnar(output_path) and all(map(is_columnar, input_files)))
+    dtype = None if typed else str
+    
+    if workers and workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            headers = list(pool.map(read_table_columns, input_files))
+        chunks = _iter_parallel(input_files, workers, partial(read_table, dtype=dtype, schema=schema))
+    else:
+        headers = [read_table_columns(file) for file in input_files]
+        chunks = (chunk for file in input_files
+                  for chunk in read_table_chunks(file, chunksize or DEFAULT_CHUNKSIZE, dtype=dtype, schema=schema))
+    
+    columns = list(dict.fromkeys(col for header in headers for col in header))
+    save_table_stream(chunks, output_path, columns=columns)
+
+def _kept_inputs(entry: Dict, input_files: List[str], output_path: str, columns: List[str]) -> int:
+    """Counts the leading inputs whose recorded output can be kept (see _concat_incremental)."""
+    if not entry or not os.path.exists(output_path) or not set(columns) <= set(entry["columns"]):
+        return 0
+    output_size = os.path.getsize(output_path)
+    kept = 0
+    for recorded, file in zip(entry["inputs"], input_files):
+        if (recorded["path"] != os.path.abspath(file) or not is_unchanged(file, recorded)
+                or output_size < recorded["offset"]):
+            break
+        kept += 1
+    return kept
+
+def _concat_incremental(input_files: List[str], output_path: str, manifest_path: str, chunksize: int = None):
+    """
+    Concatenates CSV text into 'output_path', recording in the manifest the
+    output size after each input. A rerun keeps the output up to the last
+    input that is unchanged and still in the same position, and appends the
+    inputs after it: new shards of an append-only feed, or the rest of a run
+    that died halfway (its partial output is truncated first).
     """
-    Merges multiple CSV files.
-    If 'join_on' is provided, performs a join (merge) on 2 files.
+    if get_compression(output_path) or not output_path.lower().endswith(".csv"):
+        raise ValueError("Incremental concatenation needs an uncompressed CSV output.")
+    manifest = Manifest(manifest_path)
+    key = f"concat:{os.path.abspath(output_path)}"
+    headers = [read_table_columns(file) for file in input_files]
+    columns = list(dict.fromkeys(col for header in headers for col in header))
+
+    entry = manifest.get(key)
+    kept = _kept_inputs(entry, input_files, output_path, columns)
+    if not kept:
+        entry = {"columns": columns, "inputs": []}
+    else:
+        # Keep the recorded column order so the existing rows stay aligned
+        columns = entry["columns"]
+        entry["inputs"] = entry["inputs"][:kept]
+        logger.info("Keeping the output of %s unchanged inputs; appending %s", kept, len(input_files) - kept)
+
+    offset = entry["inputs"][-1]["offset"] if kept else 0
+    written = 0
+    with open(output_path, "r+b" if kept else "wb") as raw:
+        raw.truncate(offset)
+        raw.seek(offset)
+        with io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+            if not kept:
+                pd.DataFrame(columns=columns).to_csv(f, index=False)
+            for file in input_files[kept:]:
+                recorded = dict(fingerprint(file), path=os.path.abspath(file))
+                for chunk in read_table_chunks(file, chunksize or DEFAULT_CHUNKSIZE, dtype=str):
+                    with stage("write") as timer:
+                        if list(chunk.columns) != columns:
+                            chunk = chunk.reindex(columns=columns)
+                        chunk.to_csv(f, index=False, header=False)
+                        timer.rows = len(chunk)
+                f.flush()
+                recorded["offset"] = raw.tell()
+                written += recorded["offset"] - offset
+                offset = recorded["offset"]
+                entry["inputs"].append(recorded)
+                manifest.set(key, entry)
+                manifest.save()
+    count("bytes_written", written)
+    if kept == len(input_files):
+        # Nothing new, but an earlier input may have been removed from the list
+        manifest.set(key, entry)
+        manifest.save()
+    logger.info("Appended %s of %s inputs to %s", len(input_files) - kept, len(input_files), output_path)
+
+def merge_csv_files(input_files: List[str], output_path: str, join_on: List[str] = None, how: str = "inner",
+                    chunksize: int = None, memory_limit: Union[int, str] = None, workers: int = None,
+                    schema: Union[str, Dict] = None, manifest: str = None):
+    """
+    Merges multiple CSV, Parquet or Arrow IPC/Feather files (chosen by extension).
+    If 'join_on' is provided, performs a join (merge) on 2 files, or an
+    N-way join on a shared key when more files are given.
     Otherwise, performs a concatenation of all files.
     
     Args:
-        input_files (List[str]): List of paths to input CSV files.
-        output_path (str): Path to the output file (CSV or Excel).
+        input_files (List[str]): List of paths to input files (optionally compressed),
+                                 directories or glob patterns. For joins, a
+                                 directory or pattern is one input dataset.
+        output_path (str): Path to the output file (CSV, Excel, Parquet or Feather).
+                           CSV outputs ending in .gz, .bz2, .xz or .zst are compressed.
         join_on (List[str]): List of column names to join on. 
                              If 1 item, uses it for both. 
                              If 2 items, uses first for left, second for right.
+                             For N > 2 files, give 1 item or one per file.
         how (str): Type of join (inner, left, right, outer).
+        chunksize (int): If given, concatenation streams the inputs in chunks of
+                         this many rows instead of loading them all. CSV
+                         values are then passed through as text.
+        memory_limit (int | str): If given, joins run out-of-core within this
+                                  memory budget (e.g. "2GB") using
+                                  hash-partitioned spill files.
+        workers (int): If greater than 1, concatenation parses files in a
+                       pool of this many threads and streams the output.
+        schema (str | Dict): Optional column types for CSV inputs: a dict, a
+                             schema file shared by all inputs, or "auto" to
+                             infer (and save) one per input. Out-of-core joins
+                             and text passthrough ignore it.
+        manifest (str): Optional manifest file (see utils.manifest) for
+                        concatenations into an uncompressed CSV: reruns keep
+                        the output of unchanged leading inputs and only append
+                        the rest. Values are passed through as text.
     """
     try:
         if join_on:
-            if len(input_files) != 2:
-                raise ValueError("Merging with 'on' requires exactly 2 input files.")
+            if len(input_files) < 2:
+                raise ValueError("Merging with 'on' requires at least 2 input files.")
             
-            logger.info(f"Starting {how} join of 2 files on {join_on}")
-            df1 = read_csv(input_files[0])
-            df2 = read_csv(input_files[1])
+            if len(input_files) > 2:
+                if len(join_on) not in (1, len(input_files)):
+                    raise ValueError("For N-way joins, 'on' must name 1 column or one column per input file.")
+                keys = join_on * len(input_files) if len(join_on) == 1 else join_on
+                logger.info("Starting %s join of %s files on %s", how, len(input_files), keys)
+                multiway_join(input_files, output_path, keys, how=how, memory_limit=memory_limit, schema=schema)
+                logger.info("Merge completed successfully.")
+                return
             
+            logger.info("Starting %s join of 2 files on %s", how, join_on)
             left_on = join_on[0]
             right_on = join_on[1] if len(join_on) > 1 else join_on[0]
             
-            merged_df = pd.merge(df1, df2, left_on=left_on, right_on=right_on, how=how)
+            if memory_limit:
+                partitioned_join(input_files[0], input_files[1], output_path, left_on, right_on,
+                                 how=how, memory_limit=memory_limit)
+                logger.info("Merge completed successfully.")
+                return
+            
+            df1 = read_table(input_files[0], schema=schema)
+            df2 = read_table(input_files[1], schema=schema)
+            
+            with stage("join") as timer:
+                merged_df = pd.merge(df1, df2, left_on=left_on, right_on=right_on, how=how)
+                timer.rows = len(merged_df)
             
         else:
-            logger.info(f"Starting concatenation of {len(input_files)} files into {output_path}")
+            # Directories and glob patterns contribute each of their files
+            input_files = [file for path in input_files for file in expand_inputs(path)]
+            logger.info("Starting concatenation of %s files into %s", len(input_files), output_path)
+            if manifest and input_files:
+                _concat_incremental(input_files, output_path, manifest, chunksize=chunksize)
+                logger.info("Merge completed successfully.")
+                return
+            if (chunksize or (workers and workers > 1)) and input_files:
+                _concat_stream(input_files, output_path, chunksize=chunksize, workers=workers, schema=schema)
+                logger.info("Merge completed successfully.")
+                return
+
             dataframes = []
             for file in input_files:
-                df = read_csv(file)
+                df = read_table(file, schema=schema)
                 dataframes.append(df)
                 
             if not dataframes:
                 logger.warning("No files to merge.")
                 return
 
-            merged_df = pd.concat(dataframes, ignore_index=True)
+            with stage("concat") as timer:
+                merged_df = pd.concat(dataframes, ignore_index=True)
+                timer.rows = len(merged_df)
         
-        if output_path.endswith('.xlsx'):
-            save_excel(merged_df, output_path)
-        else:
-            merged_df.to_csv(output_path, index=False)
-            logger.info(f"Successfully saved merged output to: {output_path}")
+        save_table(merged_df, output_path)
+        logger.info("Successfully saved merged output to: %s", output_path)
             
         logger.info("Merge completed successfully.")
     except Exception as e:
-        logger.error(f"Merge failed: {e}")
+        logger.error("Merge failed: %s", e)
         raise
@@ -0,0 +1,125 @@
+import math
+import os
+import tempfile
+from typing import Dict, Iterator, List, Union
+
+import pandas as pd
+
+from ..utils.compression import estimate_data_size, expand_inputs, open_file
+from ..utils.file_io import count_table_rows, read_table_chunks, read_table_columns, save_table_stream
+from ..utils.helpers import parse_size
+from ..utils.logger import setup_logger
+from ..utils.metrics import stage
+
+logger = setup_logger(__name__)
+
+# Rough in-memory size of parsed CSV text relative to its size on disk.
+_MEMORY_EXPANSION = 5
+_MAX_PARTITIONS = 4096
+_MIN_CHUNK_ROWS = 1_000
+
+
+def _estimate_row_bytes(file_path: str, sample_bytes: int = 1 << 16) -> float:
+    """Estimates the (uncompressed) bytes per row of a file, or of a dataset's first file."""
+    file_path = expand_inputs(file_path)[0]
+    rows = count_table_rows(file_path)
+    if rows is not None:
+        return os.path.getsize(file_path) / max(rows, 1)
+    with open_file(file_path, 'rb') as f:
+        sample = f.read(sample_bytes)
+    lines = sample.count(b"\n")
+    return len(sample) / max(lines, 1)
+
+
+def _partition_file(file_path: str, key: str, n_partitions: int, spill_dir: str, prefix: str,
+                    memory_limit: int, rename: Dict[str, str] = None) -> List[str]:
+    """Splits an input into 'n_partitions' CSV spill files by the hash of its key column."""
+    paths = [os.path.join(spill_dir, f"{prefix}_{i}.csv") for i in range(n_partitions)]
+    rename = rename or {}
+    columns = [rename.get(col, col) for col in read_table_columns(file_path)]
+    if key not in columns:
+        raise KeyError(f"Join column '{key}' not found in {file_path}")
+
+    row_bytes = _estimate_row_bytes(file_path) * _MEMORY_EXPANSION
+    chunksize = max(_MIN_CHUNK_ROWS, int(memory_limit / 4 / row_bytes))
+    started = [False] * n_partitions
+
+    for chunk in read_table_chunks(file_path, chunksize, dtype=str):
+        if rename:
+            chunk = chunk.rename(columns=rename)
+        with stage("partition") as timer:
+            part_ids = pd.util.hash_array(chunk[key].to_numpy(dtype=object)) % n_partitions
+            for part_id, part in chunk.groupby(part_ids, sort=False):
+                part.to_csv(paths[part_id], mode='a', index=False, header=not started[part_id])
+                started[part_id] = True
+            timer.rows = len(chunk)
+
+    # Empty partitions still need a header so they can be read back
+    for part_id, path in enumerate(paths):
+        if not started[part_id]:
+            pd.DataFrame(columns=columns).to_csv(path, index=False)
+    return paths
+
+
+def _iter_joined(left_parts: List[str], right_parts: List[str], left_on: str, right_on: str,
+                 how: str) -> Iterator[pd.DataFrame]:
+    for left_path, right_path in zip(left_parts, right_parts):
+        with stage("read") as timer:
+            left = pd.read_csv(left_path, dtype=str)
+            right = pd.read_csv(right_path, dtype=str)
+            timer.rows = len(left) + len(right)
+        with stage("join") as timer:
+            joined = pd.merge(left, right, left_on=left_on, right_on=right_on, how=how)
+            timer.rows = len(joined)
+        yield joined
+        os.remove(left_path)
+        os.remove(right_path)
+
+
+def partitioned_join(left_path: str, right_path: str, output_path: str, left_on: str, right_on: str,
+                     how: str = "inner", memory_limit: Union[int, str] = "1GB", spill_dir: str = None,
+                     left_rename: Dict[str, str] = None, right_rename: Dict[str, str] = None,
+                     columns: List[str] = None):
+    """
+    Joins two CSV, Parquet or Feather files that do not fit in memory.
+
+    Both inputs are hash-partitioned on their join keys into spill files, so
+    matching keys always land in the same partition. Partitions are sized so a
+    pair fits within 'memory_limit' and are then joined one at a time with
+    pd.merge, streaming the result to the output.
+
+    Values are carried through as text, so keys match on their exact CSV
+    representation (columnar values are converted to text) and output values keep their original formatting. Rows
+    are grouped by partition rather than in input order.
+
+    Args:
+        left_path (str): Path to the left input file.
+        right_path (str): Path to the right input file.
+        output_path (str): Path to the output file (CSV, Excel, Parquet or Feather).
+        left_on (str): Join column in the left file.
+        right_on (str): Join column in the right file.
+        how (str): Type of join (inner, left, right, outer).
+        memory_limit (int | str): Memory budget, e.g. 2147483648 or "2GB".
+        spill_dir (str): Directory for spill files. Defaults to the system temp dir.
+        left_rename (Dict[str, str]): Optional column renames applied to the left
+                                      input before joining ('left_on' is the new name).
+        right_rename (Dict[str, str]): Same for the right input.
+        columns (List[str]): Optional output column selection and order.
+    """
+    if how not in ("inner", "left", "right", "outer"):
+        raise ValueError(f"Unsupported join type: {how}")
+    memory_limit = parse_size(memory_limit)
+
+    input_bytes = estimate_data_size(left_path) + estimate_data_size(right_path)
+    n_partitions = math.ceil(input_bytes * _MEMORY_EXPANSION / memory_limit)
+    n_partitions = min(max(n_partitions, 1), _MAX_PARTITIONS)
+    logger.info("Out-of-core %s join with %s partitions (memory limit %s bytes)", how, n_partitions, memory_limit)
+
+    with tempfile.TemporaryDirectory(prefix="dataops-join-", dir=spill_dir) as tmp_dir:
+        left_parts = _partition_file(left_path, left_on, n_partitions, tmp_dir, "left", memory_limit,
+                                     rename=left_rename)
+        right_parts = _partition_file(right_path, right_on, n_partitions, tmp_dir, "right", memory_limit,
+                                      rename=right_rename)
+
+        joined = _iter_joined(left_parts, right_parts, left_on, right_on, how)
+        save_table_stream(joined, output_path, columns=columns)
@@ -0,0 +1 @@
+from .runner import Pipeline, load_pipeline, run_pipeline
@@ -0,0 +1,297 @@
+import contextvars
+import json
+import os
+import queue
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+
+import pandas as pd
+
+from ..utils.file_io import read_table_chunks, save_table_stream
+from ..utils.helpers import get_file_extension
+from ..utils.logger import setup_logger
+from .stages import STEPS
+
+logger = setup_logger(__name__)
+
+DEFAULT_CHUNKSIZE = 100_000
+# Chunks queued between a stage and each of its consumers
+DEFAULT_BUFFER = 4
+# How often blocked stages check whether the pipeline was cancelled
+_POLL_INTERVAL = 0.1
+
+_END = object()
+
+
+class _Cancelled(BaseException):
+    """
+    Stops a stage after another stage failed. A BaseException (like
+    GeneratorExit) so the error handlers of the steps do not log it.
+    """
+
+
+class _Channel:
+    """Broadcasts a stage's output chunks to one bounded queue per consumer."""
+
+    def __init__(self, cancelled: threading.Event):
+        self.cancelled = cancelled
+        self.queues: List[queue.Queue] = []
+
+    def subscribe(self, maxsize: int) -> Iterator[pd.DataFrame]:
+        chunks = queue.Queue(maxsize)
+        self.queues.append(chunks)
+        return self._iterate(chunks)
+
+    def _iterate(self, chunks: queue.Queue) -> Iterator[pd.DataFrame]:
+        while True:
+            try:
+                chunk = chunks.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                if self.cancelled.is_set():
+                    raise _Cancelled()
+                continue
+            if chunk is _END:
+                return
+            yield chunk
+
+    def put(self, chunk):
+        for chunks in self.queues:
+            while True:
+                if self.cancelled.is_set():
+                    raise _Cancelled()
+                try:
+                    chunks.put(chunk, timeout=_POLL_INTERVAL)
+                    break
+                except queue.Full:
+                    pass
+
+    def close(self):
+        self.put(_END)
+
+
+class _Stage:
+    __slots__ = ("name", "step", "inputs", "options", "spill")
+
+    def __init__(self, name: str, step: str, inputs: List[str], options: Dict, spill: Union[str, bool] = None):
+        self.name = name
+        self.step = step
+        self.inputs = inputs
+        self.options = options
+        self.spill = spill
+
+
+class Pipeline:
+    """
+    Chains read, merge, validate and write steps as lazy streaming stages
+    that pass DataFrame chunks in memory instead of through files.
+
+    Every stage runs in its own thread, connected to its consumers by
+    bounded queues, so stages with independent inputs (e.g. the two sides of
+    a join) run concurrently and memory stays bounded. A stage is written to
+    disk only when it has 'spill' set: to that path, or to a temporary file
+    for True; its consumers then read it back. Stage metrics (see
+    utils.metrics) are collected from every thread.
+
+    Example:
+        pipeline = Pipeline(chunksize=50_000)
+        merged = pipeline.merge(["orders.csv", "customers.csv"], on="id", how="left")
+        checked = pipeline.validate(merged, rules="rules.yaml")
+        pipeline.write(checked, "orders.json")
+        results = pipeline.run()
+    """
+
+    def __init__(self, chunksize: int = DEFAULT_CHUNKSIZE, buffer: int = DEFAULT_BUFFER):
+        self.chunksize = chunksize
+        self.buffer = buffer
+        self.stages: Dict[str, _Stage] = {}
+
+    def add(self, step: str, inputs: List[str] = (), name: str = None, spill: Union[str, bool] = None,
+            **options) -> str:
+        """
+        Adds a stage and returns its name.
+
+        Args:
+            step (str): "read", "merge", "validate" or "write".
+            inputs (List[str]): Names of earlier stages, or file paths (read
+                                by implicit "read" stages named after them).
+            name (str): Stage name (default: the step and a number).
+            spill (str | bool): Write the stage's output to this file (or a
+                                temporary one) before its consumers read it.
+            **options: Options of the step (see pipeline.stages).
+        """
+        if step not in STEPS:
+            raise ValueError(f"Unknown pipeline step: {step} (choose from {', '.join(STEPS)})")
+        sources = [self._source(ref) for ref in inputs]
+        name = name or f"{step}{len(self.stages) + 1}"
+        if name in self.stages:
+            raise ValueError(f"Duplicate pipeline stage name: {name}")
+        self.stages[name] = _Stage(name, step, sources, options, spill)
+        return name
+
+    def _source(self, ref: str) -> str:
+        if ref in self.stages:
+            return ref
+        return self.add("read", name=ref, path=ref)
+
+    def read(self, path: str, name: str = None, spill: Union[str, bool] = None, **options) -> str:
+        """Adds a stage reading 'path' in chunks (columns, filters, schema as for read_table)."""
+        return self.add("read", name=name, spill=spill, path=path, **options)
+
+    def merge(self, inputs: List[str], on: Union[str, List[str]] = None, how: str = "inner", name: str = None,
+              spill: Union[str, bool] = None) -> str:
+        """Adds a stage concatenating 'inputs', or joining two of them on 'on'."""
+        return self.add("merge", inputs, name=name, spill=spill, on=on, how=how)
+
+    def validate(self, input: str, name: str = None, spill: Union[str, bool] = None, **options) -> str:
+        """Adds a stage validating 'input' as it passes through (rules, duplicates, error_rate, output)."""
+        return self.add("validate", [input], name=name, spill=spill, **options)
+
+    def write(self, input: str, path: str, name: str = None, **options) -> str:
+        """Adds a stage writing 'input' to 'path' (format, indent, backend, columns for JSON)."""
+        return self.add("write", [input], name=name, path=path, **options)
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "Pipeline":
+        """
+        Builds a pipeline from a dict with an optional 'chunksize' and a list
+        of 'stages', each with a 'step', an optional 'name', its 'input' or
+        'inputs', an optional 'spill' and the step's options.
+        """
+        pipeline = cls(chunksize=config.get("chunksize") or DEFAULT_CHUNKSIZE,
+                       buffer=config.get("buffer") or DEFAULT_BUFFER)
+        names = [entry.get("name") for entry in config.get("stages", [])]
+        for position, entry in enumerate(config.get("stages", [])):
+            options = dict(entry)
+            if True in options:
+                # YAML 1.1 reads a bare 'on:' key as the boolean true
+                options["on"] = options.pop(True)
+            step = options.pop("step", None)
+            if step is None:
+                raise ValueError(f"Pipeline stage {position + 1} has no 'step'")
+            inputs = options.pop("inputs", None) or ([options.pop("input")] if "input" in options else [])
+            for ref in inputs:
+                if ref in names[position:]:
+                    raise ValueError(f"Pipeline stage {names[position] or position + 1} uses stage '{ref}' "
+                                     f"before it is defined")
+            pipeline.add(step, inputs, **options)
+        return pipeline
+
+    def _ancestors(self, name: str) -> set:
+        found = {name}
+        for source in self.stages[name].inputs:
+            found |= self._ancestors(source)
+        return found
+
+    def _shares_upstream(self, stage: _Stage) -> bool:
+        ancestors = [self._ancestors(source) for source in stage.inputs]
+        return any(a & b for i, a in enumerate(ancestors) for b in ancestors[i + 1:])
+
+    def run(self) -> Dict[str, Dict]:
+        """
+        Runs every stage and returns a result per stage: the 'step' and the
+        'rows' it output (or wrote), plus the 'report' of validate stages and
+        the 'path' of write stages.
+        """
+        try:
+            logger.info("Running pipeline of %s stages", len(self.stages))
+            cancelled = threading.Event()
+            channels = {name: _Channel(cancelled) for name in self.stages}
+            inputs = {}
+            for stage in self.stages.values():
+                buffer = self.buffer
+                if len(stage.inputs) > 1 and self._shares_upstream(stage):
+                    # Merges read their inputs one after the other: bounded queues
+                    # fed by the same upstream stage would wait on each other
+                    logger.warning("Stage %s reads inputs sharing an upstream stage; buffering them in memory.",
+                                   stage.name)
+                    buffer = 0
+                inputs[stage.name] = [channels[source].subscribe(buffer) for source in stage.inputs]
+
+            results = {name: {"step": stage.step} for name, stage in self.stages.items()}
+            errors = []
+            with ThreadPoolExecutor(max_workers=max(1, len(self.stages)), thread_name_prefix="dataops-pipeline") as pool:
+                try:
+                    futures = {
+                        pool.submit(contextvars.copy_context().run, self._run_stage, stage, inputs[name],
+                                    channels[name], results[name]): name
+                        for name, stage in self.stages.items()
+                    }
+                    for future in as_completed(futures):
+                        try:
+                            future.result()
+                        except _Cancelled:
+                            pass
+                        except Exception as e:
+                            cancelled.set()
+                            errors.append((futures[future], e))
+                except BaseException:
+                    cancelled.set()
+                    raise
+            if errors:
+                name, error = errors[0]
+                logger.error("Pipeline stage %s failed: %s", name, error)
+                raise error
+
+            logger.info("Pipeline completed successfully.")
+            return results
+        except Exception as e:
+            logger.error("Pipeline failed: %s", e)
+            raise
+
+    def _run_stage(self, stage: _Stage, inputs: List[Iterator[pd.DataFrame]], channel: _Channel, result: Dict):
+        output = STEPS[stage.step](inputs, result, self.chunksize, **stage.options)
+        if output is not None:
+            if stage.spill:
+                output = self._spill(output, stage.spill)
+            rows = 0
+            for chunk in output:
+                rows += len(chunk)
+                channel.put(chunk)
+            result["rows"] = rows
+        channel.close()
+
+    def _spill(self, chunks: Iterator[pd.DataFrame], spill: Union[str, bool]) -> Iterator[pd.DataFrame]:
+        temporary = spill is True
+        if temporary:
+            fd, spill = tempfile.mkstemp(suffix=".csv", prefix="dataops-spill-")
+            os.close(fd)
+        try:
+            save_table_stream(chunks, spill)
+            yield from read_table_chunks(spill, self.chunksize)
+        finally:
+            if temporary:
+                os.remove(spill)
+
+
+def load_pipeline(config_path: Union[str, Path]) -> Pipeline:
+    """Loads a pipeline from a YAML or JSON file (see Pipeline.from_config)."""
+    with open(config_path, "r", encoding="utf-8") as f:
+        if get_file_extension(str(config_path)) in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required for YAML pipeline files: pip install pyyaml") from None
+            config = yaml.safe_load(f) or {}
+        else:
+            config = json.load(f)
+    return Pipeline.from_config(config)
+
+
+def run_pipeline(config: Union[str, Path, Dict], chunksize: int = None) -> Dict[str, Dict]:
+    """
+    Runs a pipeline described by a YAML/JSON file or a dict.
+
+    Args:
+        config (str | Dict): Path to the pipeline file, or its contents.
+        chunksize (int): Rows per chunk passed between stages (overrides the config).
+
+    Returns:
+        Dict: The result of each stage (see Pipeline.run).
+    """
+    pipeline = Pipeline.from_config(config) if isinstance(config, dict) else load_pipeline(config)
+    if chunksize:
+        pipeline.chunksize = chunksize
+    return pipeline.run()
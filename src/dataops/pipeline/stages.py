@@ -0,0 +1,142 @@
+"""
+Pipeline steps. Each takes its input chunk iterators, a result dict to fill
+and the pipeline chunk size, and returns an iterator of output chunks
+(None for steps that only write).
+"""
+from itertools import chain
+from typing import Dict, Iterator, List, Union
+
+import pandas as pd
+
+from ..converters.csv_to_json import _to_records
+from ..utils.file_io import read_table_chunks, save_json, save_json_stream, save_table_stream
+from ..utils.helpers import get_file_extension, parse_filter
+from ..utils.logger import setup_logger
+from ..utils.metrics import stage
+from ..validator.validate_data import _iter_validated, _log_findings
+
+logger = setup_logger(__name__)
+
+JSON_FORMATS = {".json": "array", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+Chunks = Iterator[pd.DataFrame]
+
+
+def _peek(chunks: Chunks):
+    """Returns the first chunk (or None) and an iterator over all the chunks."""
+    first = next(chunks, None)
+    return first, (chain([first], chunks) if first is not None else iter(()))
+
+
+def _collect(chunks: Chunks) -> pd.DataFrame:
+    frames = list(chunks)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _count_rows(chunks: Chunks, result: Dict) -> Chunks:
+    result["rows"] = 0
+    for chunk in chunks:
+        result["rows"] += len(chunk)
+        yield chunk
+
+
+def read_step(inputs: List[Chunks], result: Dict, chunksize: int, path: str, columns: List[str] = None,
+              filters=None, schema: Union[str, Dict] = None) -> Chunks:
+    """Reads a table (CSV, Parquet, Feather, compressed, or a dataset) in chunks."""
+    if filters:
+        filters = [parse_filter(f) if isinstance(f, str) else tuple(f) for f in filters]
+    return read_table_chunks(path, chunksize, columns=columns, filters=filters, schema=schema)
+
+
+def merge_step(inputs: List[Chunks], result: Dict, chunksize: int, on: Union[str, List[str]] = None,
+               how: str = "inner") -> Chunks:
+    """Concatenates its inputs, or joins two inputs when 'on' is given (see merge_csv_files)."""
+    if on:
+        return _join(inputs, chunksize, [on] if isinstance(on, str) else list(on), how)
+    return _concat(inputs)
+
+
+def _concat(inputs: List[Chunks]) -> Chunks:
+    # Columns are the union of each input's first chunk, in order
+    peeked = [_peek(chunks) for chunks in inputs]
+    columns = list(dict.fromkeys(col for first, _ in peeked if first is not None for col in first.columns))
+    for _, chunks in peeked:
+        for chunk in chunks:
+            with stage("concat") as timer:
+                if list(chunk.columns) != columns:
+                    chunk = chunk.reindex(columns=columns)
+                timer.rows = len(chunk)
+            yield chunk
+
+
+def _join(inputs: List[Chunks], chunksize: int, keys: List[str], how: str) -> Chunks:
+    """
+    Inner and left joins stream the left input past the right one held in
+    memory (pandas keeps the left order, so the output matches a single
+    merge); right and outer joins hold both inputs.
+    """
+    if len(inputs) != 2 or len(keys) > 2:
+        raise ValueError("Pipeline joins take 2 inputs and 1 or 2 key columns; chain merge stages for more.")
+    left_on, right_on = keys[0], keys[-1]
+    right = _collect(inputs[1])
+    if how in ("inner", "left"):
+        for chunk in inputs[0]:
+            with stage("join") as timer:
+                merged = pd.merge(chunk, right, left_on=left_on, right_on=right_on, how=how)
+                timer.rows = len(merged)
+            yield merged
+        return
+
+    left = _collect(inputs[0])
+    with stage("join") as timer:
+        merged = pd.merge(left, right, left_on=left_on, right_on=right_on, how=how)
+        timer.rows = len(merged)
+    for start in range(0, len(merged), chunksize):
+        yield merged.iloc[start:start + chunksize]
+
+
+def validate_step(inputs: List[Chunks], result: Dict, chunksize: int, rules: Union[str, Dict] = None,
+                  duplicates: str = "exact", error_rate: float = 0.01, memory_limit: Union[int, str] = "256MB",
+                  output: str = None) -> Chunks:
+    """
+    Passes its input through unchanged while validating it (see
+    validate_csv_data); the report is stored in the result and saved as
+    JSON to 'output' if given.
+    """
+    first, chunks = _peek(inputs[0])
+    columns = list(first.columns) if first is not None else []
+    report = {}
+    yield from _iter_validated(chunks, columns, report, duplicates=duplicates, error_rate=error_rate,
+                               memory_limit=memory_limit, rules=rules)
+    _log_findings(report)
+    result["report"] = report
+    if output:
+        save_json(report, output)
+
+
+def write_step(inputs: List[Chunks], result: Dict, chunksize: int, path: str, format: str = None,
+               indent: int = 4, backend: str = None, columns: List[str] = None) -> None:
+    """
+    Writes its input to 'path': JSON ("array" or "ndjson", chosen by the
+    .json/.ndjson/.jsonl extension or 'format'), or CSV, Excel, Parquet or
+    Feather by extension.
+    """
+    chunks = _count_rows(inputs[0], result)
+    output_format = format or JSON_FORMATS.get(get_file_extension(path))
+    if output_format:
+        if columns:
+            chunks = (chunk[columns] for chunk in chunks)
+        save_json_stream((_to_records(chunk) for chunk in chunks), path, output_format=output_format,
+                         indent=indent, backend=backend)
+    else:
+        save_table_stream(chunks, path, columns=columns)
+    result["path"] = path
+    return None
+
+
+STEPS = {
+    "read": read_step,
+    "merge": merge_step,
+    "validate": validate_step,
+    "write": write_step,
+}
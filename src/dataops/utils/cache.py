@@ -0,0 +1,199 @@
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Union
+
+from .helpers import parse_size
+from .logger import setup_logger
+from .metrics import count
+
+logger = setup_logger(__name__)
+
+DEFAULT_MAX_SIZE = "2GB"
+
+# Opt-in through the environment: DATAOPS_CACHE=1 (default directory) or
+# DATAOPS_CACHE_DIR=<dir>, optionally with DATAOPS_CACHE_SIZE and
+# DATAOPS_CACHE_KEY=content to key entries on file contents instead of mtime.
+ENV_ENABLE = "DATAOPS_CACHE"
+ENV_DIR = "DATAOPS_CACHE_DIR"
+ENV_SIZE = "DATAOPS_CACHE_SIZE"
+ENV_KEY = "DATAOPS_CACHE_KEY"
+
+_ENTRY_SUFFIXES = (".feather", ".pkl")
+
+
+def default_cache_dir() -> Path:
+    """Returns DATAOPS_CACHE_DIR, or 'dataops' under XDG_CACHE_HOME (~/.cache)."""
+    if os.environ.get(ENV_DIR):
+        return Path(os.environ[ENV_DIR])
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dataops"
+
+
+def _file_digest(file_path: str, block_size: int = 1 << 20) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed DataFrames, keyed by the source file and read options.
+
+    The key covers the file's path, size and modification time ("stat"), or a
+    hash of its bytes ("content", which survives copies and touches but reads
+    the file). Frames are stored as Feather files and memory-mapped on read
+    when pyarrow is available, otherwise pickled. Entries are evicted least
+    recently used first once the cache exceeds 'max_size' bytes.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path] = None, max_size: Union[int, str] = DEFAULT_MAX_SIZE,
+                 key: str = "stat"):
+        if key not in ("stat", "content"):
+            raise ValueError(f"Unsupported cache key: {key}")
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_size = parse_size(max_size)
+        self.key = key
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, file_path: str, options: Dict) -> str:
+        path = os.path.realpath(file_path)
+        stat = os.stat(path)
+        source = _file_digest(path) if self.key == "content" else f"{path}|{stat.st_size}|{stat.st_mtime_ns}"
+        return hashlib.sha256(f"{source}|{sorted(options.items())!r}".encode()).hexdigest()
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        return [p for p in self.cache_dir.iterdir() if p.suffix in _ENTRY_SUFFIXES]
+
+    def _lookup(self, key: str) -> Path:
+        for suffix in _ENTRY_SUFFIXES:
+            path = self.cache_dir / f"{key}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def load(self, file_path: Union[str, Path], parse: Callable, **options):
+        """
+        Returns the cached frame for 'file_path' read with 'options', or calls
+        'parse()' and stores its result.
+        """
+        import pandas as pd
+
+        key = self._key(str(file_path), options)
+        entry = self._lookup(key)
+        if entry is not None:
+            try:
+                if entry.suffix == ".feather":
+                    from pyarrow import feather
+                    df = feather.read_table(entry, memory_map=True).to_pandas()
+                else:
+                    df = pd.read_pickle(entry)
+                os.utime(entry)
+                self.hits += 1
+                count("cache_hits")
+                logger.info("Parse cache hit for %s (hits=%s, misses=%s)", file_path, self.hits, self.misses)
+                return df
+            except Exception as e:
+                logger.warning("Discarding unreadable cache entry %s: %s", entry, e)
+                entry.unlink(missing_ok=True)
+
+        self.misses += 1
+        count("cache_misses")
+        logger.info("Parse cache miss for %s (hits=%s, misses=%s)", file_path, self.hits, self.misses)
+        df = parse()
+        try:
+            self._store(key, df)
+        except Exception as e:
+            logger.warning("Could not cache %s: %s", file_path, e)
+        return df
+
+    def _store(self, key: str, df):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            try:
+                import pyarrow  # noqa: F401
+                df.to_feather(tmp_path)
+                suffix = ".feather"
+            except Exception:
+                # No pyarrow, or columns Arrow cannot represent (e.g. mixed object values)
+                df.to_pickle(tmp_path)
+                suffix = ".pkl"
+            os.replace(tmp_path, self.cache_dir / f"{key}{suffix}")
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self.evict()
+
+    def evict(self):
+        """Removes least recently used entries until the cache fits in 'max_size'."""
+        entries = sorted(((p.stat().st_mtime, p.stat().st_size, p) for p in self._entries()),
+                         key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info("Evicted parse cache entry %s (%s bytes)", path.name, size)
+
+    def stat(self) -> Dict[str, any]:
+        """Returns the cache location, entry count and sizes."""
+        entries = self._entries()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "size_bytes": sum(p.stat().st_size for p in entries),
+            "max_size_bytes": self.max_size,
+            "key": self.key,
+        }
+
+    def clear(self) -> int:
+        """Removes every entry and returns how many were removed."""
+        entries = self._entries()
+        for path in entries:
+            path.unlink(missing_ok=True)
+        logger.info("Cleared %s parse cache entries from %s", len(entries), self.cache_dir)
+        return len(entries)
+
+
+_configured: Dict[str, any] = {}
+_instances: Dict[tuple, ParseCache] = {}
+
+
+def configure_cache(enabled: bool = True, cache_dir: Union[str, Path] = None,
+                    max_size: Union[int, str] = None, key: str = None):
+    """
+    Enables or disables the parse cache for this process, overriding the
+    DATAOPS_CACHE* environment variables. enabled=None restores them.
+    """
+    _configured.clear()
+    if enabled is not None:
+        _configured.update(enabled=enabled, cache_dir=cache_dir, max_size=max_size, key=key)
+
+
+def get_cache(only_enabled: bool = True) -> ParseCache:
+    """
+    Returns the configured ParseCache, or None if caching is not enabled
+    (unless 'only_enabled' is False, e.g. to inspect or clear it).
+    """
+    if _configured:
+        enabled = _configured["enabled"]
+    else:
+        enabled = os.environ.get(ENV_ENABLE, "").lower() in ("1", "true", "yes", "on") or bool(os.environ.get(ENV_DIR))
+    if not enabled and only_enabled:
+        return None
+
+    cache_dir = str(_configured.get("cache_dir") or default_cache_dir())
+    max_size = _configured.get("max_size") or os.environ.get(ENV_SIZE) or DEFAULT_MAX_SIZE
+    key = _configured.get("key") or os.environ.get(ENV_KEY) or "stat"
+    settings = (cache_dir, parse_size(max_size), key)
+    if settings not in _instances:
+        _instances[settings] = ParseCache(cache_dir, max_size=max_size, key=key)
+    return _instances[settings]
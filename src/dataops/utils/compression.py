@@ -0,0 +1,113 @@
+import bz2
+import glob
+import gzip
+import io
+import lzma
+import os
+from pathlib import Path
+from typing import IO, List, Union
+
+from .helpers import COMPRESSION_SUFFIXES
+
+# Compressed sizes understate how much data a file holds; this rough ratio is
+# used when estimating memory for compressed inputs.
+COMPRESSION_RATIO_ESTIMATE = 4
+
+_GLOB_CHARS = ("*", "?", "[")
+
+
+def get_compression(file_path: Union[str, Path]) -> str:
+    """Returns "gzip", "bz2", "xz" or "zstd" for a compressed path, else None."""
+    return COMPRESSION_SUFFIXES.get(Path(str(file_path)).suffix.lower())
+
+
+def _open_zstd(file_path: str, mode: str):
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard is required for .zst files: pip install zstandard") from None
+    if "r" in mode:
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True)
+    return zstandard.ZstdCompressor().stream_writer(open(file_path, "wb"), closefd=True)
+
+
+def open_file(file_path: Union[str, Path], mode: str = "r", encoding: str = "utf-8", newline: str = None,
+              buffering: int = -1) -> IO:
+    """
+    Opens a file like open(), transparently (de)compressing .gz, .bz2, .xz and
+    .zst (with the optional zstandard package) files while streaming.
+
+    Args:
+        file_path (str): Path to the file.
+        mode (str): "r", "w" or "a", optionally with "b" for binary access.
+        encoding (str): Text encoding for text modes.
+        newline (str): Newline handling for text modes, as in open().
+        buffering (int): Buffer size in bytes for binary access (-1 for the default).
+    """
+    file_path = str(file_path)
+    compression = get_compression(file_path)
+    binary = "b" in mode
+    raw_mode = mode.replace("b", "").replace("t", "") + "b"
+
+    if compression is None:
+        if binary:
+            return open(file_path, raw_mode, buffering=buffering)
+        return open(file_path, raw_mode.replace("b", ""), encoding=encoding, newline=newline)
+
+    if compression == "gzip":
+        handle = gzip.open(file_path, raw_mode)
+    elif compression == "bz2":
+        handle = bz2.open(file_path, raw_mode)
+    elif compression == "xz":
+        handle = lzma.open(file_path, raw_mode)
+    else:
+        handle = _open_zstd(file_path, raw_mode)
+    if binary:
+        if buffering > 0 and "r" not in raw_mode:
+            return io.BufferedWriter(handle, buffer_size=buffering)
+        return handle
+    return io.TextIOWrapper(handle, encoding=encoding, newline=newline)
+
+
+def is_dataset(path: Union[str, Path]) -> bool:
+    """
+    Tells whether a path is a directory or a glob pattern naming several
+    files. An existing file is never a pattern, even if its name contains
+    glob characters (e.g. 'sales[2024].csv').
+    """
+    path = str(path)
+    if os.path.isfile(path):
+        return False
+    return os.path.isdir(path) or any(char in path for char in _GLOB_CHARS)
+
+
+def expand_inputs(path: Union[str, Path]) -> List[str]:
+    """
+    Lists the files of a dataset in sorted order: every visible file of a
+    directory (schema sidecars excluded), or the matches of a glob pattern
+    ('**' matches subdirectories). A plain or existing file path is returned
+    as is.
+    """
+    path = str(path)
+    if os.path.isfile(path):
+        return [path]
+    if os.path.isdir(path):
+        files = [os.path.join(path, name) for name in os.listdir(path)
+                 if not name.startswith(".") and not name.endswith(".schema.json")
+                 and os.path.isfile(os.path.join(path, name))]
+    elif any(char in path for char in _GLOB_CHARS):
+        files = [p for p in glob.glob(path, recursive=True) if os.path.isfile(p) and not p.endswith(".schema.json")]
+    else:
+        return [path]
+    if not files:
+        raise FileNotFoundError(f"No input files found for: {path}")
+    return sorted(files)
+
+
+def estimate_data_size(path: Union[str, Path]) -> int:
+    """Estimates the uncompressed size in bytes of a file or dataset."""
+    total = 0
+    for file in expand_inputs(path):
+        size = os.path.getsize(file)
+        total += size * COMPRESSION_RATIO_ESTIMATE if get_compression(file) else size
+    return total
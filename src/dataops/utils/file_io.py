@@ -1,51 +1,613 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import Union, List, Dict
+from typing import Callable, NamedTuple, Union, List, Dict, Iterable, Iterator
 from pathlib import Path
+from .cache import get_cache
+from .compression import expand_inputs, is_dataset, open_file
+from .helpers import get_file_extension
+from .json_backend import WRITE_BUFFER_SIZE, dumps
 from .logger import setup_logger
+from .metrics import count, file_size, stage, timed
+from .schema import cast_integers, resolve_schema, schema_dtypes
 
 
 
 
 logger = setup_logger(__name__)
 
+EXCEL_MAX_ROWS = 1_048_576
+
+# Columnar formats read and written through pyarrow, keyed by file extension.
+COLUMNAR_FORMATS = {".parquet": "parquet", ".pq": "parquet",
+                    ".feather": "ipc", ".arrow": "ipc", ".ipc": "ipc"}
+
 def read_json(file_path: Union[str, Path]) -> Union[Dict, List]:
-    """Reads a JSON file safely."""
+    """Reads a JSON file safely (optionally .gz/.bz2/.xz/.zst compressed)."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open_file(file_path, 'r') as f:
             data = json.load(f)
-        logger.info(f"Successfully read JSON file: {file_path}")
+        count("bytes_read", file_size(file_path))
+        logger.info("Successfully read JSON file: %s", file_path)
+        return data
+    except Exception as e:
+        logger.error("Error reading JSON file %s: %s", file_path, e)
+        raise
+
+def read_ndjson(file_path: Union[str, Path]) -> List:
+    """Reads a newline-delimited JSON file (optionally compressed) into a list of values."""
+    try:
+        with open_file(file_path, 'r') as f:
+            data = [json.loads(line) for line in f if line.strip()]
+        count("bytes_read", file_size(file_path))
+        logger.info("Successfully read NDJSON file: %s", file_path)
         return data
     except Exception as e:
-        logger.error(f"Error reading JSON file {file_path}: {e}")
+        logger.error("Error reading NDJSON file %s: %s", file_path, e)
         raise
 
-def save_json(data: Union[Dict, List], file_path: Union[str, Path]):
-    """Saves data to a JSON file."""
+def save_json(data: Union[Dict, List], file_path: Union[str, Path], indent: int = 4, backend: str = None):
+    """
+    Saves data to a JSON file, compressed when the path ends in .gz, .bz2, .xz or .zst.
+
+    Args:
+        data (Dict | List): Data to save.
+        file_path (str): Path to the output file.
+        indent (int): Spaces per indentation level; None writes compact JSON.
+        backend (str): JSON serializer: "orjson", "ujson", "json" or "auto"
+                       (default: DATAOPS_JSON_BACKEND, else the fastest installed).
+    """
+    try:
+        with stage("serialize") as timer:
+            encoded = dumps(data, indent=indent, backend=backend)
+            timer.rows = len(data) if isinstance(data, list) else 1
+        with stage("write") as timer:
+            with open_file(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(encoded)
+            timer.rows = len(data) if isinstance(data, list) else 1
+        count("bytes_written", file_size(file_path))
+        logger.info("Successfully saved JSON to: %s", file_path)
+    except Exception as e:
+        logger.error("Error saving JSON file %s: %s", file_path, e)
+        raise
+
+def save_json_stream(chunks: Iterable[List[Dict]], file_path: Union[str, Path], output_format: str = "array",
+                     indent: int = 4, backend: str = None):
+    """
+    Writes batches of records to a JSON file incrementally.
+
+    Only one batch is held in memory at a time, and each batch is serialized
+    in one call. The "array" format produces the same document as save_json;
+    "ndjson" writes one compact record per line.
+    Paths ending in .gz, .bz2, .xz or .zst are compressed while writing.
+
+    Args:
+        chunks (Iterable[List[Dict]]): Batches of records to write.
+        file_path (str): Path to the output file.
+        output_format (str): "array" or "ndjson".
+        indent (int): Spaces per indentation level of the array; None writes compact JSON.
+        backend (str): JSON serializer (see save_json).
+    """
+    if output_format not in ("array", "ndjson"):
+        raise ValueError(f"Unsupported JSON output format: {output_format}")
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
-        logger.info(f"Successfully saved JSON to: {file_path}")
+        records_written = 0
+        with stage("write") as timer, open_file(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            if output_format == "array":
+                f.write(b"[")
+            for records in chunks:
+                if not len(records):
+                    continue
+                with stage("serialize") as batch:
+                    if output_format == "ndjson":
+                        body = b"\n".join(dumps(record, backend=backend) for record in records) + b"\n"
+                    else:
+                        # Drop the batch's own brackets: '[' and ']' ('\n]' when indented)
+                        body = dumps(records, indent=indent, backend=backend)
+                        body = (b"," if records_written else b"") + (body[1:-1] if indent is None else body[1:-2])
+                    batch.rows = len(records)
+                f.write(body)
+                records_written += len(records)
+            if output_format == "array":
+                f.write(b"\n]" if records_written and indent is not None else b"]")
+            timer.rows = records_written
+        count("bytes_written", file_size(file_path))
+        logger.info("Successfully streamed %s records to: %s", records_written, file_path)
     except Exception as e:
-        logger.error(f"Error saving JSON file {file_path}: {e}")
+        logger.error("Error saving JSON file %s: %s", file_path, e)
         raise
 
-def read_csv(file_path: Union[str, Path]) -> pd.DataFrame:
-    """Reads a CSV file into a Pandas DataFrame."""
+def read_csv(file_path: Union[str, Path], columns: List[str] = None, dtype=None) -> pd.DataFrame:
+    """
+    Reads a CSV file (optionally only some columns) into a Pandas DataFrame.
+    When the parse cache is enabled (see utils.cache), a previously parsed
+    copy of an unchanged file is loaded instead.
+    """
     try:
-        df = pd.read_csv(file_path)
-        logger.info(f"Successfully read CSV file: {file_path} with shape {df.shape}")
+        cache = get_cache()
+        if cache is not None:
+            df = cache.load(file_path, lambda: pd.read_csv(file_path, usecols=columns, dtype=dtype),
+                            columns=columns, dtype=dtype)
+        else:
+            df = pd.read_csv(file_path, usecols=columns, dtype=dtype)
+        logger.info("Successfully read CSV file: %s with shape %s", file_path, df.shape)
         return df
     except Exception as e:
-        logger.error(f"Error reading CSV file {file_path}: {e}")
+        logger.error("Error reading CSV file %s: %s", file_path, e)
+        raise
+
+def read_csv_chunks(file_path: Union[str, Path], chunksize: int, dtype=None,
+                    columns: List[str] = None) -> Iterator[pd.DataFrame]:
+    """Reads a CSV file lazily as DataFrames of at most 'chunksize' rows."""
+    try:
+        reader = pd.read_csv(file_path, chunksize=chunksize, dtype=dtype, usecols=columns)
+        logger.info("Streaming CSV file: %s in chunks of %s rows", file_path, chunksize)
+    except Exception as e:
+        logger.error("Error reading CSV file %s: %s", file_path, e)
+        raise
+    with reader:
+        yield from reader
+
+def read_csv_columns(file_path: Union[str, Path]) -> List[str]:
+    """Reads only the header row of a CSV file."""
+    try:
+        return list(pd.read_csv(file_path, nrows=0).columns)
+    except Exception as e:
+        logger.error("Error reading CSV header %s: %s", file_path, e)
+        raise
+
+def save_csv_stream(chunks: Iterable[pd.DataFrame], file_path: Union[str, Path], columns: List[str] = None):
+    """
+    Writes DataFrame chunks to a CSV file one at a time, compressed when the
+    path ends in .gz, .bz2, .xz or .zst.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): DataFrames to write, in order.
+        file_path (str): Path to the output CSV file.
+        columns (List[str]): Output columns. Defaults to the first chunk's
+                             columns; chunks are aligned to them.
+    """
+    try:
+        total_rows = 0
+        header_written = False
+        with open_file(file_path, 'w', newline='') as f:
+            for chunk in chunks:
+                if columns is None:
+                    columns = list(chunk.columns)
+                elif list(chunk.columns) != columns:
+                    chunk = chunk.reindex(columns=columns)
+                chunk.to_csv(f, index=False, header=not header_written)
+                header_written = True
+                total_rows += len(chunk)
+            if not header_written and columns:
+                pd.DataFrame(columns=columns).to_csv(f, index=False)
+        logger.info("Successfully streamed %s rows to CSV file: %s", total_rows, file_path)
+    except Exception as e:
+        logger.error("Error saving CSV file %s: %s", file_path, e)
+        raise
+
+def _columnar_format(file_path: Union[str, Path]) -> str:
+    return COLUMNAR_FORMATS.get(get_file_extension(str(file_path)))
+
+def is_columnar(file_path: Union[str, Path]) -> bool:
+    """Tells whether a path has a Parquet or Arrow IPC/Feather extension."""
+    return _columnar_format(file_path) is not None
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for Parquet and Feather files: pip install pyarrow") from None
+    return pyarrow
+
+def _arrow_filter(filters):
+    """Converts DNF filters, e.g. [("age", ">", 30)], to a pyarrow expression."""
+    import pyarrow.parquet as pq
+    return pq.filters_to_expression(filters) if filters else None
+
+def _arrow_dataset(file_path: Union[str, Path]):
+    _require_pyarrow()
+    import pyarrow.dataset as ds
+    return ds.dataset(str(file_path), format=_columnar_format(file_path))
+
+_FILTER_OPS = {
+    "=": lambda values, v: values == v, "==": lambda values, v: values == v,
+    "!=": lambda values, v: values != v, "<": lambda values, v: values < v,
+    "<=": lambda values, v: values <= v, ">": lambda values, v: values > v,
+    ">=": lambda values, v: values >= v, "in": lambda values, v: values.isin(v),
+    "not in": lambda values, v: ~values.isin(v),
+}
+
+def filter_frame(df: pd.DataFrame, filters) -> pd.DataFrame:
+    """
+    Applies DNF filters (the pyarrow/pandas.read_parquet format) to a DataFrame.
+
+    'filters' is a list of (column, op, value) tuples that must all hold, or a
+    list of such lists of which any may hold. Text columns are compared as
+    numbers when the filter value is numeric.
+    """
+    if not filters:
+        return df
+    groups = filters if isinstance(filters[0], list) else [filters]
+    keep = pd.Series(False, index=df.index)
+    for group in groups:
+        mask = pd.Series(True, index=df.index)
+        for col, op, value in group:
+            values = df[col]
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and not pd.api.types.is_numeric_dtype(values):
+                values = pd.to_numeric(values, errors="coerce")
+            if op not in _FILTER_OPS:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            mask &= _FILTER_OPS[op](values, value).fillna(False).astype(bool)
+        keep |= mask
+    return df[keep]
+
+def _as_text(df: pd.DataFrame) -> pd.DataFrame:
+    """Converts typed columns to their text form, keeping nulls, like a CSV read with dtype=str."""
+    df = df.copy()
+    for col in df.columns:
+        if df[col].dtype != object:
+            values = df[col]
+            df[col] = values.astype(str).astype(object).where(values.notna(), None)
+    return df
+
+def read_columnar(file_path: Union[str, Path], columns: List[str] = None, filters=None) -> pd.DataFrame:
+    """
+    Reads a Parquet or Arrow IPC/Feather file into a DataFrame.
+
+    Only 'columns' are read, and 'filters' (DNF tuples) are pushed down so
+    Parquet row groups whose statistics exclude them are skipped.
+    """
+    try:
+        table = _arrow_dataset(file_path).to_table(columns=columns, filter=_arrow_filter(filters))
+        df = table.to_pandas()
+        logger.info("Successfully read columnar file: %s with shape %s", file_path, df.shape)
+        return df
+    except Exception as e:
+        logger.error("Error reading columnar file %s: %s", file_path, e)
+        raise
+
+def read_columnar_chunks(file_path: Union[str, Path], chunksize: int, columns: List[str] = None,
+                         filters=None) -> Iterator[pd.DataFrame]:
+    """Reads a Parquet or Arrow IPC/Feather file lazily as record batches of at most 'chunksize' rows."""
+    try:
+        batches = _arrow_dataset(file_path).to_batches(columns=columns, filter=_arrow_filter(filters),
+                                                       batch_size=chunksize)
+        logger.info("Streaming columnar file: %s in chunks of %s rows", file_path, chunksize)
+    except Exception as e:
+        logger.error("Error reading columnar file %s: %s", file_path, e)
+        raise
+    for batch in batches:
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+def save_columnar(df: pd.DataFrame, file_path: Union[str, Path]):
+    """Saves a DataFrame to a Parquet or Arrow IPC/Feather file (by extension)."""
+    try:
+        _require_pyarrow()
+        if _columnar_format(file_path) == "parquet":
+            df.to_parquet(file_path, index=False)
+        else:
+            df.reset_index(drop=True).to_feather(file_path)
+        logger.info("Successfully saved columnar file to: %s", file_path)
+    except Exception as e:
+        logger.error("Error saving columnar file %s: %s", file_path, e)
+        raise
+
+def save_columnar_stream(chunks: Iterable[pd.DataFrame], file_path: Union[str, Path], columns: List[str] = None):
+    """
+    Writes DataFrame chunks to a Parquet file (one row group per chunk) or an
+    Arrow IPC/Feather file (one record batch per chunk).
+
+    The schema is taken from the first chunk; columns that are entirely null
+    there are typed as strings. Later chunks are cast to that schema.
+    """
+    pa = _require_pyarrow()
+    import pyarrow.parquet as pq
+
+    try:
+        writer = None
+        schema = None
+        total_rows = 0
+        try:
+            for chunk in chunks:
+                if columns is None:
+                    columns = list(chunk.columns)
+                elif list(chunk.columns) != columns:
+                    chunk = chunk.reindex(columns=columns)
+                if schema is None:
+                    schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                    for i, field in enumerate(schema):
+                        if pa.types.is_null(field.type):
+                            schema = schema.set(i, field.with_type(pa.string()))
+                    schema = schema.remove_metadata()
+                    if _columnar_format(file_path) == "parquet":
+                        writer = pq.ParquetWriter(str(file_path), schema)
+                    else:
+                        writer = pa.ipc.new_file(str(file_path), schema)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                total_rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            save_columnar(pd.DataFrame(columns=columns or []), file_path)
+        logger.info("Successfully streamed %s rows to columnar file: %s", total_rows, file_path)
+    except Exception as e:
+        logger.error("Error saving columnar file %s: %s", file_path, e)
         raise
 
+def _with_filter_columns(columns: List[str], filters) -> List[str]:
+    """Adds the columns referenced by 'filters' to a CSV column selection."""
+    if not columns or not filters:
+        return columns
+    groups = filters if isinstance(filters[0], list) else [filters]
+    return list(dict.fromkeys(columns + [col for group in groups for col, _, _ in group]))
+
 def save_excel(df: pd.DataFrame, file_path: Union[str, Path]):
     """Saves a DataFrame to an Excel file."""
     try:
         df.to_excel(file_path, index=False)
-        logger.info(f"Successfully saved Excel file to: {file_path}")
+        logger.info("Successfully saved Excel file to: %s", file_path)
+    except Exception as e:
+        logger.error("Error saving Excel file %s: %s", file_path, e)
+        raise
+
+def _is_container(value) -> bool:
+    return isinstance(value, (list, dict, tuple, set))
+
+def _excel_rows(df: pd.DataFrame):
+    """Yields the rows of a DataFrame as lists of values openpyxl can write."""
+    # Mirror DataFrame.to_excel, which writes containers as their str()
+    container_cols = [col for col in df.columns if df[col].dtype == object and df[col].map(_is_container).any()]
+    df = df.astype(object).where(df.notna(), None)
+    for col in container_cols:
+        df[col] = df[col].map(lambda v: str(v) if _is_container(v) else v)
+    for values in df.itertuples(index=False, name=None):
+        yield list(values)
+
+def save_excel_stream(chunks: Iterable[pd.DataFrame], file_path: Union[str, Path], columns: List[str] = None,
+                      max_rows: int = EXCEL_MAX_ROWS):
+    """
+    Writes DataFrame chunks to an Excel file using openpyxl's write-only mode.
+
+    Rows are appended as chunks arrive, so memory does not grow with the
+    output size. When a sheet reaches 'max_rows' rows (header included) the
+    writer continues on a new sheet (Sheet1, Sheet2, ...) with the same header.
+
+    Args:
+        chunks (Iterable[pd.DataFrame]): DataFrames to write, in order.
+        file_path (str): Path to the output Excel file.
+        columns (List[str]): Output columns. Defaults to the first chunk's
+                             columns; chunks are aligned to them.
+        max_rows (int): Maximum rows per sheet, including the header.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    try:
+        workbook = Workbook(write_only=True)
+        sheet = None
+        sheet_rows = 0
+        total_rows = 0
+
+        def new_sheet():
+            ws = workbook.create_sheet(f"Sheet{len(workbook.worksheets) + 1}")
+            header = []
+            for name in columns or []:
+                cell = WriteOnlyCell(ws, value=name)
+                cell.font = Font(bold=True)
+                header.append(cell)
+            ws.append(header)
+            return ws
+
+        for chunk in chunks:
+            if columns is None:
+                columns = list(chunk.columns)
+            elif list(chunk.columns) != columns:
+                chunk = chunk.reindex(columns=columns)
+            for values in _excel_rows(chunk):
+                if sheet is None or sheet_rows >= max_rows:
+                    sheet = new_sheet()
+                    sheet_rows = 1
+                sheet.append(values)
+                sheet_rows += 1
+                total_rows += 1
+
+        if sheet is None:
+            new_sheet()
+        workbook.save(file_path)
+        logger.info("Successfully streamed %s rows to Excel file: %s", total_rows, file_path)
     except Exception as e:
-        logger.error(f"Error saving Excel file {file_path}: {e}")
+        logger.error("Error saving Excel file %s: %s", file_path, e)
         raise
+
+def _read_csv_table(file_path, columns=None, filters=None, dtype=None) -> pd.DataFrame:
+    df = filter_frame(read_csv(file_path, columns=_with_filter_columns(columns, filters), dtype=dtype), filters)
+    return df[columns] if columns and filters else df
+
+def _read_csv_table_chunks(file_path, chunksize, columns=None, filters=None, dtype=None) -> Iterator[pd.DataFrame]:
+    chunks = read_csv_chunks(file_path, chunksize, dtype=dtype, columns=_with_filter_columns(columns, filters))
+    if not filters:
+        return chunks
+    return (filter_frame(chunk, filters)[columns] if columns else filter_frame(chunk, filters) for chunk in chunks)
+
+def _save_csv(df: pd.DataFrame, file_path: Union[str, Path]):
+    df.to_csv(file_path, index=False)
+    logger.info("Successfully saved CSV file to: %s", file_path)
+
+def _read_columnar_table(file_path, columns=None, filters=None, dtype=None) -> pd.DataFrame:
+    df = read_columnar(file_path, columns=columns, filters=filters)
+    return _as_text(df) if dtype is str else df
+
+def _read_columnar_table_chunks(file_path, chunksize, columns=None, filters=None, dtype=None) -> Iterator[pd.DataFrame]:
+    chunks = read_columnar_chunks(file_path, chunksize, columns=columns, filters=filters)
+    return (_as_text(chunk) for chunk in chunks) if dtype is str else chunks
+
+def _read_columnar_columns(file_path) -> List[str]:
+    try:
+        return list(_arrow_dataset(file_path).schema.names)
+    except Exception as e:
+        logger.error("Error reading columnar schema %s: %s", file_path, e)
+        raise
+
+def _count_columnar_rows(file_path) -> int:
+    return _arrow_dataset(file_path).count_rows()
+
+class TableFormat(NamedTuple):
+    """
+    Reader and writer functions for one tabular file format.
+
+    read(path, columns, filters, dtype) and read_chunks(path, chunksize,
+    columns, filters, dtype) return DataFrames; write(df, path) and
+    write_stream(chunks, path, columns) save them. Operations a format does
+    not support are None.
+    """
+    name: str
+    read: Callable = None
+    read_chunks: Callable = None
+    read_columns: Callable = None
+    count_rows: Callable = None
+    write: Callable = None
+    write_stream: Callable = None
+
+_FORMATS: Dict[str, TableFormat] = {}
+
+def register_format(extensions: List[str], table_format: TableFormat):
+    """Registers a format for the given file extensions (e.g. [".tsv"]), replacing any previous one."""
+    for extension in extensions:
+        _FORMATS[extension.lower()] = table_format
+
+def get_format(file_path: Union[str, Path]) -> TableFormat:
+    """Returns the registered format for a path's extension; unknown extensions are read as CSV."""
+    return _FORMATS.get(get_file_extension(str(file_path)), _FORMATS[".csv"])
+
+def _format_operation(file_path: Union[str, Path], operation: str) -> Callable:
+    table_format = get_format(file_path)
+    func = getattr(table_format, operation)
+    if func is None:
+        raise ValueError(f"{table_format.name} files do not support '{operation}': {file_path}")
+    return func
+
+register_format([".csv"], TableFormat(
+    "csv", read=_read_csv_table, read_chunks=_read_csv_table_chunks, read_columns=read_csv_columns,
+    write=_save_csv, write_stream=save_csv_stream))
+register_format([".xlsx"], TableFormat("excel", write=save_excel, write_stream=save_excel_stream))
+for _extension, _name in COLUMNAR_FORMATS.items():
+    register_format([_extension], TableFormat(
+        _name, read=_read_columnar_table, read_chunks=_read_columnar_table_chunks,
+        read_columns=_read_columnar_columns, count_rows=_count_columnar_rows,
+        write=save_columnar, write_stream=save_columnar_stream))
+
+def _table_schema(file_path: Union[str, Path], schema) -> Dict:
+    """Resolves a schema argument for a text input; columnar files already carry their types."""
+    if schema is None or is_columnar(file_path):
+        return None
+    return resolve_schema(schema, file_path)
+
+def _input_bytes(file_path: Union[str, Path]) -> int:
+    """On-disk size of a file or dataset, for the bytes_read metric."""
+    return sum(file_size(file) for file in expand_inputs(file_path))
+
+def _read_dataset(file_path: Union[str, Path], **options) -> pd.DataFrame:
+    files = expand_inputs(file_path)
+    logger.info("Reading dataset %s (%s files)", file_path, len(files))
+    # Files are decompressed and parsed concurrently; the C parser and zlib release the GIL
+    with ThreadPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as pool:
+        frames = list(pool.map(lambda file: read_table(file, **options), files))
+    return pd.concat(frames, ignore_index=True)
+
+def read_table(file_path: Union[str, Path], columns: List[str] = None, filters=None, dtype=None,
+               schema=None) -> pd.DataFrame:
+    """
+    Reads a tabular file into a DataFrame using the format registered for its extension.
+
+    Compressed files (.gz, .bz2, .xz, .zst) are decompressed while parsing, and a
+    directory or glob pattern is read as one dataset: its files concatenated in
+    sorted order, aligned to the union of their columns.
+
+    Args:
+        file_path (str): Path to the input file.
+        columns (List[str]): Optional columns to read; other columns are never parsed.
+        filters: Optional DNF row filters, e.g. [("age", ">", 30)].
+        dtype: Passed to pd.read_csv; with str, columnar values are converted to text.
+        schema (str | Dict): Optional column types for CSV input (see utils.schema):
+                             a dict, a schema file, or "auto" to infer and save
+                             one next to the file. Ignored when 'dtype' is given.
+                             If the file does not match, it is read untyped.
+    """
+    with stage("read") as timer:
+        df = _read_table(file_path, columns=columns, filters=filters, dtype=dtype, schema=schema)
+        timer.rows = len(df)
+    count("bytes_read", _input_bytes(file_path))
+    return df
+
+def _read_table(file_path, columns=None, filters=None, dtype=None, schema=None) -> pd.DataFrame:
+    if is_dataset(file_path):
+        return _read_dataset(file_path, columns=columns, filters=filters, dtype=dtype, schema=schema)
+    read = _format_operation(file_path, "read")
+    schema = _table_schema(file_path, schema) if dtype is None else None
+    if schema:
+        try:
+            df = read(file_path, columns=columns, filters=filters, dtype=schema_dtypes(schema))
+            return cast_integers(df, schema)
+        except (ValueError, TypeError) as e:
+            logger.warning("%s does not match its schema (%s); reading without it", file_path, e)
+    return read(file_path, columns=columns, filters=filters, dtype=dtype)
+
+def read_table_chunks(file_path: Union[str, Path], chunksize: int, dtype=None, columns: List[str] = None,
+                      filters=None, schema=None) -> Iterator[pd.DataFrame]:
+    """
+    Reads a tabular file lazily in chunks.
+
+    With dtype=str, columnar values are converted to text so they mix with
+    CSV text consistently. A 'schema' (see read_table) gives every chunk the
+    same column types; integers stay Int64 so chunks remain compatible.
+    Datasets (directories or globs) yield the chunks of each file in turn.
+    """
+    if is_dataset(file_path):
+        return (chunk for file in expand_inputs(file_path)
+                for chunk in read_table_chunks(file, chunksize, dtype=dtype, columns=columns, filters=filters,
+                                               schema=schema))
+    read_chunks = _format_operation(file_path, "read_chunks")
+    schema = _table_schema(file_path, schema) if dtype is None else None
+    count("bytes_read", file_size(file_path))
+    if not schema:
+        return timed(read_chunks(file_path, chunksize, columns=columns, filters=filters, dtype=dtype), "read")
+    chunks = read_chunks(file_path, chunksize, columns=columns, filters=filters, dtype=schema_dtypes(schema))
+    return timed((cast_integers(chunk, schema, downcast=False) for chunk in chunks), "read")
+
+def read_table_columns(file_path: Union[str, Path]) -> List[str]:
+    """Reads only the column names of a tabular file, or their union (in order) across a dataset."""
+    if is_dataset(file_path):
+        files = expand_inputs(file_path)
+        return list(dict.fromkeys(col for file in files for col in read_table_columns(file)))
+    return _format_operation(file_path, "read_columns")(file_path)
+
+def count_table_rows(file_path: Union[str, Path]) -> int:
+    """Returns the exact row count when the format stores it (columnar files), otherwise None."""
+    if is_dataset(file_path):
+        counts = [count_table_rows(file) for file in expand_inputs(file_path)]
+        return None if None in counts else sum(counts)
+    count_rows = get_format(file_path).count_rows
+    return count_rows(file_path) if count_rows else None
+
+def save_table(df: pd.DataFrame, file_path: Union[str, Path]):
+    """Saves a DataFrame using the format registered for the path's extension."""
+    with stage("write") as timer:
+        _format_operation(file_path, "write")(df, file_path)
+        timer.rows = len(df)
+    count("bytes_written", file_size(file_path))
+
+def save_table_stream(chunks: Iterable[pd.DataFrame], file_path: Union[str, Path], columns: List[str] = None):
+    """Streams DataFrame chunks to a file using the format registered for the path's extension."""
+    with stage("write") as timer:
+        def counted():
+            for chunk in chunks:
+                timer.rows += len(chunk)
+                yield chunk
+
+        _format_operation(file_path, "write_stream")(counted(), file_path, columns=columns)
+    count("bytes_written", file_size(file_path))
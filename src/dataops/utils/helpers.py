@@ -1,3 +1,4 @@
+import re
 from pathlib import Path
 
 def ensure_directory(file_path: str):
@@ -5,6 +6,47 @@ def ensure_directory(file_path: str):
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+def strip_compression_suffix(file_path: str) -> str:
+    """Removes a compression suffix (.gz, .bz2, .xz, .zst), e.g. 'a.csv.gz' -> 'a.csv'."""
+    path = Path(file_path)
+    return str(path.with_suffix("")) if path.suffix.lower() in COMPRESSION_SUFFIXES else str(file_path)
+
 def get_file_extension(file_path: str) -> str:
-    """Returns the file extension."""
-    return Path(file_path).suffix.lower()
+    """Returns the file extension, ignoring any compression suffix ('a.csv.gz' -> '.csv')."""
+    return Path(strip_compression_suffix(file_path)).suffix.lower()
+
+_SIZE_UNITS = {"": 1, "B": 1, "K": 1024, "KB": 1024, "M": 1024 ** 2, "MB": 1024 ** 2,
+               "G": 1024 ** 3, "GB": 1024 ** 3, "T": 1024 ** 4, "TB": 1024 ** 4}
+
+def parse_size(size) -> int:
+    """Parses a byte size such as 2048, '512MB' or '2GB' (binary units) into bytes."""
+    if isinstance(size, (int, float)):
+        return int(size)
+    text = str(size).strip().upper().replace(" ", "")
+    number = text.rstrip("BKMGT")
+    unit = text[len(number):]
+    try:
+        return int(float(number) * _SIZE_UNITS[unit])
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid size: {size!r}") from None
+
+_FILTER_PATTERN = re.compile(r"^\s*(.+?)\s*(==|!=|<=|>=|=|<|>)\s*(.*?)\s*$")
+
+def parse_filter(expression: str):
+    """
+    Parses a row filter such as 'age>=30' or 'status==active' into a
+    (column, op, value) tuple. Numeric values are converted to numbers.
+    """
+    match = _FILTER_PATTERN.match(expression)
+    if not match:
+        raise ValueError(f"Invalid filter: {expression!r}")
+    column, op, value = match.groups()
+    for cast in (int, float):
+        try:
+            value = cast(value)
+            break
+        except ValueError:
+            pass
+    return column, "==" if op == "=" else op, value
@@ -0,0 +1,136 @@
+import datetime
+import json
+import math
+import os
+from typing import Any, Callable, Dict
+
+# Serializers tried in order when no backend is requested. orjson and ujson
+# are optional; "json" is the standard library and always available.
+JSON_BACKENDS = ("orjson", "ujson", "json")
+ENV_BACKEND = "DATAOPS_JSON_BACKEND"
+
+# Output files are written through a binary buffer of this size
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _default(obj: Any) -> Any:
+    """Encodes values the backends do not know: pandas/numpy scalars and dates."""
+    if isinstance(obj, (datetime.date, datetime.time)):
+        # pd.NaT is a datetime subclass whose isoformat() is 'NaT'
+        return None if obj != obj else obj.isoformat()
+    if type(obj).__name__ == "NAType":
+        return None
+    if hasattr(obj, "item") and hasattr(obj, "dtype"):
+        # numpy scalar
+        value = obj.item()
+        return None if isinstance(value, float) and not math.isfinite(value) else value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_nan(obj: Any) -> Any:
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_nan(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_nan(value) for value in obj]
+    return obj
+
+
+def _reindent(data: bytes, indent: int) -> bytes:
+    """Turns 2-space indentation (orjson's only option) into 'indent' spaces."""
+    if indent == 2:
+        return data
+    depth = 0
+    while b"\n" + b"  " * (depth + 1) in data:
+        depth += 1
+    # Deepest levels first, through tabs: JSON strings never contain raw tabs or newlines
+    for level in range(depth, 0, -1):
+        data = data.replace(b"\n" + b"  " * level, b"\n" + b"\t" * level)
+    return data.replace(b"\t", b" " * indent)
+
+
+def _dumps_orjson(obj: Any, indent: int = None) -> bytes:
+    import orjson
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent is None:
+        return orjson.dumps(obj, default=_default, option=option)
+    return _reindent(orjson.dumps(obj, default=_default, option=option | orjson.OPT_INDENT_2), indent)
+
+
+def _dumps_ujson(obj: Any, indent: int = None) -> bytes:
+    import ujson
+
+    def encode(value):
+        return ujson.dumps(value, indent=indent or 0, ensure_ascii=False, escape_forward_slashes=False,
+                           default=_default, allow_nan=False).encode("utf-8")
+
+    if indent == 0:
+        # ujson treats indent=0 as compact output
+        return _dumps_json(obj, indent)
+    try:
+        return encode(obj)
+    except (OverflowError, ValueError):
+        return encode(_replace_nan(obj))
+
+
+def _dumps_json(obj: Any, indent: int = None) -> bytes:
+    separators = (",", ":") if indent is None else (",", ": ")
+
+    def encode(value):
+        return json.dumps(value, indent=indent, separators=separators, ensure_ascii=False,
+                          default=_default, allow_nan=False).encode("utf-8")
+
+    try:
+        return encode(obj)
+    except ValueError:
+        # NaN/Infinity: the encoder rejects them instead of calling 'default'
+        return encode(_replace_nan(obj))
+
+
+_ENCODERS: Dict[str, Callable[..., bytes]] = {
+    "orjson": _dumps_orjson,
+    "ujson": _dumps_ujson,
+    "json": _dumps_json,
+}
+
+
+def _is_installed(backend: str) -> bool:
+    try:
+        __import__(backend)
+        return True
+    except ImportError:
+        return False
+
+
+def available_backends():
+    """Returns the installed JSON backends, fastest first."""
+    return [backend for backend in JSON_BACKENDS if _is_installed(backend)]
+
+
+def get_json_backend(backend: str = None) -> str:
+    """
+    Resolves a backend name: 'backend', else DATAOPS_JSON_BACKEND, else the
+    fastest installed one. "auto" also picks the fastest installed backend.
+    """
+    backend = (backend or os.environ.get(ENV_BACKEND) or "auto").lower()
+    if backend == "auto":
+        return available_backends()[0]
+    if backend not in _ENCODERS:
+        raise ValueError(f"Unsupported JSON backend: {backend} (choose from {', '.join(JSON_BACKENDS)} or auto)")
+    if not _is_installed(backend):
+        raise ImportError(f"JSON backend '{backend}' is not installed: pip install {backend}")
+    return backend
+
+
+def dumps(obj: Any, indent: int = None, backend: str = None) -> bytes:
+    """
+    Serializes 'obj' to UTF-8 JSON bytes.
+
+    Every backend produces the same document, up to the notation of some
+    floats (6e-05 or 0.00006): non-ASCII text is kept as is, NaN, infinities,
+    NaT and pd.NA become null, numpy scalars become numbers and dates are
+    written in ISO 8601. 'indent' None writes compact JSON.
+    """
+    return _ENCODERS[get_json_backend(backend)](obj, indent)
@@ -0,0 +1,174 @@
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterator, Tuple, Union
+
+from .compression import open_file
+from .metrics import count, file_size
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class MixedListError(ValueError):
+    """Raised when a list that started with objects turns out to contain other values."""
+
+
+class _Scanner:
+    """Buffered cursor over a text stream that decodes one JSON value at a time."""
+
+    def __init__(self, f, chunk_size: int):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        data = self._f.read(size)
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skips whitespace and returns the next character ('' at end of input)."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Malformed JSON: expected {char!r}, found {found or 'end of input'!r}")
+        self._pos += 1
+
+    def decode(self):
+        """Decodes the complete JSON value at the cursor, reading more input as needed."""
+        if self.peek() == "":
+            raise ValueError("Malformed JSON: unexpected end of input")
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A value ending exactly at the buffer edge may be a truncated number.
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            # Grow reads geometrically so large values are not re-decoded too often.
+            self._fill(max(self._chunk_size, len(self._buf)))
+
+
+def _join(parent_path: str, key) -> str:
+    return f"{parent_path}_{key}" if parent_path else str(key)
+
+
+def _iter_object_list(scanner: _Scanner, path: str) -> Iterator[Tuple[str, Dict]]:
+    """Yields the objects of a list whose first element is an object, consuming the closing ']'."""
+    while True:
+        if scanner.peek() != "{":
+            raise MixedListError(f"List at '{path}' mixes objects with other values")
+        yield path, scanner.decode()
+        if scanner.peek() == "]":
+            scanner.expect("]")
+            return
+        scanner.expect(",")
+
+
+def _walk(scanner: _Scanner) -> Iterator[Tuple[str, Dict]]:
+    stack = []  # frames of [kind, path, items_seen]
+    path = ""
+    expecting_value = True
+
+    while True:
+        if expecting_value:
+            char = scanner.peek()
+            if char == "{":
+                scanner.expect("{")
+                stack.append(["dict", path, 0])
+            elif char == "[":
+                scanner.expect("[")
+                char = scanner.peek()
+                if char == "{":
+                    yield from _iter_object_list(scanner, path)
+                elif char == "]":
+                    scanner.expect("]")
+                else:
+                    stack.append(["list", path, 1])
+                    path = _join(path, 0)
+                    continue
+            else:
+                scanner.decode()
+            expecting_value = False
+
+        if not stack:
+            return
+
+        frame = stack[-1]
+        closing = "}" if frame[0] == "dict" else "]"
+        if scanner.peek() == closing:
+            scanner.expect(closing)
+            stack.pop()
+            continue
+        if frame[2] > 0:
+            scanner.expect(",")
+
+        if frame[0] == "dict":
+            key = scanner.decode()
+            if not isinstance(key, str):
+                raise ValueError(f"Malformed JSON: object key must be a string, found {key!r}")
+            scanner.expect(":")
+            path = _join(frame[1], key)
+        else:
+            path = _join(frame[1], frame[2])
+        frame[2] += 1
+        expecting_value = True
+
+
+def iter_json_objects(file_path: Union[str, Path], chunk_size: int = 1 << 16) -> Iterator[Tuple[str, Dict]]:
+    """
+    Incrementally parses a JSON file and yields (path, object) pairs for every
+    object inside a list of objects, in document order.
+
+    Produces the same objects as find_lists_of_objects on the fully loaded
+    document, without ever holding more than one list element in memory.
+    A list is classified by its first element; if a list that started with
+    objects later contains another value, MixedListError is raised and the
+    caller should fall back to the in-memory traversal.
+
+    Args:
+        file_path (str): Path to the JSON file (optionally compressed).
+        chunk_size (int): Number of characters read from disk at a time.
+    """
+    count("bytes_read", file_size(file_path))
+    with open_file(file_path, "r") as f:
+        scanner = _Scanner(f, chunk_size)
+        yield from _walk(scanner)
+        if scanner.peek() != "":
+            raise ValueError("Malformed JSON: extra data after the top-level value")
+
+
+def iter_ndjson_objects(file_path: Union[str, Path]) -> Iterator[Tuple[str, Dict]]:
+    """
+    Yields ("", object) pairs from a newline-delimited JSON file.
+
+    The file is treated as a top-level list with one element per non-empty
+    line. Raises MixedListError if any line is not an object, in which case
+    the caller should load the lines and use find_lists_of_objects.
+    """
+    count("bytes_read", file_size(file_path))
+    with open_file(file_path, "r") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            value = json.loads(line)
+            if not isinstance(value, dict):
+                raise MixedListError(f"NDJSON file {file_path} mixes objects with other values")
+            yield "", value
@@ -1,43 +1,266 @@
+import atexit
 import logging
-import sys
+import logging.handlers
 import os
+import queue
+import sys
+import threading
 from pathlib import Path
+from typing import Dict, List
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+LOG_FILE_NAME = "dataops.log"
+
+# Defaults, overridable through the environment or configure_logging():
+# DATAOPS_LOG_DIR=<dir>, DATAOPS_LOG_ASYNC=1 for background logging, with
+# DATAOPS_LOG_QUEUE_SIZE records queued at most and DATAOPS_LOG_OVERFLOW
+# "block" (wait for the writer) or "drop" (discard records) once it is full.
+ENV_LOG_DIR = "DATAOPS_LOG_DIR"
+ENV_LOG_ASYNC = "DATAOPS_LOG_ASYNC"
+ENV_LOG_QUEUE_SIZE = "DATAOPS_LOG_QUEUE_SIZE"
+ENV_LOG_OVERFLOW = "DATAOPS_LOG_OVERFLOW"
+
+DEFAULT_LOG_DIR = "logs"
+DEFAULT_QUEUE_SIZE = 10_000
+OVERFLOW_POLICIES = ("block", "drop")
+
+# The background writer flushes its files every FLUSH_RECORDS records, and
+# whenever it has been idle for FLUSH_INTERVAL seconds.
+FLUSH_RECORDS = 256
+FLUSH_INTERVAL = 1.0
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates its directory and file on the first record."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+
+class _BatchFlushMixin:
+    """Defers a stream handler's flush until FLUSH_RECORDS records are pending or flush_now() is called."""
+
+    _pending = 0
+
+    def flush(self):
+        self._pending += 1
+        if self._pending >= FLUSH_RECORDS:
+            self.flush_now()
+
+    def flush_now(self):
+        self._pending = 0
+        super().flush()
+
+    def close(self):
+        self.flush_now()
+        super().close()
+
+
+class _BatchStreamHandler(_BatchFlushMixin, logging.StreamHandler):
+    pass
+
+
+class _BatchFileHandler(_BatchFlushMixin, _LazyFileHandler):
+    pass
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """
+    Queues records for the background writer. The message is merged with its
+    arguments here (they may change later) but formatting and I/O happen in
+    the writer thread. A full queue blocks the caller or drops the record.
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow: str):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class _BatchingListener(logging.handlers.QueueListener):
+    """QueueListener whose handlers are flushed in batches and when the queue goes idle."""
+
+    def dequeue(self, block: bool):
+        while True:
+            try:
+                return self.queue.get(block=block, timeout=FLUSH_INTERVAL if block else None)
+            except queue.Empty:
+                if not block:
+                    raise
+                self.flush()
+
+    def enqueue_sentinel(self):
+        # The default put_nowait fails when the queue is full
+        self.queue.put(self._sentinel)
+
+    def flush(self):
+        for handler in self.handlers:
+            handler.flush_now()
+
+
+class _Sink:
+    """The handlers shared by every dataops logger writing to one log file."""
+
+    def __init__(self, log_file: Path, level: int, async_mode: bool, queue_size: int, overflow: str):
+        formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+        if async_mode:
+            outputs = [_BatchStreamHandler(sys.stdout), _BatchFileHandler(log_file, encoding="utf-8", delay=True)]
+        else:
+            # File opened on first use so importing modules has no side effects
+            outputs = [logging.StreamHandler(sys.stdout), _LazyFileHandler(log_file, encoding="utf-8", delay=True)]
+        for handler in outputs:
+            handler.setLevel(level)
+            handler.setFormatter(formatter)
+
+        self.outputs = outputs
+        self.listener = None
+        if async_mode:
+            self.queue_handler = _QueueHandler(queue.Queue(queue_size), overflow)
+            self.listener = _BatchingListener(self.queue_handler.queue, *outputs, respect_handler_level=True)
+            self.listener.start()
+            self.handlers = [self.queue_handler]
+        else:
+            self.handlers = outputs
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            dropped = self.queue_handler.dropped
+            if dropped:
+                record = logging.makeLogRecord({"name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                                                "msg": "Dropped %s log records (queue full)", "args": (dropped,)})
+                for handler in self.outputs:
+                    handler.handle(record)
+        for handler in self.outputs:
+            handler.close()
+
+
+_settings: Dict[str, any] = {}
+_sinks: Dict[tuple, _Sink] = {}
+_loggers: Dict[str, int] = {}
+_lock = threading.RLock()
+
+
+def _setting(name: str, env: str, default):
+    value = _settings.get(name)
+    if value is None:
+        value = os.environ.get(env) or default
+    return value
+
+
+def _current_sink(level: int) -> _Sink:
+    log_dir = _setting("log_dir", ENV_LOG_DIR, DEFAULT_LOG_DIR)
+    async_mode = _setting("async_mode", ENV_LOG_ASYNC, False)
+    if isinstance(async_mode, str):
+        async_mode = async_mode.lower() in ("1", "true", "yes", "on")
+    queue_size = int(_setting("queue_size", ENV_LOG_QUEUE_SIZE, DEFAULT_QUEUE_SIZE))
+    overflow = _setting("overflow", ENV_LOG_OVERFLOW, "block")
+    if overflow not in OVERFLOW_POLICIES:
+        raise ValueError(f"Unsupported log overflow policy: {overflow} (choose from {', '.join(OVERFLOW_POLICIES)})")
+
+    log_file = Path(log_dir, LOG_FILE_NAME).absolute()
+    key = (log_file, level, async_mode, queue_size, overflow)
+    if key not in _sinks:
+        _sinks[key] = _Sink(log_file, level, async_mode, queue_size, overflow)
+    return _sinks[key]
+
+
+def _attach(logger: logging.Logger, handlers: List[logging.Handler]):
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for handler in handlers:
+        logger.addHandler(handler)
+
 
 def setup_logger(name="dataops", level=logging.INFO):
     """
     Sets up a professional logger with stdout and file handlers.
-    Logs are saved to a 'logs' directory in the current working directory.
-    
+    Logs are saved to 'dataops.log' in DATAOPS_LOG_DIR (default: a 'logs'
+    directory in the current working directory), created when the first
+    record is written. Loggers share their handlers; with background logging
+    enabled (see configure_logging) they only enqueue records.
+
     Args:
         name (str): Name of the logger.
         level (int): Logging level (default: logging.INFO).
-        
+
     Returns:
         logging.Logger: Configured logger instance.
     """
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    if not logger.handlers:
-        # Formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-
-        # Stream Handler (Console)
-        stream_handler = logging.StreamHandler(sys.stdout)
-        stream_handler.setLevel(level)
-        stream_handler.setFormatter(formatter)
-        logger.addHandler(stream_handler)
-
-        # File Handler
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_dir / "dataops.log", encoding='utf-8')
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+    with _lock:
+        if not logger.handlers or name in _loggers:
+            _attach(logger, _current_sink(level).handlers)
+            _loggers[name] = level
 
     return logger
+
+
+def configure_logging(log_dir: str = None, async_mode: bool = None, queue_size: int = None, overflow: str = None):
+    """
+    Reconfigures every logger created by setup_logger, overriding the
+    DATAOPS_LOG_* environment variables (None keeps the environment's value).
+
+    Args:
+        log_dir (str): Directory for dataops.log.
+        async_mode (bool): Write records from a background thread, flushing
+                           files in batches, so logging calls never wait on I/O.
+        queue_size (int): Most records queued for the background writer.
+        overflow (str): When the queue is full, "block" until there is room
+                        or "drop" the record (the count is logged at shutdown).
+    """
+    with _lock:
+        _settings.clear()
+        _settings.update(log_dir=log_dir, async_mode=async_mode, queue_size=queue_size, overflow=overflow)
+        for name, level in _loggers.items():
+            _attach(logging.getLogger(name), _current_sink(level).handlers)
+        _close_unused()
+
+
+def logging_overrides() -> Dict[str, any]:
+    """Returns the settings passed to configure_logging (e.g. to repeat them in worker processes)."""
+    with _lock:
+        return {name: value for name, value in _settings.items() if value is not None}
+
+
+def _close_unused():
+    in_use = {id(handler) for name in _loggers for handler in logging.getLogger(name).handlers}
+    for key, sink in list(_sinks.items()):
+        if not any(id(handler) in in_use for handler in sink.handlers):
+            sink.close()
+            del _sinks[key]
+
+
+def shutdown_logging():
+    """Writes out queued records and closes the log files (also run at exit)."""
+    with _lock:
+        for sink in _sinks.values():
+            sink.close()
+        _sinks.clear()
+        for name in _loggers:
+            _attach(logging.getLogger(name), [])
+
+
+atexit.register(shutdown_logging)
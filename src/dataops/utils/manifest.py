@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Bytes hashed at the start and at the end of a file (or of the part already processed)
+SAMPLE_BYTES = 1 << 16
+
+
+def sample_digest(file_path: Union[str, Path], end: int = None) -> str:
+    """
+    Hashes the length and the first and last SAMPLE_BYTES bytes of the first
+    'end' bytes of a file (default: all of it). Cheap for any file size; with
+    the size and modification time it tells whether a file changed, and for a
+    grown file whether the part seen before is still its prefix.
+    """
+    if end is None:
+        end = os.path.getsize(file_path)
+    digest = hashlib.blake2b(str(end).encode(), digest_size=16)
+    with open(file_path, "rb") as f:
+        digest.update(f.read(min(end, SAMPLE_BYTES)))
+        if end > SAMPLE_BYTES:
+            f.seek(max(SAMPLE_BYTES, end - SAMPLE_BYTES))
+            digest.update(f.read(end - f.tell()))
+    return digest.hexdigest()
+
+
+def content_digest(file_path: Union[str, Path], end: int = None, block_size: int = 1 << 20) -> str:
+    """Hashes all of the first 'end' bytes of a file (default: all of it)."""
+    if end is None:
+        end = os.path.getsize(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        remaining = end
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def fingerprint(file_path: Union[str, Path], content: bool = False) -> Dict[str, Any]:
+    """
+    Returns the size, modification time and sampled digest of a file, and
+    with 'content' a digest of all its bytes (needed by is_appended).
+    """
+    stat = os.stat(file_path)
+    recorded = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": sample_digest(file_path, stat.st_size)}
+    if content:
+        recorded["content"] = content_digest(file_path, stat.st_size)
+    return recorded
+
+
+def is_unchanged(file_path: Union[str, Path], recorded: Dict[str, Any]) -> bool:
+    """Tells whether a file still matches a fingerprint recorded earlier."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return False
+    return (stat.st_size == recorded.get("size") and stat.st_mtime_ns == recorded.get("mtime_ns")
+            and sample_digest(file_path, stat.st_size) == recorded.get("digest"))
+
+
+def is_appended(file_path: Union[str, Path], recorded: Dict[str, Any]) -> bool:
+    """
+    Tells whether a file grew since its fingerprint was recorded, keeping its
+    old bytes as a prefix. The whole old prefix is hashed, so an edit anywhere
+    in it is caught; fingerprints recorded without 'content' never match.
+    """
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        return False
+    if "content" not in recorded or size <= recorded["size"]:
+        return False
+    # The sampled digest rejects most rewritten files without reading them
+    return (sample_digest(file_path, recorded["size"]) == recorded["digest"]
+            and content_digest(file_path, recorded["size"]) == recorded["content"])
+
+
+def options_key(options: Dict[str, Any]) -> str:
+    """Returns a stable string for the options a result depends on."""
+    return json.dumps(options, sort_keys=True, default=str)
+
+
+def _to_json(value):
+    # numpy scalars in reports
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+class Manifest:
+    """
+    A JSON checkpoint of completed work, so reruns can skip inputs that did
+    not change and resume or extend outputs.
+
+    Entries are free-form dicts keyed by job (e.g. "concat:<output>"), usually
+    holding input fingerprints; larger state (e.g. validation sketches) is
+    kept in files next to the manifest (see state_path). The manifest is
+    rewritten atomically, so a crash leaves the last saved version.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.entries: Dict[str, Dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f).get("entries", {})
+            except (OSError, ValueError) as e:
+                logger.warning("Ignoring unreadable manifest %s: %s", self.path, e)
+
+    def get(self, key: str) -> Dict:
+        return self.entries.get(key)
+
+    def set(self, key: str, entry: Dict):
+        self.entries[key] = entry
+
+    def remove(self, key: str):
+        self.entries.pop(key, None)
+
+    def state_path(self, key: str) -> Path:
+        """Returns the path of the state file kept for entry 'key'."""
+        name = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return self.path.with_name(f"{self.path.name}.{name}.state")
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "entries": self.entries}, f, indent=2, default=_to_json)
+            os.replace(tmp_path, self.path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,231 @@
+import contextlib
+import contextvars
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Union
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# The collector of the running job, if metrics are being collected.
+# Worker threads and processes do not inherit it, so work they do is
+# only reflected in the wall time of the stage that waits for them.
+_current: contextvars.ContextVar = contextvars.ContextVar("dataops_metrics", default=None)
+
+
+class _Stage:
+    """An open stage: the rows it handled and the time spent in stages nested inside it."""
+
+    __slots__ = ("name", "rows", "calls", "nested")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = 0
+        self.calls = 1
+        self.nested = 0.0
+
+
+class MetricsCollector:
+    """
+    Accumulates per-stage timings and counters for one job.
+
+    Stage times are exclusive: time spent in a stage nested inside another
+    (e.g. reading the chunks a writer pulls) is only counted for the inner
+    stage, so stage times add up to at most the wall time.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.finished = None
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, Union[int, float]] = {}
+        self.extra: Dict[str, Any] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[_Stage]:
+        """Times the block as stage 'name'; set 'rows' on the yielded object to report throughput."""
+        stack = self._stack()
+        current = _Stage(name)
+        stack.append(current)
+        start = time.perf_counter()
+        try:
+            yield current
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1].nested += elapsed
+            self._record(name, elapsed - current.nested, current.rows, current.calls)
+
+    def add_time(self, name: str, seconds: float, rows: int = 0, calls: int = 1):
+        """Records time measured by the caller (e.g. summed over a loop) as stage 'name'."""
+        stack = self._stack()
+        if stack:
+            stack[-1].nested += seconds
+        self._record(name, seconds, rows, calls)
+
+    def _record(self, name: str, seconds: float, rows: int, calls: int):
+        with self._lock:
+            entry = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0, "rows": 0})
+            entry["seconds"] += seconds
+            entry["calls"] += calls
+            entry["rows"] += rows
+
+    def count(self, name: str, value: Union[int, float] = 1):
+        """Adds 'value' to counter 'name' (e.g. bytes_read)."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the metrics as a JSON-serializable dict."""
+        wall = (self.finished or time.perf_counter()) - self.started
+        stages = {}
+        for name, entry in self.stages.items():
+            stages[name] = dict(entry, seconds=round(entry["seconds"], 6))
+            if entry["rows"] and entry["seconds"] > 0:
+                stages[name]["rows_per_second"] = round(entry["rows"] / entry["seconds"], 1)
+        return {
+            "wall_seconds": round(wall, 6),
+            "peak_rss_bytes": peak_rss(),
+            "peak_rss_children_bytes": peak_rss(children=True),
+            "stages": stages,
+            "counters": dict(self.counters),
+            **self.extra,
+        }
+
+    def summary(self) -> str:
+        """Formats the metrics as a table for terminals."""
+        metrics = self.as_dict()
+        wall = metrics["wall_seconds"] or 1e-9
+        lines = [f"{'stage':<12} {'seconds':>9} {'share':>6} {'calls':>8} {'rows':>11} {'rows/s':>12}"]
+        for name, entry in sorted(metrics["stages"].items(), key=lambda item: -item[1]["seconds"]):
+            rate = f"{entry['rows_per_second']:,.0f}" if "rows_per_second" in entry else "-"
+            lines.append(f"{name:<12} {entry['seconds']:>9.3f} {entry['seconds'] / wall:>6.1%} "
+                         f"{entry['calls']:>8,} {entry['rows']:>11,} {rate:>12}")
+        lines.append(f"{'wall':<12} {metrics['wall_seconds']:>9.3f}")
+        for name, value in sorted(metrics["counters"].items()):
+            lines.append(f"{name}: {value:,}")
+        if metrics["peak_rss_bytes"]:
+            lines.append(f"peak_rss: {metrics['peak_rss_bytes'] / 1024 ** 2:,.1f} MB")
+        return "\n".join(lines)
+
+
+def peak_rss(children: bool = False) -> int:
+    """Returns the peak resident set size in bytes of this process (or its finished children), if known."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+def current_metrics() -> MetricsCollector:
+    """Returns the active collector, or None when metrics are not being collected."""
+    return _current.get()
+
+
+def stage(name: str):
+    """Times a block as stage 'name' of the active collector (a no-op without one)."""
+    collector = _current.get()
+    if collector is None:
+        return contextlib.nullcontext(_Stage(name))
+    return collector.stage(name)
+
+
+def count(name: str, value: Union[int, float] = 1):
+    """Adds to a counter of the active collector (a no-op without one)."""
+    collector = _current.get()
+    if collector is not None:
+        collector.count(name, value)
+
+
+def file_size(path: Union[str, Path]) -> int:
+    """Returns the size of a file in bytes, or 0 if it cannot be determined."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+_END = object()
+
+
+def timed(chunks: Iterable, name: str) -> Iterator:
+    """Yields from 'chunks', timing each step as stage 'name' and counting the rows of each chunk."""
+    collector = _current.get()
+    if collector is None:
+        yield from chunks
+        return
+    iterator = iter(chunks)
+    while True:
+        with collector.stage(name) as current:
+            chunk = next(iterator, _END)
+            if chunk is _END:
+                current.calls = 0
+            else:
+                current.rows = len(chunk)
+        if chunk is _END:
+            return
+        yield chunk
+
+
+@contextlib.contextmanager
+def collect_metrics(cpu_profile: Union[str, Path] = None, trace_memory: bool = False,
+                    top_allocations: int = 10) -> Iterator[MetricsCollector]:
+    """
+    Collects metrics for the code run inside the block.
+
+    Args:
+        cpu_profile (str): Optional path to dump cProfile statistics to
+                           (readable with pstats or snakeviz).
+        trace_memory (bool): Trace Python allocations with tracemalloc and add
+                             the peak traced size and the 'top_allocations'
+                             largest allocation sites to the metrics (slow).
+        top_allocations (int): Number of allocation sites to report.
+
+    Yields:
+        MetricsCollector: The collector; call as_dict() or summary() after the block.
+    """
+    collector = MetricsCollector()
+    token = _current.set(collector)
+    profiler = None
+    if cpu_profile:
+        import cProfile
+        profiler = cProfile.Profile()
+    if trace_memory:
+        import tracemalloc
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        yield collector
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(str(cpu_profile))
+            collector.extra["cpu_profile"] = str(cpu_profile)
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            top = snapshot.statistics("lineno")[:top_allocations]
+            collector.extra["tracemalloc"] = {
+                "peak_bytes": peak,
+                "top": [{"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                         "size_bytes": stat.size, "count": stat.count} for stat in top],
+            }
+        collector.finished = time.perf_counter()
+        _current.reset(token)
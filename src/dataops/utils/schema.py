@@ -0,0 +1,179 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Union
+
+import pandas as pd
+
+from .logger import setup_logger
+
+logger = setup_logger(__name__)
+
+SCHEMA_SUFFIX = ".schema.json"
+DEFAULT_SAMPLE_ROWS = 100_000
+
+# Logical column types stored in schema files and the pandas dtypes they are read as.
+# Integers are not given to the parser (its nullable Int64 path is several times
+# slower); cast_integers converts them after parsing, which also means values
+# outside the sampled range can never overflow.
+COLUMN_TYPES = ("integer", "float", "boolean", "category", "string")
+_READ_DTYPES = {
+    "float": "float64",
+    "boolean": "boolean",
+    "category": "category",
+}
+
+# Largest integer a float64 holds exactly
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+_INTEGER_PATTERN = r"[+-]?(?:0|[1-9][0-9]*)"
+_LEADING_ZERO_PATTERN = r"[+-]?0[0-9]+(?:\.[0-9]*)?"
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _infer_type(values: pd.Series, category_ratio: float, max_categories: int) -> str:
+    values = values.dropna()
+    if values.empty:
+        return "string"
+
+    # Values such as '0108' are identifiers, not numbers
+    if not values.str.fullmatch(_LEADING_ZERO_PATTERN).any():
+        if values.str.fullmatch(_INTEGER_PATTERN).all():
+            numbers = pd.to_numeric(values, errors="coerce")
+            if numbers.notna().all() and numbers.abs().max() < 2 ** 63:
+                return "integer"
+        if pd.to_numeric(values, errors="coerce").notna().all():
+            return "float"
+
+    if values.str.lower().isin(("true", "false")).all():
+        return "boolean"
+    n_unique = values.nunique()
+    if n_unique <= max_categories and n_unique <= category_ratio * len(values):
+        return "category"
+    return "string"
+
+
+def infer_schema(file_path: Union[str, Path], sample_rows: int = DEFAULT_SAMPLE_ROWS,
+                 category_ratio: float = 0.5, max_categories: int = 10_000) -> Dict:
+    """
+    Infers compact column types from the first 'sample_rows' rows of a CSV file.
+
+    Columns whose values are all integers become "integer" (nullable Int64,
+    downcast after loading a whole frame), other numbers "float", true/false
+    values "boolean", and text with at most 'category_ratio' distinct values
+    per row (and no more than 'max_categories') "category". Remaining text is
+    "string", read as string[pyarrow] when pyarrow is installed (plain str
+    otherwise, which still keeps values such as '0108' intact).
+
+    Returns:
+        Dict: {"version": 1, "sample_rows": n, "columns": {column: type}}.
+    """
+    try:
+        sample = pd.read_csv(file_path, nrows=sample_rows, dtype=str)
+        columns = {col: _infer_type(sample[col], category_ratio, max_categories) for col in sample.columns}
+        logger.info("Inferred schema for %s from %s rows: %s", file_path, len(sample), columns)
+        return {"version": 1, "sample_rows": len(sample), "columns": columns}
+    except Exception as e:
+        logger.error("Error inferring schema for %s: %s", file_path, e)
+        raise
+
+
+def schema_path_for(file_path: Union[str, Path]) -> Path:
+    """Returns the sidecar schema path saved next to a data file: '<file>.schema.json'."""
+    return Path(f"{file_path}{SCHEMA_SUFFIX}")
+
+
+def save_schema(schema: Dict, schema_path: Union[str, Path]):
+    """Saves a schema as JSON."""
+    with open(schema_path, 'w', encoding='utf-8') as f:
+        json.dump(schema, f, indent=4)
+    logger.info("Saved schema to: %s", schema_path)
+
+
+def load_schema(schema_path: Union[str, Path]) -> Dict:
+    """Loads a schema saved by save_schema."""
+    with open(schema_path, 'r', encoding='utf-8') as f:
+        schema = json.load(f)
+    unknown = {t for t in schema.get("columns", {}).values() if t not in COLUMN_TYPES}
+    if unknown:
+        raise ValueError(f"Unknown column types in schema {schema_path}: {sorted(unknown)}")
+    return schema
+
+
+def resolve_schema(schema: Union[str, Path, Dict], file_path: Union[str, Path] = None) -> Dict:
+    """
+    Turns a schema argument into a schema dict.
+
+    'schema' may be a dict, a path to a schema file, or "auto": reuse the
+    file's sidecar schema if it is newer than the file, otherwise infer one
+    and save it next to the file.
+    """
+    if schema is None or isinstance(schema, dict):
+        return schema
+    if str(schema) != "auto":
+        return load_schema(schema)
+    if file_path is None:
+        raise ValueError("schema='auto' needs a file to infer from")
+
+    sidecar = schema_path_for(file_path)
+    if sidecar.exists() and os.path.getmtime(sidecar) >= os.path.getmtime(file_path):
+        logger.info("Using saved schema: %s", sidecar)
+        return load_schema(sidecar)
+    inferred = infer_schema(file_path)
+    try:
+        save_schema(inferred, sidecar)
+    except OSError as e:
+        logger.warning("Could not save schema next to %s: %s", file_path, e)
+    return inferred
+
+
+def schema_dtypes(schema: Dict) -> Dict[str, str]:
+    """Returns the pd.read_csv dtype mapping for a schema (integer columns excluded, see cast_integers)."""
+    string_dtype = "string[pyarrow]" if _has_pyarrow() else "str"
+    return {col: _READ_DTYPES.get(col_type, string_dtype)
+            for col, col_type in schema.get("columns", {}).items() if col_type != "integer"}
+
+
+def cast_integers(df: pd.DataFrame, schema: Dict, downcast: bool = True) -> pd.DataFrame:
+    """
+    Converts the schema's integer columns to nullable Int64 and, with
+    'downcast', to the smallest integer type that holds their values.
+
+    Columns parsed as floats (because of missing values) are converted only if
+    every value is a whole number float64 represents exactly; columns that
+    turned out not to be numeric are left as parsed.
+    """
+    for col, col_type in schema.get("columns", {}).items():
+        if col_type != "integer" or col not in df.columns:
+            continue
+        values = df[col]
+        if pd.api.types.is_float_dtype(values):
+            present = values.dropna()
+            if not ((present % 1 == 0).all() and (present.abs() <= _MAX_EXACT_FLOAT_INT).all()):
+                continue
+        elif not pd.api.types.is_integer_dtype(values):
+            continue
+        values = values.astype("Int64")
+        df[col] = pd.to_numeric(values, downcast="integer") if downcast else values
+    return df
+
+
+def apply_schema(df: pd.DataFrame, schema: Dict) -> pd.DataFrame:
+    """Casts an already-loaded frame's columns to the schema's types (columns it lacks are ignored)."""
+    # Plain str would turn missing values into text on older pandas; leave such columns as they are
+    dtypes = {col: dtype for col, dtype in schema_dtypes(schema).items() if col in df.columns and dtype != "str"}
+    return cast_integers(df.astype(dtypes), schema)
+
+
+def infer_frame_schema(df: pd.DataFrame, category_ratio: float = 0.5, max_categories: int = 10_000) -> Dict:
+    """Infers a schema from the text form of an in-memory frame (see infer_schema)."""
+    text = df.astype(str).where(df.notna(), None)
+    columns = {col: _infer_type(text[col], category_ratio, max_categories) for col in df.columns}
+    return {"version": 1, "sample_rows": len(df), "columns": columns}
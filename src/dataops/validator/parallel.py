@@ -0,0 +1,162 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Tuple, Union
+
+import pandas as pd
+
+from ..utils.file_io import read_csv_columns
+from ..utils.helpers import parse_size
+from ..utils.logger import setup_logger
+from ..utils.schema import cast_integers, schema_dtypes
+from .report import PartialReport
+
+logger = setup_logger(__name__)
+
+
+def split_csv_ranges(file_path: str, n_parts: int, block_size: int = 1 << 20) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    Splits the body of a CSV file into about 'n_parts' byte ranges.
+
+    Every boundary falls right after a line break that ends a record: the
+    number of quote characters before it is even, so newlines inside quoted
+    fields are never used. Quote parity depends on everything before a
+    position, so the file is scanned once with fast byte counting.
+
+    Returns:
+        Tuple: (offset where the body starts, list of (start, end) byte ranges).
+    """
+    size = os.path.getsize(file_path)
+    header_end = None
+    boundaries = []
+    targets = []
+    want = 0
+    parity = 0
+    offset = 0
+    done = False
+
+    with open(file_path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            i = 0
+            while True:
+                if want > offset + i:
+                    j = min(want - offset, len(block))
+                    parity ^= block.count(b'"', i, j) & 1
+                    i = j
+                    if i >= len(block):
+                        break
+                newline = block.find(b'\n', i)
+                if newline < 0:
+                    parity ^= block.count(b'"', i) & 1
+                    break
+                parity ^= block.count(b'"', i, newline) & 1
+                i = newline + 1
+                if parity:
+                    continue
+
+                boundary = offset + i
+                if header_end is None:
+                    header_end = boundary
+                    step = (size - header_end) / n_parts
+                    targets = [int(header_end + step * k) for k in range(n_parts - 1, 0, -1)]
+                else:
+                    boundaries.append(boundary)
+                while targets and targets[-1] < boundary:
+                    targets.pop()
+                if not targets:
+                    done = True
+                    break
+                want = targets.pop()
+            if done:
+                break
+            offset += len(block)
+
+    if header_end is None:
+        return size, []
+    edges = [header_end] + boundaries + [size]
+    return header_end, [(start, end) for start, end in zip(edges, edges[1:]) if start < end]
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of bytes [start, end) of a file."""
+
+    def __init__(self, file_path: str, start: int, end: int):
+        self._f = open(file_path, 'rb')
+        self._f.seek(start)
+        self._remaining = end - start
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self._remaining)
+        if size <= 0:
+            return 0
+        data = self._f.read(size)
+        buffer[:len(data)] = data
+        self._remaining -= len(data)
+        return len(data)
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def add_range(partial: PartialReport, file_path: str, start: int, end: int, chunksize: int, schema: dict = None):
+    """Adds the CSV rows in bytes [start, end) of a file (record-aligned, no header) to 'partial'."""
+    if start >= end:
+        return
+    dtype = schema_dtypes(schema) if schema else str
+    with io.BufferedReader(_ByteRange(file_path, start, end)) as handle:
+        with pd.read_csv(handle, header=None, names=partial.columns, dtype=dtype, chunksize=chunksize) as reader:
+            for chunk in reader:
+                partial.add(cast_integers(chunk, schema, downcast=False) if schema else chunk)
+
+
+def _validate_range(file_path: str, start: int, end: int, columns: List[str], chunksize: int,
+                    duplicates: str, error_rate: float, memory_limit: int, schema: dict = None) -> PartialReport:
+    partial = PartialReport(columns, duplicates=duplicates, error_rate=error_rate, memory_limit=memory_limit)
+    add_range(partial, file_path, start, end, chunksize, schema)
+    return partial
+
+
+def validate_parallel(input_path: str, workers: int, chunksize: int = 100_000, duplicates: str = "exact",
+                      error_rate: float = 0.01, memory_limit: Union[int, str] = "256MB", schema: dict = None):
+    """
+    Validates a CSV file in a process pool.
+
+    The body is split into record-aligned byte ranges; each worker returns a
+    PartialReport for its range, and the partial reports are merged into one
+    report identical to a serial streaming pass.
+
+    Args:
+        input_path (str): Path to the CSV file.
+        workers (int): Number of worker processes.
+        chunksize (int): Rows per chunk within each worker.
+        duplicates (str): "exact" or "approx" duplicate detection.
+        error_rate (float): Target relative error for "approx" detection.
+        memory_limit (int | str): Total memory for exact row hashes, shared by the workers.
+        schema (dict): Optional column types for every range; text by default.
+    """
+    columns = read_csv_columns(input_path)
+    _, ranges = split_csv_ranges(input_path, workers * 2)
+    worker_memory = max(1, parse_size(memory_limit) // workers)
+    logger.info("Validating %s in %s ranges with %s workers", input_path, len(ranges), workers)
+
+    report = PartialReport(columns, duplicates=duplicates, error_rate=error_rate, memory_limit=memory_limit)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_validate_range, input_path, start, end, columns, chunksize,
+                            duplicates, error_rate, worker_memory, schema)
+                for start, end in ranges
+            ]
+            for future in as_completed(futures):
+                report.merge(future.result())
+    except BaseException:
+        report.close()
+        raise
+    return report.finish()
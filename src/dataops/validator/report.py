@@ -0,0 +1,99 @@
+import os
+import pickle
+from typing import Dict, List, Union
+
+import pandas as pd
+
+from ..utils.helpers import parse_size
+from .sketches import HyperLogLog, RowHashSet, row_hashes
+
+
+class PartialReport:
+    """
+    Mergeable validation state for part of a dataset.
+
+    Holds the row count, per-column null counts and a row-hash sketch:
+    a RowHashSet for "exact" duplicate detection, or a HyperLogLog sketch
+    for "approx". Partial reports over disjoint parts of a file can be merged
+    and produce the same final report as a single pass over the whole file.
+    """
+
+    def __init__(self, columns: List[str], duplicates: str = "exact", error_rate: float = 0.01,
+                 memory_limit: Union[int, str] = "256MB"):
+        if duplicates not in ("exact", "approx"):
+            raise ValueError(f"Unsupported duplicate detection mode: {duplicates}")
+        self.columns = list(columns)
+        self.duplicates = duplicates
+        self.total_rows = 0
+        self.missing = pd.Series(0, index=self.columns, dtype="int64")
+        if duplicates == "exact":
+            self.sketch = RowHashSet(memory_limit=parse_size(memory_limit))
+        else:
+            self.sketch = HyperLogLog.from_error_rate(error_rate)
+
+    def add(self, chunk: pd.DataFrame):
+        self.total_rows += len(chunk)
+        self.missing += chunk.isnull().sum()
+        hashes = row_hashes(chunk)
+        self.sketch.add(hashes if self.duplicates == "exact" else hashes["hi"])
+
+    def merge(self, other: "PartialReport"):
+        if other.columns != self.columns or other.duplicates != self.duplicates:
+            raise ValueError("Cannot merge partial reports for different layouts")
+        self.total_rows += other.total_rows
+        self.missing += other.missing
+        self.sketch.merge(other.sketch)
+
+    def save(self, path: str):
+        """
+        Saves the state to 'path' so more rows can be added in a later run
+        (see load); exact row hashes go to a '<path>.hashes' file next to it.
+        """
+        state = {"columns": self.columns, "duplicates": self.duplicates, "total_rows": self.total_rows,
+                 "missing": self.missing.to_dict()}
+        if self.duplicates == "exact":
+            self.sketch.save(f"{path}.hashes")
+        else:
+            state["registers"] = self.sketch.registers
+            state["p"] = self.sketch.p
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, memory_limit: Union[int, str] = "256MB") -> "PartialReport":
+        """Restores a PartialReport saved with save()."""
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        partial = cls(state["columns"], duplicates=state["duplicates"], memory_limit=memory_limit)
+        partial.total_rows = state["total_rows"]
+        partial.missing = pd.Series(state["missing"], index=partial.columns, dtype="int64")
+        if partial.duplicates == "exact":
+            partial.sketch.load(f"{path}.hashes")
+        else:
+            partial.sketch = HyperLogLog(state["p"])
+            partial.sketch.registers = state["registers"]
+        return partial
+
+    def finish(self) -> Dict[str, any]:
+        """Returns the final report and releases any spill files."""
+        try:
+            if self.duplicates == "exact":
+                n_duplicates = self.sketch.count_duplicates()
+            else:
+                n_duplicates = max(0, self.total_rows - round(self.sketch.estimate()))
+        finally:
+            self.close()
+
+        return {
+            "total_rows": self.total_rows,
+            "duplicates": n_duplicates,
+            "missing_values": {col: int(count) for col, count in self.missing.items()},
+            "columns": self.columns,
+            "exact": self.duplicates == "exact",
+        }
+
+    def close(self):
+        if self.duplicates == "exact":
+            self.sketch.close()
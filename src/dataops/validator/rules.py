@@ -0,0 +1,203 @@
+import json
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.helpers import get_file_extension
+from .sketches import row_hashes
+
+SAMPLE_SIZE = 10
+
+_TRUE_FALSE = {"true", "false", "1", "0", "yes", "no", "t", "f", "y", "n"}
+
+
+def load_rules(rules: Union[str, Path, Dict]) -> Dict:
+    """Loads a rule schema from a YAML or JSON file (or returns a dict as-is)."""
+    if isinstance(rules, dict):
+        return rules
+    with open(rules, 'r', encoding='utf-8') as f:
+        if get_file_extension(str(rules)) in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("PyYAML is required for YAML rule files: pip install pyyaml") from None
+            return yaml.safe_load(f) or {}
+        return json.load(f)
+
+
+def _numeric(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values, errors="coerce")
+
+
+def _dtype_check(dtype: str, options: Dict) -> Callable[[pd.Series], pd.Series]:
+    """Returns a function flagging non-null values that do not parse as 'dtype'."""
+    if dtype in ("int", "integer"):
+        def check(values):
+            numbers = _numeric(values)
+            return numbers.isna() | (numbers % 1 != 0)
+    elif dtype in ("float", "number", "numeric"):
+        def check(values):
+            return _numeric(values).isna()
+    elif dtype in ("bool", "boolean"):
+        def check(values):
+            return ~values.astype(str).str.strip().str.lower().isin(_TRUE_FALSE)
+    elif dtype in ("date", "datetime"):
+        date_format = options.get("format")
+        def check(values):
+            return pd.to_datetime(values, errors="coerce", format=date_format).isna()
+    elif dtype in ("str", "string"):
+        def check(values):
+            return pd.Series(False, index=values.index)
+    else:
+        raise ValueError(f"Unsupported dtype in rules: {dtype}")
+    return check
+
+
+class _UniqueCheck:
+    """
+    Flags values already seen in this or an earlier chunk (every occurrence after the first).
+
+    Values are tracked as 128-bit hashes in sorted runs, one per chunk; runs
+    are merged only when the newest one has grown as large as the one before
+    it, so each hash is re-sorted O(log chunks) times instead of every chunk.
+    """
+
+    def __init__(self):
+        self._runs: List[np.ndarray] = []
+
+    def _seen(self, hashes: np.ndarray) -> np.ndarray:
+        seen = np.zeros(len(hashes), dtype=bool)
+        for run in self._runs:
+            pos = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            seen |= run[pos] == hashes
+        return seen
+
+    def _add_run(self, run: np.ndarray):
+        self._runs.append(run)
+        while len(self._runs) > 1 and len(self._runs[-2]) <= len(self._runs[-1]):
+            newest = self._runs.pop()
+            self._runs[-1] = np.sort(np.concatenate([self._runs[-1], newest]))
+
+    def __call__(self, values: pd.Series) -> pd.Series:
+        hashes = row_hashes(values.astype(str).to_frame())
+        distinct, first = np.unique(hashes, return_index=True)
+        seen = self._seen(distinct)
+        repeated = np.ones(len(hashes), dtype=bool)
+        repeated[first] = seen
+        if not seen.all():
+            self._add_run(distinct[~seen])
+        return pd.Series(repeated, index=values.index)
+
+
+class _Rule:
+    """A named check returning a mask of failing rows for a column (or, with on_frame, a chunk)."""
+
+    def __init__(self, name: str, columns: List[str], check: Callable, skip_nulls: bool = True,
+                 on_frame: bool = False):
+        self.name = name
+        self.columns = columns
+        self.check = check
+        self.skip_nulls = skip_nulls
+        self.on_frame = on_frame
+
+
+def _column_rules(column: str, spec: Dict) -> List[_Rule]:
+    rules = []
+
+    def add(check_name, check, skip_nulls=True):
+        rules.append(_Rule(f"{column}.{check_name}", [column], check, skip_nulls))
+
+    if spec.get("required"):
+        add("required", lambda values: values.isna(), skip_nulls=False)
+    if "dtype" in spec:
+        add("dtype", _dtype_check(str(spec["dtype"]).lower(), spec))
+    if "min" in spec:
+        minimum = spec["min"]
+        add("min", lambda values: ~(_numeric(values) >= minimum))
+    if "max" in spec:
+        maximum = spec["max"]
+        add("max", lambda values: ~(_numeric(values) <= maximum))
+    if "allowed" in spec:
+        allowed = [str(value) for value in spec["allowed"]]
+        add("allowed", lambda values: ~values.astype(str).isin(allowed))
+    if "regex" in spec:
+        pattern = re.compile(spec["regex"])
+        add("regex", lambda values: ~values.astype(str).str.fullmatch(pattern).fillna(False).astype(bool))
+    if spec.get("unique"):
+        add("unique", _UniqueCheck())
+    return rules
+
+
+def _typed_frame(chunk: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Converts text columns to numbers where every non-null value is numeric."""
+    typed = {}
+    for col in columns:
+        numbers = _numeric(chunk[col])
+        typed[col] = numbers if numbers.notna().sum() == chunk[col].notna().sum() else chunk[col]
+    return pd.DataFrame(typed, index=chunk.index)
+
+
+def _expression_rule(name: str, expr: str, all_columns: List[str]) -> _Rule:
+    used = [col for col in all_columns
+            if re.search(rf"`{re.escape(col)}`|(?<!\w){re.escape(col)}(?!\w)", expr)]
+
+    def check(chunk):
+        result = _typed_frame(chunk, used).eval(expr)
+        return ~pd.Series(result, index=chunk.index).astype(bool)
+
+    return _Rule(name, used, check, on_frame=True)
+
+
+class RuleSet:
+    """
+    Declarative validation rules compiled into vectorized checks.
+
+    The schema has a 'columns' mapping of column name to checks (dtype,
+    required, min, max, allowed, regex, unique) and an optional 'checks'
+    list of cross-column expressions ({name, expr}) evaluated with
+    DataFrame.eval. Null values only fail 'required'; other checks skip them.
+    Regular expressions must match the whole value.
+
+    Chunks are evaluated as they arrive; uniqueness is tracked across chunks.
+    """
+
+    def __init__(self, schema: Dict, columns: List[str]):
+        self.rules: List[_Rule] = []
+        for column, spec in (schema.get("columns") or {}).items():
+            if column not in columns:
+                raise ValueError(f"Rule column '{column}' not found in input columns {columns}")
+            self.rules.extend(_column_rules(column, spec or {}))
+        for idx, check in enumerate(schema.get("checks") or []):
+            self.rules.append(_expression_rule(check.get("name", f"check_{idx + 1}"), check["expr"], columns))
+
+        self._failed = {rule.name: 0 for rule in self.rules}
+        self._samples = {rule.name: [] for rule in self.rules}
+        self._offset = 0
+
+    def evaluate(self, chunk: pd.DataFrame):
+        """Evaluates every rule on a chunk; row numbers continue across chunks."""
+        positions = np.arange(self._offset, self._offset + len(chunk))
+        for rule in self.rules:
+            data = chunk if rule.on_frame else chunk[rule.columns[0]]
+            if rule.skip_nulls:
+                present = chunk[rule.columns].notna().all(axis=1).to_numpy()
+                failed = np.zeros(len(chunk), dtype=bool)
+                if present.any():
+                    failed[present] = rule.check(data[present]).to_numpy(dtype=bool)
+            else:
+                failed = rule.check(data).to_numpy(dtype=bool)
+
+            n_failed = int(failed.sum())
+            if n_failed:
+                self._failed[rule.name] += n_failed
+                sample = self._samples[rule.name]
+                if len(sample) < SAMPLE_SIZE:
+                    sample.extend(positions[failed][:SAMPLE_SIZE - len(sample)].tolist())
+        self._offset += len(chunk)
+
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """Returns {rule: {"failed": count, "sample": [row numbers]}} (0-based data rows)."""
+        return {name: {"failed": self._failed[name], "sample": self._samples[name]} for name in self._failed}
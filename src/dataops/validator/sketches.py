@@ -0,0 +1,186 @@
+import math
+import os
+import shutil
+import tempfile
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+ROW_HASH_DTYPE = np.dtype([("hi", "<u8"), ("lo", "<u8")])
+
+# pandas requires 16-character hash keys; the second key gives an independent 64-bit hash.
+_SECOND_HASH_KEY = "dataops-rowhash2"
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """Returns a 128-bit hash per row (as ROW_HASH_DTYPE records), ignoring the index."""
+    hashes = np.empty(len(df), dtype=ROW_HASH_DTYPE)
+    hashes["hi"] = pd.util.hash_pandas_object(df, index=False, categorize=False).to_numpy()
+    hashes["lo"] = pd.util.hash_pandas_object(df, index=False, hash_key=_SECOND_HASH_KEY,
+                                              categorize=False).to_numpy()
+    return hashes
+
+
+def _count_repeats(hashes: np.ndarray) -> int:
+    """Counts hashes equal to another one earlier in sorted order."""
+    if len(hashes) < 2:
+        return 0
+    hashes = hashes[np.lexsort((hashes["lo"], hashes["hi"]))]
+    same = (hashes["hi"][1:] == hashes["hi"][:-1]) & (hashes["lo"][1:] == hashes["lo"][:-1])
+    return int(np.count_nonzero(same))
+
+
+class RowHashSet:
+    """
+    Exact duplicate counter over 128-bit row hashes.
+
+    Hashes are kept in memory until they exceed 'memory_limit' bytes, then
+    spilled to bucket files on disk (partitioned by their top bits) so each
+    bucket can be deduplicated on its own when counting.
+    """
+
+    def __init__(self, memory_limit: int = 256 * 1024 ** 2, n_buckets: int = 64, spill_dir: str = None):
+        self.memory_limit = memory_limit
+        self.n_buckets = n_buckets
+        self.spill_dir = spill_dir
+        self._pending: List[np.ndarray] = []
+        self._pending_bytes = 0
+        self._tmp_dir = None
+
+    def add(self, hashes: np.ndarray):
+        self._pending.append(hashes)
+        self._pending_bytes += hashes.nbytes
+        if self._pending_bytes > self.memory_limit:
+            self._spill()
+
+    def _bucket_path(self, bucket: int) -> str:
+        return os.path.join(self._tmp_dir, f"bucket_{bucket}.bin")
+
+    def _spill(self):
+        if self._tmp_dir is None:
+            self._tmp_dir = tempfile.mkdtemp(prefix="dataops-rowhash-", dir=self.spill_dir)
+        hashes = np.concatenate(self._pending) if self._pending else np.empty(0, dtype=ROW_HASH_DTYPE)
+        buckets = (hashes["hi"] % self.n_buckets).astype(np.intp)
+        order = np.argsort(buckets, kind="stable")
+        bounds = np.searchsorted(buckets[order], np.arange(self.n_buckets + 1))
+        for bucket in range(self.n_buckets):
+            part = hashes[order[bounds[bucket]:bounds[bucket + 1]]]
+            if len(part):
+                with open(self._bucket_path(bucket), "ab") as f:
+                    part.tofile(f)
+        self._pending = []
+        self._pending_bytes = 0
+
+    def _iter_hashes(self):
+        yield from self._pending
+        if self._tmp_dir is not None:
+            for bucket in range(self.n_buckets):
+                path = self._bucket_path(bucket)
+                if os.path.exists(path):
+                    yield np.fromfile(path, dtype=ROW_HASH_DTYPE)
+
+    def merge(self, other: "RowHashSet"):
+        """Adds all hashes of another set (spilling as needed) and closes it."""
+        for hashes in other._iter_hashes():
+            self.add(hashes)
+        other.close()
+
+    def count_duplicates(self) -> int:
+        """Returns the number of hashes that repeat an earlier one."""
+        if self._tmp_dir is None:
+            hashes = np.concatenate(self._pending) if self._pending else np.empty(0, dtype=ROW_HASH_DTYPE)
+            return _count_repeats(hashes)
+
+        self._spill()
+        duplicates = 0
+        for bucket in range(self.n_buckets):
+            path = self._bucket_path(bucket)
+            if os.path.exists(path):
+                hashes = np.fromfile(path, dtype=ROW_HASH_DTYPE)
+                duplicates += _count_repeats(hashes)
+        return duplicates
+
+    def save(self, path: str):
+        """Writes every hash to 'path' (a flat binary file), e.g. to resume counting later."""
+        with open(path, "wb") as f:
+            for hashes in self._iter_hashes():
+                hashes.tofile(f)
+
+    def load(self, path: str, block_rows: int = 1 << 20):
+        """Adds the hashes saved with save(), in blocks so spilling keeps memory bounded."""
+        with open(path, "rb") as f:
+            while True:
+                hashes = np.fromfile(f, dtype=ROW_HASH_DTYPE, count=block_rows)
+                if not len(hashes):
+                    break
+                self.add(hashes)
+
+    def close(self):
+        """Removes any spill files."""
+        if self._tmp_dir is not None:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            self._tmp_dir = None
+        self._pending = []
+        self._pending_bytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _leading_zeros(x: np.ndarray) -> np.ndarray:
+    """Counts leading zero bits of uint64 values (64 for zero)."""
+    x = x.copy()
+    zeros = np.zeros(len(x), dtype=np.uint8)
+    for shift in (32, 16, 8, 4, 2, 1):
+        empty = (x >> np.uint64(64 - shift)) == 0
+        zeros[empty] += shift
+        x[empty] <<= np.uint64(shift)
+    zeros[x == 0] = 64
+    return zeros
+
+
+class HyperLogLog:
+    """
+    Mergeable distinct-count sketch over 64-bit hashes.
+
+    The relative standard error of the estimate is about 1.04 / sqrt(2 ** p);
+    use from_error_rate to pick the precision for a target error.
+    """
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    @classmethod
+    def from_error_rate(cls, error_rate: float) -> "HyperLogLog":
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        p = math.ceil(math.log2((1.04 / error_rate) ** 2))
+        return cls(min(max(p, 4), 18))
+
+    def add(self, hashes: np.ndarray):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.intp)
+        rest = hashes << np.uint64(self.p)
+        rank = np.minimum(_leading_zeros(rest) + 1, 64 - self.p + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog"):
+        if other.p != self.p:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def estimate(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return float(raw)
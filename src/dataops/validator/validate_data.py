@@ -1,39 +1,226 @@
+import os
 import pandas as pd
-from typing import Dict
-from ..utils.file_io import read_csv
+from typing import Dict, Iterable, Iterator, List, Union
+from ..utils.compression import get_compression, is_dataset
+from ..utils.file_io import is_columnar, read_table, read_table_chunks, read_table_columns
 from ..utils.logger import setup_logger
+from ..utils.manifest import Manifest, fingerprint, is_appended, is_unchanged, options_key
+from ..utils.metrics import stage
+from ..utils.schema import resolve_schema
+from .parallel import add_range, split_csv_ranges, validate_parallel
+from .report import PartialReport
+from .rules import RuleSet, load_rules
 
 logger = setup_logger(__name__)
 
-def validate_csv_data(input_path: str) -> Dict[str, any]:
+DEFAULT_CHUNKSIZE = 100_000
+
+def _iter_validated(chunks: Iterable[pd.DataFrame], columns: List[str], report: Dict[str, any],
+                    duplicates: str = "exact", error_rate: float = 0.01, memory_limit: Union[int, str] = "256MB",
+                    rules: Union[str, Dict] = None) -> Iterator[pd.DataFrame]:
+    """
+    Yields 'chunks' unchanged while validating them in a single pass, and
+    fills 'report' once they are exhausted.
+
+    "exact" duplicate detection keeps a 128-bit hash per row and spills them
+    to disk beyond 'memory_limit'; "approx" estimates distinct rows with a
+    HyperLogLog sketch whose relative error is about 'error_rate'.
+    Rules, if given, are evaluated on the same chunks.
+    """
+    rule_set = RuleSet(load_rules(rules), columns) if rules else None
+    partial = PartialReport(columns, duplicates=duplicates, error_rate=error_rate, memory_limit=memory_limit)
+    try:
+        for chunk in chunks:
+            with stage("validate") as timer:
+                aligned = chunk if list(chunk.columns) == columns else chunk.reindex(columns=columns)
+                partial.add(aligned)
+                if rule_set:
+                    rule_set.evaluate(aligned)
+                timer.rows = len(chunk)
+            yield chunk
+    except BaseException:
+        partial.close()
+        raise
+
+    with stage("validate"):
+        report.update(partial.finish())
+    if rule_set:
+        report["rule_violations"] = rule_set.results()
+
+def _validate_chunks(chunks: Iterable[pd.DataFrame], columns: List[str], duplicates: str = "exact",
+                     error_rate: float = 0.01, memory_limit: Union[int, str] = "256MB",
+                     rules: Union[str, Dict] = None) -> Dict[str, any]:
+    """Builds a validation report in a single pass over DataFrame chunks (see _iter_validated)."""
+    report = {}
+    for _ in _iter_validated(chunks, columns, report, duplicates=duplicates, error_rate=error_rate,
+                             memory_limit=memory_limit, rules=rules):
+        pass
+    return report
+
+def _log_findings(report: Dict[str, any]):
+    if report["duplicates"] > 0:
+        logger.warning("Found %s duplicate rows.", report['duplicates'])
+
+    if any(report["missing_values"].values()):
+        logger.warning("Found missing values: %s", report['missing_values'])
+
+    failing = {name: result["failed"] for name, result in report.get("rule_violations", {}).items() if result["failed"]}
+    if failing:
+        logger.warning("Found rule violations: %s", failing)
+
+def _validate_incremental(input_path: str, manifest_path: str, chunksize: int, duplicates: str, error_rate: float,
+                          memory_limit: Union[int, str], schema: Dict = None) -> Dict[str, any]:
+    """
+    Validates a CSV file, resuming from the state saved in the manifest by
+    the last run: an unchanged file reuses the saved report, and a file that
+    only grew has just its new rows read and added to the saved state.
+    """
+    manifest = Manifest(manifest_path)
+    key = f"validate:{os.path.abspath(input_path)}"
+    options = options_key({"duplicates": duplicates, "error_rate": error_rate, "schema": schema})
+    state_path = str(manifest.state_path(key))
+    entry = manifest.get(key)
+    if entry and (entry["options"] != options or not os.path.exists(state_path)):
+        entry = None
+
+    if entry and is_unchanged(input_path, entry["input"]):
+        logger.info("%s is unchanged since the last validation; reusing its report.", input_path)
+        return entry["report"]
+
+    current = fingerprint(input_path, content=True)
+    header_end, _ = split_csv_ranges(input_path, 1)
+    if entry and is_appended(input_path, entry["input"]):
+        start = entry["input"]["size"]
+        partial = PartialReport.load(state_path, memory_limit=memory_limit)
+        logger.info("Validating %s new bytes of %s on top of %s rows already validated",
+                    current["size"] - start, input_path, partial.total_rows)
+    else:
+        start = header_end
+        partial = PartialReport(read_table_columns(input_path), duplicates=duplicates, error_rate=error_rate,
+                                memory_limit=memory_limit)
+
+    try:
+        with stage("validate") as timer:
+            rows_before = partial.total_rows
+            add_range(partial, input_path, start, current["size"], chunksize, schema)
+            timer.rows = partial.total_rows - rows_before
+            with open(input_path, "rb") as f:
+                f.seek(max(0, current["size"] - 1))
+                # New rows can only be appended after a complete last line
+                resumable = f.read(1) == b"\n" or current["size"] <= header_end
+            if resumable:
+                partial.save(state_path)
+            report = partial.finish()
+    except BaseException:
+        partial.close()
+        raise
+
+    if resumable:
+        manifest.set(key, {"input": current, "options": options, "report": report})
+    else:
+        logger.warning("%s does not end with a line break; the next run will validate it from the start.", input_path)
+        manifest.remove(key)
+    manifest.save()
+    return report
+
+def _resumable_manifest(manifest: str, input_path: str, rules, columns: List[str], filters) -> str:
+    """Returns 'manifest', or None (with a warning) if this validation cannot be resumed from one."""
+    if rules or columns or filters or is_columnar(input_path) or is_dataset(input_path) or get_compression(input_path):
+        logger.warning("Incremental validation needs a whole uncompressed CSV file without rules, "
+                       "columns or filters; ignoring 'manifest'.")
+        return None
+    return manifest
+
+def validate_csv_data(input_path: str, chunksize: int = None, duplicates: str = "exact",
+                      error_rate: float = 0.01, memory_limit: Union[int, str] = "256MB",
+                      workers: int = None, rules: Union[str, Dict] = None, columns: List[str] = None,
+                      filters=None, schema: Union[str, Dict] = None, manifest: str = None) -> Dict[str, any]:
     """
-    Validates a CSV file for common issues: duplicates, missing values.
-    
+    Validates a CSV, Parquet or Feather file for common issues: duplicates, missing values.
+
+    By default the whole file is loaded. With 'chunksize', or with approximate
+    duplicate detection, the file is validated in a single streaming pass;
+    CSV rows are then compared by their text, so '1' and '1.0' are different,
+    unless a 'schema' types them; columnar files keep their stored types.
+    With 'workers', that pass is split into byte ranges validated in parallel
+    processes (CSV only), and the merged report is identical to the serial one.
+    Rules (see RuleSet) are always evaluated in a serial streaming pass.
+
     Args:
-        input_path (str): Path to the CSV file.
-        
+        input_path (str): Path to the input file (optionally compressed), or a
+                          directory/glob pattern validated as one dataset.
+        chunksize (int): Optional number of rows to read per chunk.
+        duplicates (str): "exact" or "approx" duplicate detection.
+        error_rate (float): Target relative error for "approx" detection.
+        memory_limit (int | str): Memory for exact row hashes before spilling to disk.
+        workers (int): Number of worker processes for parallel validation.
+        rules (str | Dict): Path to a YAML/JSON rule schema, or the schema itself.
+        columns (List[str]): Optional subset of columns to read and validate.
+        filters: Optional DNF row filters, e.g. [("age", ">", 30)], pushed
+                 down to Parquet row groups.
+        schema (str | Dict): Optional CSV column types: a dict, a schema file,
+                             or "auto" (see utils.schema).
+        manifest (str): Optional manifest file (see utils.manifest) keeping the
+                        validation state of an uncompressed CSV file between
+                        runs: unchanged files are not read again, and rows
+                        appended since the last run are the only ones read.
+                        Not combined with rules, columns, filters or workers.
+
     Returns:
-        Dict: Validation report.
+        Dict: Validation report. 'exact' tells whether the duplicate count is exact.
+              With rules, 'rule_violations' maps each rule to its failing row
+              count and a sample of failing row numbers.
     """
     try:
-        logger.info(f"Validating file: {input_path}")
-        df = read_csv(input_path)
-        
-        report = {
-            "total_rows": len(df),
-            "duplicates": df.duplicated().sum(),
-            "missing_values": df.isnull().sum().to_dict(),
-            "columns": list(df.columns)
-        }
-        
-        if report["duplicates"] > 0:
-            logger.warning(f"Found {report['duplicates']} duplicate rows.")
-        
-        if any(report["missing_values"].values()):
-            logger.warning(f"Found missing values: {report['missing_values']}")
-            
+        logger.info("Validating file: %s", input_path)
+        if rules and workers and workers > 1:
+            logger.warning("Rules are evaluated serially; ignoring 'workers'.")
+            workers = None
+        if workers and workers > 1 and (columns or filters or is_columnar(input_path) or is_dataset(input_path)
+                                        or get_compression(input_path)):
+            logger.warning("Parallel validation needs a whole uncompressed CSV file; ignoring 'workers'.")
+            workers = None
+
+        if is_columnar(input_path):
+            schema = None
+        elif schema is not None and not is_dataset(input_path):
+            # Datasets resolve the schema per file as they are read
+            schema = resolve_schema(schema, input_path)
+
+        manifest = manifest and _resumable_manifest(manifest, input_path, rules, columns, filters)
+
+        if manifest:
+            report = _validate_incremental(input_path, manifest, chunksize or DEFAULT_CHUNKSIZE, duplicates,
+                                           error_rate, memory_limit, schema)
+        elif workers and workers > 1:
+            # Worker processes read and validate their ranges; only the total is measured here
+            with stage("validate") as timer:
+                report = validate_parallel(input_path, workers, chunksize=chunksize or DEFAULT_CHUNKSIZE,
+                                           duplicates=duplicates, error_rate=error_rate, memory_limit=memory_limit,
+                                           schema=schema)
+                timer.rows = report["total_rows"]
+        elif chunksize is None and duplicates == "exact" and not rules:
+            df = read_table(input_path, columns=columns, filters=filters, schema=schema)
+
+            with stage("validate") as timer:
+                report = {
+                    "total_rows": len(df),
+                    "duplicates": df.duplicated().sum(),
+                    "missing_values": df.isnull().sum().to_dict(),
+                    "columns": list(df.columns),
+                    "exact": True,
+                }
+                timer.rows = len(df)
+        else:
+            dtype = None if is_columnar(input_path) or schema else str
+            chunks = read_table_chunks(input_path, chunksize or DEFAULT_CHUNKSIZE, dtype=dtype,
+                                       columns=columns, filters=filters, schema=schema)
+            report = _validate_chunks(chunks, columns or read_table_columns(input_path), duplicates=duplicates,
+                                      error_rate=error_rate, memory_limit=memory_limit, rules=rules)
+
+        _log_findings(report)
         logger.info("Validation completed.")
         return report
     except Exception as e:
-        logger.error(f"Validation failed: {e}")
+        logger.error("Validation failed: %s", e)
         raise
@@ -0,0 +1,71 @@
+import json
+import pytest
+import pandas as pd
+from click.testing import CliRunner
+from dataops.batch import batch_outputs, run_batch
+from dataops.cli import main
+
+@pytest.fixture
+def csv_dir(tmp_path):
+    source = tmp_path / "in"
+    (source / "sub").mkdir(parents=True)
+    for i, folder in enumerate([source, source, source / "sub"]):
+        pd.DataFrame({"id": [i, i, i + 1], "name": ["a", "a", "b"]}).to_csv(folder / f"part{i}.csv", index=False)
+    (source / "sub" / "part0.csv").write_text("id,name\n1,x\n")
+    (source / "broken.csv").write_text('id,name\n1,"unterminated\n')
+    return source
+
+def test_batch_outputs_keep_layout(tmp_path):
+    inputs = [str(tmp_path / "in" / "a.csv.gz"), str(tmp_path / "in" / "sub" / "a.csv")]
+    assert batch_outputs(inputs, "out", ".json") == ["out/a.json", "out/sub/a.json"]
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_csv_to_json_continues_on_error(tmp_path, csv_dir, workers):
+    out_dir = tmp_path / "out"
+    results = run_batch("csv_to_json", str(csv_dir / "**" / "*.csv"), out_dir=str(out_dir), workers=workers,
+                        indent=None)
+
+    assert [r["input"].rsplit("in/", 1)[1] for r in results] == [
+        "broken.csv", "part0.csv", "part1.csv", "sub/part0.csv", "sub/part2.csv"]
+    assert [r["ok"] for r in results] == [False, True, True, True, True]
+    assert "ParserError" in results[0]["error"]
+    assert all(r["seconds"] >= 0 for r in results)
+    assert json.loads((out_dir / "sub" / "part0.json").read_text()) == [{"id": 1, "name": "x"}]
+    assert len(json.loads((out_dir / "part1.json").read_text())) == 3
+
+def test_batch_validate_returns_reports(tmp_path, csv_dir):
+    results = run_batch("validate", str(csv_dir / "part*.csv"), workers=1)
+    assert [r["report"]["duplicates"] for r in results] == [1, 1]
+    assert all(r["output"] is None for r in results)
+
+    results = run_batch("validate", str(csv_dir / "part*.csv"), out_dir=str(tmp_path / "reports"), workers=1)
+    assert json.loads((tmp_path / "reports" / "part0.report.json").read_text())["total_rows"] == 3
+
+def test_batch_requires_out_dir_for_conversions(csv_dir):
+    with pytest.raises(ValueError, match="output directory"):
+        run_batch("json_to_excel", str(csv_dir))
+
+def test_cli_batch_summary_and_exit_code(tmp_path, csv_dir):
+    runner = CliRunner()
+    result = runner.invoke(main, ["csv-to-json", "--batch", str(csv_dir / "part*.csv"),
+                                  "--out-dir", str(tmp_path / "json"), "--workers", "1"])
+    assert result.exit_code == 0, result.output
+    assert "Batch Summary: 2 succeeded, 0 failed" in result.output
+
+    result = runner.invoke(main, ["json-to-excel", "--batch", str(tmp_path / "json"),
+                                  "--out-dir", str(tmp_path / "xlsx"), "--workers", "1"])
+    assert result.exit_code == 0, result.output
+    assert pd.read_excel(tmp_path / "xlsx" / "part1.xlsx")["id"].tolist() == [1, 1, 2]
+
+    result = runner.invoke(main, ["validate", "--batch", str(csv_dir), "--workers", "1"])
+    assert result.exit_code == 1
+    assert "FAILED" in result.output and "Batch Summary: 2 succeeded, 1 failed" in result.output
+
+def test_cli_batch_argument_errors(tmp_path, csv_dir):
+    runner = CliRunner()
+    result = runner.invoke(main, ["csv-to-json", "--batch", str(csv_dir)])
+    assert result.exit_code == 2 and "--out-dir" in result.output
+    result = runner.invoke(main, ["csv-to-json", "a.csv", "--batch", str(csv_dir), "--out-dir", "out"])
+    assert result.exit_code == 2
+    result = runner.invoke(main, ["validate"])
+    assert result.exit_code == 2 and "--batch" in result.output
@@ -0,0 +1,37 @@
+import pytest
+from benchmarks import generators
+from benchmarks.run import compare, measure
+from benchmarks.scenarios import SCENARIOS
+
+def test_generators_are_deterministic(tmp_path):
+    assert generators.es_search_response(50) == generators.es_search_response(50)
+    assert generators.es_search_response(50, seed=1) != generators.es_search_response(50)
+
+    first = generators.duplicate_heavy_csv(str(tmp_path / "a.csv"), 1000)
+    second = generators.duplicate_heavy_csv(str(tmp_path / "b.csv"), 1000)
+    assert open(first).read() == open(second).read()
+
+def test_skewed_join_keys_are_skewed(tmp_path):
+    import pandas as pd
+    left, _ = generators.skewed_join_inputs(str(tmp_path / "l.csv"), str(tmp_path / "r.csv"), 5000, 100)
+    counts = pd.read_csv(left)["id"].value_counts()
+    assert counts.iloc[0] > 10 * counts.median()
+
+def test_measure_reports_throughput():
+    result = measure("flatten_dict", "small", repeat=1)
+    assert result["rows"] == SCENARIOS["flatten_dict"].base_rows
+    assert result["rows_per_second"] > 0
+
+@pytest.mark.parametrize("current, expected", [
+    ({"rows_per_second": 90.0, "peak_rss_bytes": 100}, 0),
+    ({"rows_per_second": 70.0, "peak_rss_bytes": 100}, 1),
+    ({"rows_per_second": 100.0, "peak_rss_bytes": 150}, 1),
+])
+def test_compare_flags_regressions(current, expected):
+    baseline = {"size": "small", "scenarios": {"csv_to_json": {"rows_per_second": 100.0, "peak_rss_bytes": 100}}}
+    results = {"size": "small", "scenarios": {"csv_to_json": current}}
+    assert len(compare(results, baseline, threshold=0.2, memory_threshold=0.2)) == expected
+
+def test_compare_rejects_other_sizes():
+    baseline = {"size": "large", "scenarios": {}}
+    assert compare({"size": "small", "scenarios": {}}, baseline, 0.2, 0.2)
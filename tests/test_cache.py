@@ -0,0 +1,76 @@
+import os
+import pytest
+import pandas as pd
+from click.testing import CliRunner
+from dataops.cli import main
+from dataops.utils.cache import ParseCache, configure_cache, get_cache
+from dataops.utils.file_io import read_csv
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache_dir = tmp_path / "cache"
+    configure_cache(cache_dir=cache_dir)
+    yield cache_dir
+    configure_cache(enabled=None)
+
+def test_read_csv_uses_cache_until_file_changes(tmp_path, cache_dir):
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"id": [1, 2], "name": ["a", None]}).to_csv(csv_file, index=False)
+    
+    first = read_csv(csv_file)
+    cached = read_csv(csv_file)
+    
+    pd.testing.assert_frame_equal(cached, first)
+    assert len(list(cache_dir.iterdir())) == 1
+    assert get_cache().hits == 1
+    
+    pd.DataFrame({"id": [3]}).to_csv(csv_file, index=False)
+    os.utime(csv_file, ns=(0, os.stat(csv_file).st_mtime_ns + 1))
+    
+    assert read_csv(csv_file)["id"].tolist() == [3]
+    assert len(list(cache_dir.iterdir())) == 2
+
+def test_cache_hits_and_read_options(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_csv(csv_file, index=False)
+    cache = ParseCache(tmp_path / "cache", key="content")
+    
+    cache.load(csv_file, lambda: pd.read_csv(csv_file), columns=None)
+    cache.load(csv_file, lambda: pd.read_csv(csv_file), columns=None)
+    subset = cache.load(csv_file, lambda: pd.read_csv(csv_file, usecols=["id"]), columns=["id"])
+    
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert list(subset.columns) == ["id"]
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = ParseCache(tmp_path / "cache", max_size=1)
+    files = []
+    for i in range(3):
+        csv_file = tmp_path / f"data{i}.csv"
+        pd.DataFrame({"id": range(100)}).to_csv(csv_file, index=False)
+        files.append(csv_file)
+        cache.load(csv_file, lambda: pd.read_csv(csv_file))
+    
+    assert cache.stat()["entries"] == 0
+    
+    cache.max_size = 10 ** 9
+    for csv_file in files:
+        cache.load(csv_file, lambda: pd.read_csv(csv_file))
+    newest = cache.stat()["size_bytes"] // 3 + 1
+    cache.max_size = newest
+    cache.evict()
+    
+    assert cache.stat()["entries"] == 1
+
+def test_cache_cli_stat_and_clear(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATAOPS_CACHE_DIR", str(tmp_path / "cache"))
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"id": [1, 2, 2]}).to_csv(csv_file, index=False)
+    runner = CliRunner()
+    
+    assert runner.invoke(main, ["validate", str(csv_file)]).exit_code == 0
+    stat = runner.invoke(main, ["cache", "stat"])
+    cleared = runner.invoke(main, ["cache", "clear"])
+    
+    assert "entries: 1" in stat.output
+    assert "Removed 1 cache entries" in cleared.output
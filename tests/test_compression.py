@@ -0,0 +1,74 @@
+import pytest
+import pandas as pd
+from dataops.converters import convert_csv_to_json, convert_json_to_excel
+from dataops.merger import merge_csv_files
+from dataops.utils.compression import expand_inputs, open_file
+from dataops.utils.file_io import read_json, read_table, read_table_columns, save_json
+from dataops.utils.helpers import get_file_extension, strip_compression_suffix
+from dataops.validator import validate_csv_data
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+def test_open_file_round_trip(tmp_path, suffix):
+    path = tmp_path / f"data.json{suffix}"
+    
+    save_json({"a": [1, 2]}, path)
+    
+    assert read_json(path) == {"a": [1, 2]}
+    with open(path, "rb") as f:
+        assert not f.read().startswith(b"{")
+
+def test_extension_ignores_compression_suffix():
+    assert get_file_extension("events.ndjson.bz2") == ".ndjson"
+    assert get_file_extension("data.CSV.GZ") == ".csv"
+    assert strip_compression_suffix("a/b.csv.zst") == "a/b.csv"
+    assert strip_compression_suffix("a/b.csv") == "a/b.csv"
+
+def test_compressed_inputs_across_commands(tmp_path):
+    csv_file = tmp_path / "data.csv.gz"
+    ndjson_file = tmp_path / "events.ndjson.bz2"
+    pd.DataFrame({"id": [1, 2, 2], "name": ["a", "b", "b"]}).to_csv(csv_file, index=False)
+    with open_file(ndjson_file, "w") as f:
+        f.write('{"id": 1}\n{"id": 2}\n')
+    
+    convert_csv_to_json(str(csv_file), str(tmp_path / "out.json.gz"))
+    convert_json_to_excel(str(ndjson_file), str(tmp_path / "out.xlsx"))
+    report = validate_csv_data(str(csv_file), workers=2)
+    
+    assert read_json(tmp_path / "out.json.gz") == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"},
+                                                   {"id": 2, "name": "b"}]
+    assert pd.read_excel(tmp_path / "out.xlsx")["id"].tolist() == [1, 2]
+    assert (report["total_rows"], report["duplicates"]) == (3, 1)
+
+def test_directory_and_glob_datasets(tmp_path):
+    parts = tmp_path / "parts"
+    parts.mkdir()
+    pd.DataFrame({"id": [1, 2]}).to_csv(parts / "b.csv.gz", index=False)
+    pd.DataFrame({"id": [0], "extra": ["x"]}).to_csv(parts / "a.csv", index=False)
+    
+    assert [p.split("/")[-1] for p in expand_inputs(parts)] == ["a.csv", "b.csv.gz"]
+    assert read_table_columns(str(parts / "*.csv*")) == ["id", "extra"]
+    assert read_table(parts)["id"].tolist() == [0, 1, 2]
+    
+    report = validate_csv_data(str(parts), chunksize=1)
+    assert report["total_rows"] == 3
+    assert report["missing_values"] == {"id": 0, "extra": 2}
+
+@pytest.mark.parametrize("chunksize", [None, 1])
+def test_merge_glob_into_compressed_csv(tmp_path, chunksize):
+    for i in range(3):
+        pd.DataFrame({"id": [i]}).to_csv(tmp_path / f"part{i}.csv", index=False)
+    output = tmp_path / "merged.csv.gz"
+    
+    merge_csv_files([str(tmp_path / "part*.csv")], str(output), chunksize=chunksize)
+    
+    assert pd.read_csv(output)["id"].tolist() == [0, 1, 2]
+
+def test_existing_file_with_glob_characters_is_not_a_pattern(tmp_path):
+    csv_file = tmp_path / "sales[2024].csv"
+    pd.DataFrame({"id": [1, 2, 2]}).to_csv(csv_file, index=False)
+    
+    assert expand_inputs(str(csv_file)) == [str(csv_file)]
+    assert read_table(str(csv_file))["id"].tolist() == [1, 2, 2]
+    assert validate_csv_data(str(csv_file))["duplicates"] == 1
+    merge_csv_files([str(csv_file), str(csv_file)], str(tmp_path / "all.csv"))
+    assert len(pd.read_csv(tmp_path / "all.csv")) == 6
@@ -34,3 +34,27 @@ def test_json_to_excel(tmp_path):
     df = pd.read_excel(excel_file)
     assert len(df) == 2
     assert df.iloc[0]["col1"] == 1
+
+def test_csv_to_json_streaming_matches_default(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    expected_file = tmp_path / "expected.json"
+    json_file = tmp_path / "output.json"
+    
+    df = pd.DataFrame([{"col1": i, "col2": f"v{i}"} for i in range(5)])
+    df.to_csv(csv_file, index=False)
+    
+    convert_csv_to_json(str(csv_file), str(expected_file))
+    convert_csv_to_json(str(csv_file), str(json_file), chunksize=2)
+    
+    assert json_file.read_text() == expected_file.read_text()
+
+def test_csv_to_json_ndjson(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    json_file = tmp_path / "output.ndjson"
+    
+    pd.DataFrame([{"col1": 1, "col2": "a"}, {"col1": 2, "col2": "b"}]).to_csv(csv_file, index=False)
+    
+    convert_csv_to_json(str(csv_file), str(json_file), chunksize=1, output_format="ndjson")
+    
+    lines = json_file.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [{"col1": 1, "col2": "a"}, {"col1": 2, "col2": "b"}]
@@ -0,0 +1,61 @@
+import pytest
+import pandas as pd
+from openpyxl import load_workbook
+from dataops.utils.file_io import filter_frame, read_table, read_table_chunks, save_excel_stream, save_table
+from dataops.utils.helpers import parse_filter
+
+def test_save_excel_stream_rolls_over_sheets(tmp_path):
+    excel_file = tmp_path / "output.xlsx"
+    chunks = [
+        pd.DataFrame({"a": [1, 2], "b": ["x", None]}),
+        pd.DataFrame({"b": ["y"], "a": [3]}),
+    ]
+    
+    save_excel_stream(chunks, excel_file, max_rows=3)
+    
+    workbook = load_workbook(excel_file)
+    assert workbook.sheetnames == ["Sheet1", "Sheet2"]
+    assert [list(r) for r in workbook["Sheet1"].values] == [["a", "b"], [1, "x"], [2, None]]
+    assert [list(r) for r in workbook["Sheet2"].values] == [["a", "b"], [3, "y"]]
+
+def test_save_excel_stream_empty_input_writes_header(tmp_path):
+    excel_file = tmp_path / "output.xlsx"
+    
+    save_excel_stream([], excel_file, columns=["a"])
+    
+    assert list(pd.read_excel(excel_file).columns) == ["a"]
+
+def test_filter_frame_dnf():
+    df = pd.DataFrame({"age": [20, 35, 50], "city": ["a", "b", "c"]})
+    
+    assert filter_frame(df, [("age", ">", 30), ("city", "!=", "c")])["city"].tolist() == ["b"]
+    assert filter_frame(df, [[("age", "<", 30)], [("city", "in", ["c"])]])["city"].tolist() == ["a", "c"]
+
+def test_parse_filter():
+    assert parse_filter("age>=30") == ("age", ">=", 30)
+    assert parse_filter("city = Dhaka") == ("city", "==", "Dhaka")
+
+def test_read_table_csv_projection_and_filters(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    pd.DataFrame({"id": [1, 2, 3], "age": [20, 35, 50], "name": ["a", "b", "c"]}).to_csv(csv_file, index=False)
+    filters = [("age", ">", 30)]
+    
+    df = read_table(csv_file, columns=["name"], filters=filters)
+    chunks = list(read_table_chunks(csv_file, 1, dtype=str, columns=["name"], filters=filters))
+    
+    assert df.to_dict(orient="list") == {"name": ["b", "c"]}
+    assert pd.concat(chunks).to_dict(orient="list") == {"name": ["b", "c"]}
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_columnar_round_trip_with_pushdown(tmp_path, suffix):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / f"data{suffix}"
+    df = pd.DataFrame({"id": [1, 2, 3], "age": [20, 35, 50], "name": ["a", "b", None]})
+    
+    save_table(df, path)
+    
+    pd.testing.assert_frame_equal(read_table(path), df)
+    assert read_table(path, columns=["id"], filters=[("age", ">", 30)])["id"].tolist() == [2, 3]
+    text = pd.concat(read_table_chunks(path, 2, dtype=str))
+    assert text["age"].tolist() == ["20", "35", "50"]
+    assert text["name"].isna().tolist() == [False, False, True]
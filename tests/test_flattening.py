@@ -40,3 +40,77 @@ def test_json_flattening(tmp_path):
     assert "Age" in df.columns
     assert df.iloc[0]["Name"] == "Alice"
     assert df.iloc[0]["Age"] == 30
+
+def test_field_resolver_matches_find_best_match():
+    from dataops.converters.json_to_excel import FieldResolver, find_best_match
+    
+    fields = {"pin": "PIN", "id": "ID", "name": "Name", "missing": "Missing"}
+    objects = [
+        {"id": 1, "_source_pin": "a", "b_pin": "b", "a_pin": "c"},
+        {"id": 2, "_source_pin": "a", "b_pin": "b", "a_pin": "c"},
+        {"x_id": 3, "info_name": None, "name": "n"},
+        {"pin": None, "_pin": "p"},
+    ]
+    resolver = FieldResolver(fields, maxsize=1)
+    
+    for obj in objects:
+        expected = {}
+        for json_field, header in fields.items():
+            val = find_best_match(obj, json_field)
+            if val is not None:
+                expected[header] = val
+        assert resolver.resolve(obj) == expected
+
+def test_flatten_dict_nested_and_colliding_keys():
+    from dataops.converters.json_to_excel import flatten_dict
+    
+    data = {"a_b": 1, "a": {"b": 2, "c": {"d": None}}, "e": [1, {"f": 2}], "g": {}}
+    
+    assert flatten_dict(data) == {"a_b": 2, "a_c_d": None, "e": [1, {"f": 2}]}
+    assert list(flatten_dict(data, sep=".")) == ["a_b", "a.b", "a.c.d", "e"]
+    assert flatten_dict({"x": 1}, parent_key="root") == {"root_x": 1}
+
+def test_columnar_builder_matches_row_dataframe():
+    from dataops.converters.json_to_excel import ColumnarBuilder
+    
+    rows = [{"a": 1, "b": "x", "c": True}, {"a": None, "d": 1.5}, {"b": None, "c": False}, {}]
+    builder = ColumnarBuilder()
+    for row in rows:
+        builder.append(row)
+    
+    assert len(builder) == 4
+    pd.testing.assert_frame_equal(builder.to_frame(), pd.DataFrame(rows))
+
+def _rows_one_by_one(lists, fields):
+    from dataops.converters.json_to_excel import ColumnarBuilder, _iter_rows
+    builder = ColumnarBuilder()
+    for row in _iter_rows(((path, obj) for path, objects in lists for obj in objects), fields):
+        builder.append(row)
+    return builder.to_frame()
+
+@pytest.mark.parametrize("fields", [
+    None,
+    {"pin": "PIN", "name": "Name", "value": "Value", "missing": "Missing"},
+    {"pin": "PIN", "info_pin": "PIN"},
+])
+def test_batched_columns_match_row_path(fields):
+    from dataops.converters.json_to_excel import BATCH_MIN_OBJECTS, _build_columns
+    
+    n = BATCH_MIN_OBJECTS
+    lists = [
+        # Same layout, with None values, a colliding key and an empty nested dict
+        ("a", [{"name": None if i % 3 else f"n{i}", "info": {"pin": i, "x": {}}, "info_pin": -i,
+                "value": None} for i in range(n)]),
+        # Rows without any mapped value, headers first set in later rows
+        ("b", [{"value": None if i < 5 else i, "pin": None if i % 2 else str(i)} for i in range(n)]),
+        # Different key orders and a value that is a dict in only some objects
+        ("c", [{"pin": 1, "name": "x"}, {"name": "y", "pin": 2}] * n),
+        ("d", [{"pin": {"id": 1} if i == 3 else i} for i in range(n)]),
+        ("e", [{}] * n),
+        ("f", [{"name": "short", "extra": [1, 2]}]),
+    ]
+    frame = _build_columns(lists, fields).to_frame()
+    expected = _rows_one_by_one(lists, fields)
+    
+    assert list(frame.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(frame, expected)
@@ -0,0 +1,62 @@
+import gzip
+import json
+import math
+import numpy as np
+import pytest
+import pandas as pd
+from click.testing import CliRunner
+from dataops.cli import main
+from dataops.converters import convert_csv_to_json
+from dataops.utils.json_backend import available_backends, dumps, get_json_backend
+
+RECORDS = [
+    {"id": 1, "name": "Zoë", "score": float("nan"), "tags": ["a", {"b": []}], "empty": {}},
+    {"id": np.int64(2), "name": "a/b \"q\"\n", "score": np.float64(1.5), "when": pd.Timestamp("2024-01-02 03:04:05")},
+    {"id": 3, "name": None, "score": math.inf, "when": pd.NaT, "missing": pd.NA},
+]
+
+EXPECTED = [
+    {"id": 1, "name": "Zoë", "score": None, "tags": ["a", {"b": []}], "empty": {}},
+    {"id": 2, "name": "a/b \"q\"\n", "score": 1.5, "when": "2024-01-02T03:04:05"},
+    {"id": 3, "name": None, "score": None, "when": None, "missing": None},
+]
+
+@pytest.mark.parametrize("backend", available_backends())
+@pytest.mark.parametrize("indent", [None, 0, 2, 4])
+def test_backends_write_the_same_document(backend, indent):
+    reference = json.dumps(EXPECTED, indent=indent, ensure_ascii=False,
+                           separators=(",", ":") if indent is None else (",", ": "))
+
+    assert dumps(RECORDS, indent=indent, backend=backend).decode("utf-8") == reference
+
+def test_get_json_backend(monkeypatch):
+    monkeypatch.setenv("DATAOPS_JSON_BACKEND", "json")
+    assert get_json_backend() == "json"
+    assert get_json_backend("auto") == available_backends()[0]
+
+    with pytest.raises(ValueError, match="Unsupported JSON backend"):
+        get_json_backend("simplejson")
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_csv_to_json_streamed_matches_whole_file(tmp_path, indent):
+    csv_file = tmp_path / "test.csv"
+    pd.DataFrame({"id": [1, 2, 3], "score": [0.5, None, 2.0], "name": ["a", None, "c"]}).to_csv(csv_file, index=False)
+
+    convert_csv_to_json(str(csv_file), str(tmp_path / "whole.json"), indent=indent)
+    convert_csv_to_json(str(csv_file), str(tmp_path / "streamed.json"), chunksize=2, indent=indent)
+
+    whole = (tmp_path / "whole.json").read_text(encoding="utf-8")
+    assert (tmp_path / "streamed.json").read_text(encoding="utf-8") == whole
+    assert json.loads(whole)[1] == {"id": 2, "score": None, "name": None}
+    assert ("\n" in whole) == (indent is not None)
+
+def test_cli_compact_output(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    json_file = tmp_path / "output.json.gz"
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_csv(csv_file, index=False)
+
+    result = CliRunner().invoke(main, ["csv-to-json", str(csv_file), str(json_file), "--compact", "--json-backend", "json"])
+
+    assert result.exit_code == 0, result.output
+    with gzip.open(json_file, "rt", encoding="utf-8") as f:
+        assert f.read() == '[{"id":1,"name":"a"},{"id":2,"name":"b"}]'
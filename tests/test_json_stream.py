@@ -0,0 +1,105 @@
+import pytest
+import pandas as pd
+import json
+from dataops.converters import convert_json_to_excel
+from dataops.converters.json_to_excel import find_lists_of_objects, iter_lists_of_objects
+from dataops.utils.json_stream import MixedListError, iter_json_objects, iter_ndjson_objects
+
+DOCUMENTS = [
+    [{"a": 1}, {"a": 2, "b": {"c": [1, 2]}}],
+    {
+        "took": 310,
+        "hits": {"total": 2, "hits": []},
+        "aggregations": {
+            "by_upozila": {
+                "buckets": [
+                    {"key": "0108", "doc_count": 49, "sub": {"buckets": [{"key": "x"}]}},
+                    {"key": "0114", "doc_count": 31.5}
+                ]
+            }
+        }
+    },
+    {"matrix": [[{"x": 1}, {"x": 2}], [3, {"y": [{"z": True}]}]], "empty": {}, "none": None},
+    {"text": 'a "quoted" [value] {with} brackets', "list": ["s", -1.5e3, False]},
+    42,
+]
+
+def expected_objects(data):
+    return [(path, obj) for path, lst in find_lists_of_objects(data) for obj in lst]
+
+@pytest.mark.parametrize("data", DOCUMENTS)
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_iter_json_objects_matches_recursive_path(tmp_path, data, chunk_size):
+    json_file = tmp_path / "doc.json"
+    with open(json_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    
+    assert list(iter_json_objects(json_file, chunk_size=chunk_size)) == expected_objects(data)
+
+def test_iter_json_objects_detects_mixed_list(tmp_path):
+    json_file = tmp_path / "mixed.json"
+    with open(json_file, 'w') as f:
+        json.dump({"items": [{"a": 1}, 2]}, f)
+    
+    with pytest.raises(MixedListError):
+        list(iter_json_objects(json_file))
+
+def test_iter_ndjson_objects(tmp_path):
+    ndjson_file = tmp_path / "rows.ndjson"
+    ndjson_file.write_text('{"a": 1}\n\n{"a": 2}\n')
+    
+    assert list(iter_ndjson_objects(ndjson_file)) == [("", {"a": 1}), ("", {"a": 2})]
+
+@pytest.mark.parametrize("data", [
+    {"items": [{"info": {"name": "Alice"}}, {"info": {"name": "Bob"}}]},
+    {"items": [{"info": {"name": "Alice"}}, [{"info": {"name": "Bob"}}]]},
+])
+def test_json_to_excel_streaming_matches_default(tmp_path, data):
+    json_file = tmp_path / "test.json"
+    expected_file = tmp_path / "expected.xlsx"
+    excel_file = tmp_path / "output.xlsx"
+    with open(json_file, 'w') as f:
+        json.dump(data, f)
+    
+    convert_json_to_excel(str(json_file), str(expected_file))
+    convert_json_to_excel(str(json_file), str(excel_file), streaming=True)
+    
+    pd.testing.assert_frame_equal(pd.read_excel(excel_file), pd.read_excel(expected_file))
+
+def test_ndjson_to_excel(tmp_path):
+    ndjson_file = tmp_path / "test.ndjson"
+    excel_file = tmp_path / "output.xlsx"
+    ndjson_file.write_text('{"key": "0108", "doc_count": 49}\n{"key": "0114", "doc_count": 31}\n')
+    
+    convert_json_to_excel(str(ndjson_file), str(excel_file), fields={"key": "id"})
+    
+    df = pd.read_excel(excel_file, dtype=str)
+    assert df["id"].tolist() == ["0108", "0114"]
+
+def test_iter_lists_of_objects_is_lazy_and_handles_deep_documents():
+    lists = iter_lists_of_objects(DOCUMENTS[2])
+    assert next(lists) == ("matrix_0", [{"x": 1}, {"x": 2}])
+    assert list(lists) == [("matrix_1_1_y", [{"z": True}])]
+
+    deep = [{"leaf": 1}]
+    for _ in range(5000):
+        deep = {"k": [0, deep]}
+    path, objects = find_lists_of_objects(deep)[0]
+    assert path == "_".join(["k_1"] * 5000) and objects == [{"leaf": 1}]
+
+def test_find_lists_of_objects_path_filters():
+    document = DOCUMENTS[1]
+    assert find_lists_of_objects(document, paths="aggregations_*_buckets") == [
+        ("aggregations_by_upozila_buckets", document["aggregations"]["by_upozila"]["buckets"])]
+    assert [path for path, _ in find_lists_of_objects(DOCUMENTS[2], paths=["matrix_1_*", "none"])] == ["matrix_1_1_y"]
+    assert find_lists_of_objects(document, paths="missing_*") == []
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_json_to_excel_path_filter(tmp_path, streaming):
+    json_file = tmp_path / "test.json"
+    excel_file = tmp_path / "output.xlsx"
+    json_file.write_text(json.dumps(DOCUMENTS[1]))
+
+    convert_json_to_excel(str(json_file), str(excel_file), streaming=streaming, paths=["aggregations_*_buckets"])
+
+    assert pd.read_excel(excel_file, dtype=str)["key"].tolist() == ["0108", "0114"]
@@ -1,6 +1,7 @@
+import re
 import pytest
 from pathlib import Path
-from dataops.utils.logger import setup_logger
+from dataops.utils.logger import configure_logging, setup_logger, shutdown_logging
 
 def test_logger_creates_file(tmp_path, monkeypatch):
     # Monkeypatch Path("logs") to use tmp_path so we don't pollute current dir
@@ -15,3 +16,42 @@ def test_logger_creates_file(tmp_path, monkeypatch):
     with open(log_file, "r") as f:
         content = f.read()
         assert "Test log message" in content
+
+@pytest.fixture
+def restore_logging():
+    yield
+    configure_logging()
+
+def test_configured_log_dir(tmp_path, restore_logging):
+    configure_logging(log_dir=tmp_path / "custom")
+
+    setup_logger("test_logger_dir").info("Rows: %s", 42)
+
+    assert "Rows: 42" in (tmp_path / "custom" / "dataops.log").read_text()
+
+def test_async_logging_writes_in_background(tmp_path, restore_logging):
+    configure_logging(log_dir=tmp_path, async_mode=True)
+    logger = setup_logger("test_logger_async")
+    for i in range(1000):
+        logger.info("Record %s", i)
+    logger.debug("Filtered %s", object())
+
+    shutdown_logging()
+
+    lines = (tmp_path / "dataops.log").read_text().splitlines()
+    assert len(lines) == 1000
+    assert lines[-1].endswith("Record 999")
+
+def test_async_logging_drops_records_when_queue_is_full(tmp_path, restore_logging):
+    configure_logging(log_dir=tmp_path, async_mode=True, queue_size=1, overflow="drop")
+    logger = setup_logger("test_logger_drop")
+    for i in range(1000):
+        logger.info("Record %s", i)
+
+    shutdown_logging()
+
+    content = (tmp_path / "dataops.log").read_text()
+    assert "Record 0" in content
+    dropped = re.search(r"Dropped (\d+) log records", content)
+    dropped = int(dropped.group(1)) if dropped else 0
+    assert dropped + content.count("Record ") == 1000
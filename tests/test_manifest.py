@@ -0,0 +1,135 @@
+import os
+import pytest
+import pandas as pd
+from dataops.batch import run_batch
+from dataops.merger import merge_csv_files
+from dataops.utils.manifest import SAMPLE_BYTES, Manifest, fingerprint, is_appended, is_unchanged
+from dataops.validator import validate_csv_data
+
+def _shard(path, rows, **columns):
+    pd.DataFrame({"id": rows, "name": [f"n{i}" for i in rows], **columns}).to_csv(path, index=False)
+    return str(path)
+
+def test_fingerprint_detects_changes_and_appends(tmp_path):
+    path = tmp_path / "feed.csv"
+    path.write_text("a\n1\n")
+    recorded = fingerprint(path, content=True)
+    assert is_unchanged(path, recorded) and not is_appended(path, recorded)
+
+    with open(path, "a") as f:
+        f.write("2\n")
+    assert not is_unchanged(path, recorded) and is_appended(path, recorded)
+
+    path.write_text("a\n3\n4\n")
+    assert not is_appended(path, recorded)
+    assert not is_unchanged(tmp_path / "missing.csv", recorded)
+
+def test_append_after_an_edit_in_the_middle_is_not_an_append(tmp_path):
+    feed = tmp_path / "feed.csv"
+    rows = [f"{i},name{i}\n" for i in range(20_000)]
+    feed.write_text("id,name\n" + "".join(rows))
+    assert feed.stat().st_size > 2 * SAMPLE_BYTES
+    manifest = str(tmp_path / "manifest.json")
+    assert validate_csv_data(str(feed), manifest=manifest)["duplicates"] == 0
+    recorded = fingerprint(feed, content=True)
+
+    # Same size, outside the sampled head and tail: row 10000 becomes a copy of row 10001
+    rows[10_000] = rows[10_001]
+    feed.write_text("id,name\n" + "".join(rows) + "20000,new\n")
+    assert not is_appended(feed, recorded)
+    report = validate_csv_data(str(feed), manifest=manifest)
+    assert report == validate_csv_data(str(feed), chunksize=5_000)
+    assert report["duplicates"] == 1
+
+def test_manifest_round_trip(tmp_path):
+    manifest = Manifest(tmp_path / "m.json")
+    manifest.set("job", {"count": 1})
+    manifest.save()
+    assert Manifest(tmp_path / "m.json").get("job") == {"count": 1}
+    assert manifest.state_path("job") != manifest.state_path("other")
+
+    (tmp_path / "broken.json").write_text("{")
+    assert Manifest(tmp_path / "broken.json").entries == {}
+
+def test_incremental_concat_appends_and_resumes(tmp_path):
+    shards = [_shard(tmp_path / f"day{i}.csv", [2 * i, 2 * i + 1]) for i in range(3)]
+    output, expected = tmp_path / "all.csv", tmp_path / "expected.csv"
+    manifest = str(tmp_path / "manifest.json")
+
+    merge_csv_files(shards[:2], str(output), manifest=manifest)
+    first_size = os.path.getsize(output)
+    merge_csv_files(shards, str(output), manifest=manifest)
+    merge_csv_files(shards, str(expected), chunksize=1)
+    assert output.read_bytes() == expected.read_bytes()
+    assert output.read_bytes()[:first_size] == expected.read_bytes()[:first_size]
+
+    # A run that died while appending left a partial row behind
+    with open(output, "a") as f:
+        f.write("99,partial")
+    merge_csv_files(shards, str(output), manifest=manifest)
+    assert output.read_bytes() == expected.read_bytes()
+
+    # A changed shard is rewritten along with every shard after it
+    _shard(shards[1], [7, 7, 7])
+    merge_csv_files(shards, str(output), manifest=manifest)
+    merge_csv_files(shards, str(expected), chunksize=1)
+    assert output.read_bytes() == expected.read_bytes()
+
+def test_incremental_concat_rewrites_on_new_columns(tmp_path):
+    shards = [_shard(tmp_path / "a.csv", [1]), _shard(tmp_path / "b.csv", [2])]
+    output, manifest = tmp_path / "all.csv", str(tmp_path / "manifest.json")
+    merge_csv_files(shards, str(output), manifest=manifest)
+    shards.append(_shard(tmp_path / "c.csv", [3], extra=["x"]))
+    merge_csv_files(shards, str(output), manifest=manifest)
+    assert pd.read_csv(output).columns.tolist() == ["id", "name", "extra"]
+    assert pd.read_csv(output)["id"].tolist() == [1, 2, 3]
+
+def test_incremental_concat_needs_plain_csv_output(tmp_path):
+    shards = [_shard(tmp_path / "a.csv", [1])]
+    with pytest.raises(ValueError, match="uncompressed CSV"):
+        merge_csv_files(shards, str(tmp_path / "all.csv.gz"), manifest=str(tmp_path / "m.json"))
+
+@pytest.mark.parametrize("duplicates", ["exact", "approx"])
+def test_incremental_validation_matches_full_pass(tmp_path, duplicates):
+    feed = tmp_path / "feed.csv"
+    manifest = str(tmp_path / "manifest.json")
+    pd.DataFrame({"id": ["1", "2", "2", None], "name": ["a", "b", "b", None]}).to_csv(feed, index=False)
+    first = validate_csv_data(str(feed), duplicates=duplicates, manifest=manifest, memory_limit=16)
+    assert first["total_rows"] == 4 and first["duplicates"] == 1
+
+    pd.DataFrame({"id": ["1", "3", "2"], "name": ["a", None, "b"]}).to_csv(feed, mode="a", header=False, index=False)
+    appended = validate_csv_data(str(feed), duplicates=duplicates, manifest=manifest, memory_limit=16)
+    full = validate_csv_data(str(feed), duplicates=duplicates, chunksize=2)
+    assert appended == full
+    assert appended["total_rows"] == 7 and appended["duplicates"] == 3
+
+    # Unchanged: the saved report is reused
+    assert validate_csv_data(str(feed), duplicates=duplicates, manifest=manifest) == full
+
+    # Rewritten: validated from the start
+    pd.DataFrame({"id": [5], "name": ["e"]}).to_csv(feed, index=False)
+    assert validate_csv_data(str(feed), duplicates=duplicates, manifest=manifest)["total_rows"] == 1
+
+def test_batch_skips_unchanged_files(tmp_path):
+    source = tmp_path / "in"
+    source.mkdir()
+    for i in range(3):
+        _shard(source / f"part{i}.csv", [i])
+    out_dir, manifest = tmp_path / "out", str(tmp_path / "manifest.json")
+
+    first = run_batch("csv_to_json", str(source), out_dir=str(out_dir), workers=1, manifest=manifest)
+    assert not any(r.get("skipped") for r in first)
+
+    _shard(source / "part1.csv", [1, 11])
+    (out_dir / "part2.json").unlink()
+    second = run_batch("csv_to_json", str(source), out_dir=str(out_dir), workers=1, manifest=manifest)
+    assert [bool(r.get("skipped")) for r in second] == [True, False, False]
+
+    # Different options are a different result
+    third = run_batch("csv_to_json", str(source), out_dir=str(out_dir), workers=1, manifest=manifest, indent=None)
+    assert not any(r.get("skipped") for r in third)
+
+    reports = run_batch("validate", str(source), workers=1, manifest=manifest)
+    again = run_batch("validate", str(source), workers=1, manifest=manifest)
+    assert all(r.get("skipped") for r in again)
+    assert [r["report"]["total_rows"] for r in again] == [r["report"]["total_rows"] for r in reports] == [1, 2, 1]
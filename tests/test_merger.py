@@ -16,3 +16,117 @@ def test_merge_csv_files(tmp_path):
     df = pd.read_csv(output)
     assert len(df) == 2
     assert df["a"].tolist() == [1, 2]
+
+@pytest.mark.parametrize("suffix", [".csv", ".xlsx"])
+def test_merge_csv_files_streaming(tmp_path, suffix):
+    file1 = tmp_path / "file1.csv"
+    file2 = tmp_path / "file2.csv"
+    output = tmp_path / f"merged{suffix}"
+    
+    pd.DataFrame([{"a": 1, "b": "x"}, {"a": 2, "b": "y"}, {"a": 3, "b": "z"}]).to_csv(file1, index=False)
+    pd.DataFrame([{"c": True, "a": 4}]).to_csv(file2, index=False)
+    
+    merge_csv_files([str(file1), str(file2)], str(output), chunksize=2)
+    
+    df = pd.read_csv(output) if suffix == ".csv" else pd.read_excel(output)
+    assert list(df.columns) == ["a", "b", "c"]
+    assert df["a"].tolist() == [1, 2, 3, 4]
+    assert df["c"].isna().tolist() == [True, True, True, False]
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_join_out_of_core_matches_in_memory(tmp_path, how):
+    file1 = tmp_path / "customers.csv"
+    file2 = tmp_path / "events.csv"
+    expected = tmp_path / "expected.csv"
+    output = tmp_path / "merged.csv"
+    
+    pd.DataFrame({
+        "id": [f"c{i}" for i in range(40)] + [None],
+        "name": [f"name{i}" for i in range(41)],
+    }).to_csv(file1, index=False)
+    pd.DataFrame({
+        "customer": [f"c{i % 60}" for i in range(0, 120, 3)] + [None],
+        "event": [f"e{i}" for i in range(41)],
+    }).to_csv(file2, index=False)
+    
+    merge_csv_files([str(file1), str(file2)], str(expected), join_on=["id", "customer"], how=how)
+    merge_csv_files([str(file1), str(file2)], str(output), join_on=["id", "customer"], how=how,
+                    memory_limit="1KB")
+    
+    df_expected = pd.read_csv(expected, dtype=str)
+    df = pd.read_csv(output, dtype=str)
+    assert list(df.columns) == list(df_expected.columns)
+    sort_cols = list(df.columns)
+    pd.testing.assert_frame_equal(
+        df.sort_values(sort_cols).reset_index(drop=True),
+        df_expected.sort_values(sort_cols).reset_index(drop=True),
+    )
+
+def _sorted(df):
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("memory_limit", [None, "1KB"])
+def test_merge_multiway_join_matches_chained_merges(tmp_path, how, memory_limit):
+    frames = [
+        pd.DataFrame({"id": [f"k{i}" for i in range(20)], "a": [f"a{i}" for i in range(20)]}),
+        pd.DataFrame({"key": [f"k{i % 8}" for i in range(30)], "b": [f"b{i}" for i in range(30)]}),
+        pd.DataFrame({"id": [f"k{i}" for i in range(5, 12)], "c": [f"c{i}" for i in range(7)]}),
+    ]
+    paths = []
+    for idx, df in enumerate(frames):
+        paths.append(str(tmp_path / f"file{idx}.csv"))
+        df.to_csv(paths[-1], index=False)
+    output = tmp_path / "merged.csv"
+    
+    merge_csv_files(paths, str(output), join_on=["id", "key", "id"], how=how, memory_limit=memory_limit)
+    
+    expected = frames[0]
+    for df in frames[1:]:
+        expected = pd.merge(expected, df.rename(columns={"key": "id"}), on="id", how=how)
+    expected.to_csv(tmp_path / "expected.csv", index=False)
+    
+    df = pd.read_csv(output, dtype=str)
+    assert list(df.columns) == ["id", "a", "b", "c"]
+    pd.testing.assert_frame_equal(_sorted(df), _sorted(pd.read_csv(tmp_path / "expected.csv", dtype=str)))
+
+def test_merge_multiway_join_suffixes_clashing_columns(tmp_path):
+    paths = []
+    for idx in range(3):
+        paths.append(str(tmp_path / f"file{idx}.csv"))
+        pd.DataFrame({"id": ["x"], "val": [f"v{idx}"]}).to_csv(paths[-1], index=False)
+    output = tmp_path / "merged.csv"
+    
+    merge_csv_files(paths, str(output), join_on=["id"])
+    
+    df = pd.read_csv(output)
+    assert list(df.columns) == ["id", "val_1", "val_2", "val_3"]
+    assert df.iloc[0].tolist() == ["x", "v0", "v1", "v2"]
+
+def test_merge_csv_files_parallel_preserves_order_and_text(tmp_path):
+    paths = []
+    for idx in range(7):
+        paths.append(str(tmp_path / f"shard{idx}.csv"))
+        columns = "a,b\n" if idx % 2 else "b,a,c\n"
+        row = f"{idx}.50,x{idx}\n" if idx % 2 else f"y{idx},{idx},\n"
+        with open(paths[-1], "w") as f:
+            f.write(columns + row)
+    output = tmp_path / "merged.csv"
+    
+    merge_csv_files(paths, str(output), workers=3)
+    
+    df = pd.read_csv(output, dtype=str)
+    assert list(df.columns) == ["b", "a", "c"]
+    assert df["a"].tolist() == ["0", "1.50", "2", "3.50", "4", "5.50", "6"]
+
+def test_merge_parquet_inputs_and_output(tmp_path):
+    pytest.importorskip("pyarrow")
+    file1 = tmp_path / "file1.parquet"
+    file2 = tmp_path / "file2.csv"
+    output = tmp_path / "merged.parquet"
+    pd.DataFrame({"id": [1, 2], "name": ["A", "B"]}).to_parquet(file1, index=False)
+    pd.DataFrame({"id": [1, 2], "score": [10, 20]}).to_csv(file2, index=False)
+    
+    merge_csv_files([str(file1), str(file2)], str(output), join_on=["id"])
+    
+    assert pd.read_parquet(output).to_dict(orient="list") == {"id": [1, 2], "name": ["A", "B"], "score": [10, 20]}
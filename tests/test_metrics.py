@@ -0,0 +1,79 @@
+import json
+import time
+import pytest
+import pandas as pd
+from click.testing import CliRunner
+from dataops.cli import main
+from dataops.converters import convert_csv_to_json, convert_json_to_excel
+from dataops.utils.metrics import collect_metrics, current_metrics, stage, timed
+
+def test_stage_times_are_exclusive():
+    with collect_metrics() as metrics:
+        with stage("outer"):
+            time.sleep(0.02)
+            with stage("inner") as timer:
+                time.sleep(0.05)
+                timer.rows = 10
+        assert current_metrics() is metrics
+    assert current_metrics() is None
+
+    result = metrics.as_dict()
+    assert 0.015 < result["stages"]["outer"]["seconds"] < 0.045
+    assert result["stages"]["inner"]["seconds"] >= 0.05
+    assert result["stages"]["inner"]["rows"] == 10
+    assert result["stages"]["inner"]["rows_per_second"] > 0
+    assert result["peak_rss_bytes"] > 0
+
+def test_timed_counts_chunks_and_is_inert_without_collector():
+    chunks = [[1, 2], [3]]
+    assert list(timed(chunks, "read")) == chunks
+
+    with collect_metrics() as metrics:
+        assert list(timed(chunks, "read")) == chunks
+    assert metrics.stages["read"]["calls"] == 2
+    assert metrics.stages["read"]["rows"] == 3
+
+def test_csv_to_json_stages(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    pd.DataFrame({"id": range(10), "name": list("abcdefghij")}).to_csv(csv_file, index=False)
+
+    with collect_metrics() as metrics:
+        convert_csv_to_json(str(csv_file), str(tmp_path / "out.json"), chunksize=4)
+
+    result = metrics.as_dict()
+    assert {"read", "transform", "serialize", "write"} <= set(result["stages"])
+    assert result["stages"]["read"]["rows"] == 10
+    assert result["stages"]["write"]["rows"] == 10
+    assert result["counters"]["bytes_read"] == csv_file.stat().st_size
+    assert result["counters"]["bytes_written"] == (tmp_path / "out.json").stat().st_size
+    assert sum(entry["seconds"] for entry in result["stages"].values()) <= result["wall_seconds"]
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_json_to_excel_stages(tmp_path, streaming):
+    json_file = tmp_path / "test.json"
+    json_file.write_text(json.dumps({"rows": [{"a": {"b": i}, "c": i} for i in range(5)]}))
+
+    with collect_metrics() as metrics:
+        convert_json_to_excel(str(json_file), str(tmp_path / "out.xlsx"), fields={"b": "B"}, streaming=streaming)
+
+    stages = metrics.as_dict()["stages"]
+    assert {"parse", "flatten", "match", "transform", "write"} <= set(stages)
+    assert stages["write"]["rows"] == 5
+
+def test_cli_profile_and_metrics_json(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    metrics_file = tmp_path / "metrics.json"
+    profile_file = tmp_path / "cpu.prof"
+    pd.DataFrame({"id": [1, 1, 2]}).to_csv(csv_file, index=False)
+
+    result = CliRunner().invoke(main, ["--profile", "--metrics-json", str(metrics_file), "--cprofile", str(profile_file),
+                                       "--trace-memory", "validate", str(csv_file), "--chunksize", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert "validate" in result.output and "wall" in result.output
+    metrics = json.loads(metrics_file.read_text())
+    assert metrics["command"] == "validate"
+    assert metrics["stages"]["validate"]["rows"] == 3
+    assert metrics["tracemalloc"]["peak_bytes"] > 0
+    assert profile_file.stat().st_size > 0
+    assert current_metrics() is None
@@ -0,0 +1,118 @@
+import json
+import pytest
+import pandas as pd
+from click.testing import CliRunner
+from dataops.cli import main
+from dataops.merger import merge_csv_files
+from dataops.pipeline import Pipeline, run_pipeline
+from dataops.validator import validate_csv_data
+
+@pytest.fixture
+def inputs(tmp_path):
+    orders = tmp_path / "orders.csv"
+    customers = tmp_path / "customers.csv"
+    pd.DataFrame({"id": [3, 1, 2, 1, 5, 3, 1], "amount": [10, 20, 30, 20, 50, 60, 70]}).to_csv(orders, index=False)
+    pd.DataFrame({"id": [1, 2, 3, 4], "name": ["a", "b", "c", "d"]}).to_csv(customers, index=False)
+    return str(orders), str(customers)
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_pipeline_join_matches_merge(tmp_path, inputs, how):
+    expected = tmp_path / "expected.csv"
+    output = tmp_path / "out.csv"
+    merge_csv_files(list(inputs), str(expected), join_on=["id"], how=how)
+
+    pipeline = Pipeline(chunksize=2)
+    merged = pipeline.merge(list(inputs), on="id", how=how)
+    pipeline.write(merged, str(output))
+    results = pipeline.run()
+
+    pd.testing.assert_frame_equal(pd.read_csv(output), pd.read_csv(expected))
+    assert results[merged]["rows"] == len(pd.read_csv(expected))
+
+def test_pipeline_from_yaml_validates_and_converts(tmp_path, inputs):
+    orders, customers = inputs
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps({"columns": {"amount": {"max": 60}}}))
+    config = tmp_path / "pipeline.yaml"
+    config.write_text(f"""
+chunksize: 3
+stages:
+  - name: merged
+    step: merge
+    inputs: ['{orders}', '{customers}']
+    on: id
+  - name: checked
+    step: validate
+    input: merged
+    rules: '{rules}'
+    output: '{tmp_path / "report.json"}'
+  - step: write
+    input: checked
+    path: '{tmp_path / "out.ndjson"}'
+""")
+    results = run_pipeline(str(config))
+
+    merged_file = tmp_path / "merged.csv"
+    merge_csv_files([orders, customers], str(merged_file), join_on=["id"])
+    expected = validate_csv_data(str(merged_file), rules=str(rules))
+    report = results["checked"]["report"]
+    assert report["total_rows"] == expected["total_rows"] == 6
+    assert report["duplicates"] == expected["duplicates"] == 1
+    assert report["rule_violations"] == expected["rule_violations"]
+    assert json.loads((tmp_path / "report.json").read_text())["total_rows"] == 6
+
+    lines = (tmp_path / "out.ndjson").read_text().splitlines()
+    assert [json.loads(line)["amount"] for line in lines] == [10, 20, 30, 20, 60, 70]
+
+def test_pipeline_fan_out_and_shared_upstream_concat(tmp_path, inputs):
+    orders, _ = inputs
+    pipeline = Pipeline(chunksize=1, buffer=1)
+    filtered = pipeline.read(orders, name="big", filters=["amount>=50"])
+    # Both inputs come from orders.csv: must not deadlock on the bounded queues
+    both = pipeline.merge([orders, filtered])
+    pipeline.write(both, str(tmp_path / "both.csv"))
+    pipeline.write(orders, str(tmp_path / "copy.csv"))
+    pipeline.run()
+
+    assert pd.read_csv(tmp_path / "both.csv")["amount"].tolist() == [10, 20, 30, 20, 50, 60, 70, 50, 60, 70]
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "copy.csv"), pd.read_csv(orders))
+
+def test_pipeline_spill(tmp_path, inputs):
+    orders, customers = inputs
+    spill = tmp_path / "merged.csv"
+    pipeline = Pipeline(chunksize=2)
+    merged = pipeline.merge([orders, customers], on="id", spill=str(spill))
+    pipeline.merge([merged], spill=True, name="copy")
+    pipeline.write("copy", str(tmp_path / "out.csv"))
+    pipeline.run()
+
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "out.csv"), pd.read_csv(spill))
+    assert len(pd.read_csv(spill)) == 6
+
+def test_pipeline_stops_every_stage_on_error(tmp_path, inputs):
+    orders, _ = inputs
+    pipeline = Pipeline(chunksize=1, buffer=1)
+    pipeline.write(orders, str(tmp_path / "copy.csv"))
+    pipeline.merge([orders, str(tmp_path / "missing.csv")], on="id")
+    with pytest.raises(FileNotFoundError):
+        pipeline.run()
+
+def test_pipeline_rejects_unknown_steps_and_forward_references():
+    with pytest.raises(ValueError, match="Unknown pipeline step"):
+        Pipeline().add("sort", ["a.csv"])
+    config = {"stages": [{"step": "write", "input": "merged", "path": "out.csv"},
+                         {"step": "merge", "name": "merged", "inputs": ["a.csv", "b.csv"]}]}
+    with pytest.raises(ValueError, match="before it is defined"):
+        run_pipeline(config)
+
+def test_cli_pipeline(tmp_path, inputs):
+    orders, customers = inputs
+    config = tmp_path / "pipeline.json"
+    config.write_text(json.dumps({"stages": [
+        {"step": "merge", "name": "all", "inputs": [orders, customers]},
+        {"step": "write", "input": "all", "path": str(tmp_path / "all.json"), "indent": None},
+    ]}))
+    result = CliRunner().invoke(main, ["pipeline", str(config), "--chunksize", "2"])
+    assert result.exit_code == 0, result.output
+    assert "all (merge): 11 rows" in result.output
+    assert len(json.loads((tmp_path / "all.json").read_text())) == 11
@@ -0,0 +1,78 @@
+import pytest
+import pandas as pd
+import json
+from dataops.validator import validate_csv_data
+from dataops.validator.rules import RuleSet
+
+RULES_YAML = """
+columns:
+  id:
+    dtype: int
+    required: true
+    unique: true
+  age:
+    min: 0
+    max: 120
+  status:
+    allowed: [active, inactive]
+  email:
+    regex: '[^@]+@[^@]+'
+checks:
+  - name: end_after_start
+    expr: "end >= start"
+"""
+
+def test_validate_with_rules(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    rules_file = tmp_path / "rules.yaml"
+    rules_file.write_text(RULES_YAML)
+    
+    pd.DataFrame([
+        {"id": "1", "age": 30, "status": "active", "email": "a@x", "start": 1, "end": 2},
+        {"id": "2", "age": -1, "status": "gone", "email": "bad", "start": 5, "end": 4},
+        {"id": "1", "age": 200, "status": None, "email": "b@x", "start": 1, "end": None},
+        {"id": "x", "age": 40, "status": "inactive", "email": "c@x", "start": 1, "end": 1},
+        {"id": None, "age": None, "status": "active", "email": "d@x", "start": 3, "end": 9},
+    ]).to_csv(csv_file, index=False)
+    
+    report = validate_csv_data(str(csv_file), chunksize=2, rules=str(rules_file))
+    violations = report["rule_violations"]
+    
+    assert report["total_rows"] == 5
+    assert violations["id.dtype"] == {"failed": 1, "sample": [3]}
+    assert violations["id.required"] == {"failed": 1, "sample": [4]}
+    assert violations["id.unique"] == {"failed": 1, "sample": [2]}
+    assert violations["age.min"] == {"failed": 1, "sample": [1]}
+    assert violations["age.max"] == {"failed": 1, "sample": [2]}
+    assert violations["status.allowed"] == {"failed": 1, "sample": [1]}
+    assert violations["email.regex"] == {"failed": 1, "sample": [1]}
+    assert violations["end_after_start"] == {"failed": 1, "sample": [1]}
+
+def test_unique_across_many_chunks(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    rules_file = tmp_path / "rules.json"
+    rules_file.write_text(json.dumps({"columns": {"code": {"unique": True}}}))
+    codes = ["a", "b", "c", "d", "a", "e", "b", "b", "f", "c", "g", "a", "h"]
+    pd.DataFrame({"code": codes}).to_csv(csv_file, index=False)
+
+    report = validate_csv_data(str(csv_file), chunksize=2, rules=str(rules_file))
+
+    assert report["rule_violations"]["code.unique"] == {"failed": 5, "sample": [4, 6, 7, 9, 11]}
+
+def test_rules_reject_unknown_column():
+    with pytest.raises(ValueError):
+        RuleSet({"columns": {"missing": {"required": True}}}, ["a"])
+
+def test_validate_rules_cli(tmp_path):
+    from click.testing import CliRunner
+    from dataops.cli import main
+    
+    csv_file = tmp_path / "test.csv"
+    rules_file = tmp_path / "rules.json"
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(csv_file, index=False)
+    rules_file.write_text(json.dumps({"columns": {"a": {"max": 2}}}))
+    
+    result = CliRunner().invoke(main, ["validate", str(csv_file), "--rules", str(rules_file)])
+    
+    assert result.exit_code == 0
+    assert "'a.max': {'failed': 1, 'sample': [2]}" in result.output
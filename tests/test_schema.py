@@ -0,0 +1,86 @@
+import json
+import pytest
+import pandas as pd
+from click.testing import CliRunner
+from dataops.cli import main
+from dataops.converters import convert_csv_to_json
+from dataops.utils.file_io import read_table, read_table_chunks
+from dataops.utils.schema import infer_schema, schema_path_for
+from dataops.validator import validate_csv_data
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({
+        "id": range(1, 101),
+        "score": pd.array([None if i % 10 == 0 else i for i in range(100)], dtype="Int64"),
+        "price": [i / 4 for i in range(100)],
+        "city": ["Dhaka", "Paris", "Lima", "Oslo"] * 25,
+        "zip": [f"0{i:03d}" for i in range(100)],
+        "active": [True, False] * 50,
+    }).to_csv(path, index=False)
+    return path
+
+def test_infer_schema(csv_file):
+    schema = infer_schema(csv_file)
+    
+    assert schema["columns"] == {
+        "id": "integer", "score": "integer", "price": "float",
+        "city": "category", "zip": "string", "active": "boolean",
+    }
+
+def test_read_table_with_auto_schema(csv_file):
+    df = read_table(csv_file, schema="auto")
+    
+    assert schema_path_for(csv_file).exists()
+    assert str(df["id"].dtype) == "Int8"
+    assert str(df["score"].dtype) == "Int8" and df["score"].isna().sum() == 10
+    assert str(df["city"].dtype) == "category"
+    assert df["zip"].iloc[1] == "0001"
+    untyped = pd.read_csv(csv_file)
+    assert df.memory_usage(deep=True).sum() < untyped.memory_usage(deep=True).sum()
+    
+    chunks = list(read_table_chunks(csv_file, 30, schema="auto"))
+    assert all(str(chunk["id"].dtype) == "Int64" for chunk in chunks)
+
+def test_read_table_falls_back_when_file_breaks_schema(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("a\n1\nx\n")
+    
+    df = read_table(csv_file, schema={"columns": {"a": "integer"}})
+    
+    assert df["a"].tolist() == ["1", "x"]
+
+def test_schema_through_validate_and_csv_to_json(csv_file, tmp_path):
+    json_file = tmp_path / "out.json"
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps({"columns": {"score": "integer", "city": "category"}}))
+    
+    typed = validate_csv_data(str(csv_file), schema=str(schema_file))
+    streamed = validate_csv_data(str(csv_file), chunksize=30, schema=str(schema_file))
+    convert_csv_to_json(str(csv_file), str(json_file), schema=str(schema_file))
+    
+    assert typed["missing_values"]["score"] == streamed["missing_values"]["score"] == 10
+    assert typed["duplicates"] == streamed["duplicates"] == 0
+    records = json.loads(json_file.read_text())
+    assert records[0]["score"] is None and records[1]["score"] == 1
+
+def test_infer_schema_cli(csv_file):
+    result = CliRunner().invoke(main, ["infer-schema", str(csv_file)])
+    
+    assert result.exit_code == 0
+    assert "city: category" in result.output
+    assert json.loads(schema_path_for(csv_file).read_text())["columns"]["zip"] == "string"
+
+def test_json_to_excel_auto_schema(tmp_path):
+    from dataops.converters import convert_json_to_excel
+    json_file = tmp_path / "data.json"
+    excel_file = tmp_path / "out.xlsx"
+    json_file.write_text(json.dumps([{"id": i, "kind": "a" if i % 2 else "b", "n": None if i == 3 else i}
+                                     for i in range(10)]))
+    
+    convert_json_to_excel(str(json_file), str(excel_file), schema="auto")
+    
+    df = pd.read_excel(excel_file)
+    assert df["id"].tolist() == list(range(10))
+    assert df["n"].isna().tolist() == [i == 3 for i in range(10)]
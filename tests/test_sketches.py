@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from dataops.validator.sketches import HyperLogLog, RowHashSet, row_hashes
+
+def test_row_hash_set_counts_duplicates_across_spills(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 1, 3, 2, 1], "b": ["x", "y", "x", "x", "z", "x"]})
+    
+    with RowHashSet(memory_limit=1, n_buckets=4, spill_dir=str(tmp_path)) as hash_set:
+        for start in range(0, len(df), 2):
+            hash_set.add(row_hashes(df.iloc[start:start + 2]))
+        assert hash_set.count_duplicates() == df.duplicated().sum()
+    
+    assert list(tmp_path.iterdir()) == []
+
+def test_hyperloglog_estimate_and_merge():
+    rng = np.random.default_rng(0)
+    hashes = rng.integers(0, 2 ** 64 - 1, size=50_000, dtype=np.uint64, endpoint=True)
+    
+    left, right = HyperLogLog(p=12), HyperLogLog(p=12)
+    left.add(hashes[:30_000])
+    right.add(hashes[20_000:])
+    left.merge(right)
+    
+    assert abs(left.estimate() - 50_000) / 50_000 < 0.05
+    assert HyperLogLog(p=12).estimate() == 0
@@ -0,0 +1,43 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow")
+
+SCRIPT = """
+import sys
+from dataops.cli import main
+try:
+    main(sys.argv[1:])
+except SystemExit:
+    pass
+print("loaded:" + ",".join(m for m in {heavy!r} if m in sys.modules))
+"""
+
+def _loaded_modules(cwd, *args):
+    script = SCRIPT.format(heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, "-c", script, *args], cwd=cwd, capture_output=True, text=True,
+                            check=True)
+    return result.stdout.splitlines()[-1].split("loaded:", 1)[1]
+
+def test_cli_help_does_not_import_heavy_modules(tmp_path):
+    assert _loaded_modules(tmp_path, "--help") == ""
+    assert _loaded_modules(tmp_path, "merge", "--help") == ""
+    assert not (tmp_path / "logs").exists()
+
+def test_registry_dispatches_by_extension(tmp_path, monkeypatch):
+    import pandas as pd
+    from dataops.utils import file_io
+    from dataops.utils.file_io import TableFormat, get_format, read_table, register_format, save_table
+    
+    monkeypatch.setattr(file_io, "_FORMATS", dict(file_io._FORMATS))
+    register_format([".tsv"], TableFormat(
+        "tsv",
+        read=lambda path, columns=None, filters=None, dtype=None: pd.read_csv(path, sep="\t", usecols=columns),
+        write=lambda df, path: df.to_csv(path, sep="\t", index=False)))
+    tsv_file = tmp_path / "data.tsv"
+    
+    save_table(pd.DataFrame({"a": [1], "b": [2]}), tsv_file)
+    
+    assert tsv_file.read_text() == "a\tb\n1\t2\n"
+    assert read_table(tsv_file, columns=["b"]).to_dict(orient="list") == {"b": [2]}
+    assert get_format("data.unknown").name == "csv"
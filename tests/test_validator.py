@@ -1,3 +1,4 @@
+import io
 import pytest
 import pandas as pd
 from dataops.validator import validate_csv_data
@@ -19,3 +20,66 @@ def test_validate_csv_data(tmp_path):
     assert report["duplicates"] == 1
     assert report["missing_values"]["b"] == 1
     assert report["missing_values"]["a"] == 0
+    assert report["exact"] is True
+
+@pytest.mark.parametrize("memory_limit", ["256MB", 16])
+def test_validate_csv_data_streaming_matches_in_memory(tmp_path, memory_limit):
+    csv_file = tmp_path / "test.csv"
+    
+    rows = [{"a": i % 7, "b": None if i % 5 == 0 else f"v{i % 3}"} for i in range(100)]
+    pd.DataFrame(rows).to_csv(csv_file, index=False)
+    
+    expected = validate_csv_data(str(csv_file))
+    report = validate_csv_data(str(csv_file), chunksize=9, memory_limit=memory_limit)
+    
+    assert report == {key: (int(v) if key == "duplicates" else v) for key, v in expected.items()}
+
+def test_validate_csv_data_approximate_duplicates(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    
+    pd.DataFrame({"a": [i % 5000 for i in range(20000)]}).to_csv(csv_file, index=False)
+    
+    report = validate_csv_data(str(csv_file), duplicates="approx", error_rate=0.01)
+    
+    assert report["exact"] is False
+    assert report["total_rows"] == 20000
+    assert abs(report["duplicates"] - 15000) < 5000 * 0.05
+
+def test_split_csv_ranges_respects_quoted_newlines(tmp_path):
+    from dataops.validator.parallel import split_csv_ranges
+    csv_file = tmp_path / "test.csv"
+    
+    df = pd.DataFrame({"a": range(200), "b": [f'line "{i}"\nnext,{i}' if i % 3 == 0 else "x" for i in range(200)]})
+    df.to_csv(csv_file, index=False)
+    
+    header_end, ranges = split_csv_ranges(str(csv_file), 7, block_size=64)
+    
+    assert len(ranges) == 7
+    assert ranges[0][0] == header_end and ranges[-1][1] == csv_file.stat().st_size
+    data = csv_file.read_bytes()
+    parts = [pd.read_csv(io.BytesIO(data[:header_end] + data[start:end])) for start, end in ranges]
+    pd.testing.assert_frame_equal(pd.concat(parts, ignore_index=True), df)
+
+@pytest.mark.parametrize("duplicates", ["exact", "approx"])
+def test_validate_csv_data_parallel_matches_serial(tmp_path, duplicates):
+    csv_file = tmp_path / "test.csv"
+    
+    rows = [{"a": i % 50, "b": None if i % 7 == 0 else f'v "{i % 4}"\n,'} for i in range(1000)]
+    pd.DataFrame(rows).to_csv(csv_file, index=False)
+    
+    serial = validate_csv_data(str(csv_file), chunksize=100, duplicates=duplicates)
+    parallel = validate_csv_data(str(csv_file), chunksize=100, duplicates=duplicates, workers=3)
+    
+    assert parallel == serial
+
+def test_validate_csv_data_columns_and_filters(tmp_path):
+    csv_file = tmp_path / "test.csv"
+    pd.DataFrame({"id": [1, 2, 3, 4], "age": [20, 40, 40, 50], "note": [None, "x", "x", "y"]}).to_csv(csv_file, index=False)
+    
+    report = validate_csv_data(str(csv_file), columns=["age", "note"], filters=[("age", "<", 45)])
+    streamed = validate_csv_data(str(csv_file), chunksize=2, columns=["age", "note"], filters=[("age", "<", 45)])
+    
+    assert report["columns"] == ["age", "note"]
+    assert (report["total_rows"], report["duplicates"]) == (3, 1)
+    assert report["missing_values"] == {"age": 0, "note": 1}
+    assert (streamed["total_rows"], streamed["duplicates"], streamed["missing_values"]) == (3, 1, {"age": 0, "note": 1})